@@ -0,0 +1,157 @@
+# benchmarks/bench_cleaner.py
+#
+# Tiered cleaner (lxml fast tier, readability fallback) vs. the
+# readability-only cleaner: latency and output agreement.
+#
+# Usage:
+#   python -m benchmarks.bench_cleaner                 # fixed synthetic corpus
+#   python -m benchmarks.bench_cleaner ./evidence_data # real evidence blobs
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+
+from benchmarks.bench_compression import WORDS, evidence_corpus, synthetic_corpus
+from retrieval.html_cleaner import (
+    TIER_FAST,
+    TIER_READABILITY,
+    extract_main_content_tiered,
+    readability_text,
+)
+
+
+def div_corpus(pages: int = 100, seed: int = 13) -> list:
+    """
+    Pages without <article>/<main> hints, with link-heavy
+    sidebars, so the fast tier has to rely on text density.
+    """
+
+    rng = random.Random(seed)
+    corpus = []
+
+    for i in range(pages):
+        sidebar = "".join(
+            f"<p><a href='/t/{j}'>{rng.choice(WORDS)} {rng.choice(WORDS)}</a></p>"
+            for j in range(rng.randint(10, 30))
+        )
+        body = "".join(
+            "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randint(30, 90))) + "</p>"
+            for _ in range(rng.randint(5, 25))
+        )
+        page = (
+            f"<html><head><title>Post {i}</title></head><body>"
+            f"<div id='side'>{sidebar}</div>"
+            f"<div id='content'><h1>Post {i}</h1>{body}</div>"
+            "<div class='cookie'>We use cookies</div></body></html>"
+        )
+        corpus.append(page.encode("utf-8"))
+
+    return corpus
+
+
+def fallback_corpus(pages: int = 20, seed: int = 17) -> list:
+    """
+    Real articles the fast tier misses, so readability has to
+    produce the text: pages wrapped in a <form> (ASP.NET style,
+    dropped as boilerplate) and pages whose paragraphs each sit
+    in their own <div> (no single dense container).
+    """
+
+    rng = random.Random(seed)
+    corpus = []
+
+    def paragraph(words):
+        return " ".join(rng.choice(WORDS) for _ in range(words))
+
+    for i in range(pages):
+        if i % 2:
+            body = "".join(f"<p>{paragraph(60)}</p>" for _ in range(rng.randint(4, 10)))
+            page = (
+                f"<html><head><title>Page {i}</title></head><body>"
+                f"<form id='aspnetForm' method='post'><div id='content'>"
+                f"<h1>Page {i}</h1>{body}</div></form></body></html>"
+            )
+        else:
+            rows = "".join(
+                f"<div class='row'><p>{paragraph(15)}</p></div>"
+                for _ in range(rng.randint(10, 20))
+            )
+            page = f"<html><body><div id='wrap'>{rows}</div></body></html>"
+        corpus.append(page.encode("utf-8"))
+
+    return corpus
+
+
+def agreement(a: str, b: str, n: int = 8) -> float:
+    """
+    Jaccard similarity of character n-grams, ignoring whitespace:
+    readability glues adjacent blocks ("Title" + "Body" -> "TitleBody"),
+    which would otherwise count as disagreement.
+    """
+    a, b = "".join(a.lower().split()), "".join(b.lower().split())
+    ga = {a[i:i + n] for i in range(max(1, len(a) - n + 1))} if a else set()
+    gb = {b[i:i + n] for i in range(max(1, len(b) - n + 1))} if b else set()
+    if not ga and not gb:
+        return 1.0
+    return len(ga & gb) / len(ga | gb)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Tiered vs. readability-only HTML cleaning"
+    )
+    parser.add_argument("base_path", nargs="?", help="Evidence directory (optional)")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.base_path:
+        corpus = evidence_corpus(args.base_path)
+    else:
+        corpus = synthetic_corpus(100) + div_corpus() + fallback_corpus()
+
+    decoded = [str(body, "utf-8", errors="ignore") for body in corpus]
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        baseline = [readability_text(page) for page in decoded]
+    baseline_s = (time.perf_counter() - start) / args.rounds
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        tiered = [extract_main_content_tiered(body) for body in corpus]
+    tiered_s = (time.perf_counter() - start) / args.rounds
+
+    tiers = Counter(tier for _, tier in tiered)
+    scores = sorted(
+        agreement(old, new)
+        for old, (new, _) in zip(baseline, tiered)
+        if old
+    )
+    recovered = sum(
+        1 for old, (new, _) in zip(baseline, tiered) if new and not old
+    )
+
+    print(f"Corpus: {len(corpus)} pages")
+    print(f"readability-only: {baseline_s * 1000 / len(corpus):8.2f} ms/page")
+    print(f"tiered:           {tiered_s * 1000 / len(corpus):8.2f} ms/page"
+          f"  ({baseline_s / tiered_s:.1f}x)")
+    print("Tiers used:", dict(tiers))
+    print(
+        f"Agreement (8-gram Jaccard): mean {sum(scores) / len(scores):.3f}, "
+        f"p10 {scores[len(scores) // 10]:.3f}, min {scores[0]:.3f}"
+    )
+    print("Pages where only the tiered cleaner found text:", recovered)
+
+    # a comparison that never hits one tier measures only the other
+    missing = [tier for tier in (TIER_FAST, TIER_READABILITY) if not tiers[tier]]
+    if missing:
+        print(f"WARNING: no pages used tier(s): {', '.join(missing)}", file=sys.stderr)
+        if not args.base_path:
+            # the synthetic corpus is built to cover both
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/bench_compression.py
+#
+# Throughput vs. disk-space trade-off of the at-rest blob codecs.
+#
+# Usage:
+#   python -m benchmarks.bench_compression                 # synthetic HTML corpus
+#   python -m benchmarks.bench_compression ./evidence_data # real evidence blobs
+
+import argparse
+import random
+import time
+
+from evidence.blobs import open_blob_backend
+from evidence.codecs import LzmaCodec, ZlibCodec, decode_blob, encode_blob
+from evidence.metadata import open_metadata_backend
+
+
+WORDS = (
+    "battery solid state electrolyte lithium anode cathode research "
+    "energy density cycle life prototype vehicle charging safety cost "
+    "manufacturing university laboratory announced results performance"
+).split()
+
+
+def synthetic_corpus(pages: int = 200, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    corpus = []
+
+    for i in range(pages):
+        paragraphs = "".join(
+            "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))) + "</p>\n"
+            for _ in range(rng.randint(10, 40))
+        )
+        page = (
+            "<!DOCTYPE html><html><head><title>Article %d</title>"
+            "<script>window.dataLayer=window.dataLayer||[];</script>"
+            "<style>body{font-family:sans-serif}.nav a{color:#333}</style></head>"
+            "<body><nav class='nav'><a href='/'>Home</a><a href='/news'>News</a></nav>"
+            "<article>%s</article><footer>&copy; Example Media</footer></body></html>"
+        ) % (i, paragraphs)
+        corpus.append(page.encode("utf-8"))
+
+    return corpus
+
+
+def evidence_corpus(base_path: str) -> list:
+    blobs = open_blob_backend(base_path)
+    metadata = open_metadata_backend(base_path)
+    return [
+        bytes(decode_blob(blobs.get(evidence_id)))
+        for evidence_id in sorted(metadata.evidence_ids())
+    ]
+
+
+def bench(codec, corpus: list, rounds: int) -> dict:
+    raw_bytes = sum(len(body) for body in corpus)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        stored = [encode_blob(body, codec) for body in corpus]
+    encode_s = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        decoded = [decode_blob(blob) for blob in stored]
+    decode_s = (time.perf_counter() - start) / rounds
+
+    assert [bytes(d) for d in decoded] == corpus
+
+    stored_bytes = sum(len(blob) for blob in stored)
+    mb = raw_bytes / (1024 * 1024)
+
+    return {
+        "stored_mb": stored_bytes / (1024 * 1024),
+        "ratio": raw_bytes / stored_bytes,
+        "encode_mb_s": mb / encode_s if encode_s else float("inf"),
+        "decode_mb_s": mb / decode_s if decode_s else float("inf"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Blob codec throughput vs. disk space"
+    )
+    parser.add_argument("base_path", nargs="?", help="Evidence directory (optional)")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = evidence_corpus(args.base_path) if args.base_path else synthetic_corpus()
+    raw_mb = sum(len(body) for body in corpus) / (1024 * 1024)
+
+    print(f"Corpus: {len(corpus)} blobs, {raw_mb:.2f} MB raw")
+    print(f"{'codec':<10}{'stored MB':>11}{'ratio':>8}{'enc MB/s':>11}{'dec MB/s':>11}")
+
+    for codec in (ZlibCodec(1), ZlibCodec(6), ZlibCodec(9), LzmaCodec(1), LzmaCodec(6)):
+        level = getattr(codec, "level", getattr(codec, "preset", ""))
+        r = bench(codec, corpus, args.rounds)
+        print(
+            f"{codec.name + '-' + str(level):<10}{r['stored_mb']:>11.2f}{r['ratio']:>8.2f}"
+            f"{r['encode_mb_s']:>11.1f}{r['decode_mb_s']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
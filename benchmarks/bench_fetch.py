@@ -0,0 +1,142 @@
+# benchmarks/bench_fetch.py
+#
+# Pages/second: sequential fetch_page vs. AsyncFetcher.fetch_many,
+# against a local asyncio HTTP/1.1 stand-in server that adds a fixed
+# per-response latency. Each port counts as a separate host.
+#
+# Usage:
+#   python -m benchmarks.bench_fetch [--pages 60] [--hosts 4] [--latency-ms 50]
+
+import argparse
+import asyncio
+import random
+import threading
+import time
+
+from benchmarks.bench_compression import WORDS
+from orchestrator.failure_event import FailureEvent
+from tools.crawl.async_fetch import AsyncFetcher
+from tools.crawl.fetch_page import fetch_page
+from tools.crawl.robots import RobotsPolicy
+from tools.http.client import HttpClient
+from tools.http.pool import PoolConfig
+from tools.http.timeouts import TimeoutConfig
+
+
+def page(path: str) -> bytes:
+    rng = random.Random(path)
+    paragraphs = "".join(
+        "<p>" + " ".join(rng.choice(WORDS) for _ in range(60)) + "</p>"
+        for _ in range(8)
+    )
+    return f"<html><body><article>{paragraphs}</article></body></html>".encode("utf-8")
+
+
+class StandInServer:
+    """
+    Minimal keep-alive HTTP/1.1 server on its own loop and thread.
+    """
+
+    def __init__(self, hosts: int, latency: float):
+        self.latency = latency
+        self.hosts = hosts
+        self.ports = []
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        threading.Thread(target=self._run, daemon=True).start()
+        self._ready.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        for _ in range(self.hosts):
+            server = self.loop.run_until_complete(
+                asyncio.start_server(self._handle, "127.0.0.1", 0)
+            )
+            self.ports.append(server.sockets[0].getsockname()[1])
+        self._ready.set()
+        self.loop.run_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                path = request.split(b" ", 2)[1].decode()
+
+                await asyncio.sleep(self.latency)
+
+                if path == "/robots.txt":
+                    body, content_type = b"User-agent: *\nAllow: /\n", "text/plain"
+                else:
+                    body, content_type = page(path), "text/html"
+
+                writer.write(
+                    f"HTTP/1.1 200 OK\r\nContent-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+
+                if b"connection: close" in request.lower():
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def run(label: str, urls: list, fetch_all) -> float:
+    start = time.perf_counter()
+    results = fetch_all(urls)
+    elapsed = time.perf_counter() - start
+
+    failed = sum(isinstance(r, FailureEvent) for r in results)
+    rate = len(urls) / elapsed
+    print(f"{label:<40}{rate:>10.1f}{elapsed:>10.2f}{failed:>8}")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Sequential vs. asyncio page fetching throughput"
+    )
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--hosts", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--per-host", type=int, default=2)
+    args = parser.parse_args()
+
+    server = StandInServer(args.hosts, args.latency_ms / 1000)
+    urls = [
+        f"http://127.0.0.1:{server.ports[i % args.hosts]}/page/{i}"
+        for i in range(args.pages)
+    ]
+
+    print(f"Pages: {len(urls)} over {args.hosts} hosts, "
+          f"{args.latency_ms:.0f} ms server latency")
+    print(f"{'path':<40}{'pages/s':>10}{'seconds':>10}{'failed':>8}")
+
+    def sequential(pool):
+        http = HttpClient(TimeoutConfig(), pool=pool)
+        robots = RobotsPolicy(http)
+        return lambda urls: [fetch_page(url, http, robots) for url in urls]
+
+    def concurrent(pool):
+        http = HttpClient(TimeoutConfig(), pool=pool)
+        fetcher = AsyncFetcher(
+            http, RobotsPolicy(http),
+            max_concurrency=args.concurrency, max_per_host=args.per_host,
+        )
+        return lambda urls: asyncio.run(fetcher.fetch_many(urls))
+
+    base = run("sequential fetch_page", urls, sequential(None))
+    run("sequential fetch_page, pooled", urls, sequential(PoolConfig()))
+    rate = run(
+        f"fetch_many ({args.concurrency} global, {args.per_host}/host), pooled",
+        urls, concurrent(PoolConfig(pool_maxsize=args.per_host)),
+    )
+
+    print(f"\nSpeed-up: {rate / base:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/bench_import.py
+#
+# Cold-start guard: import cost of the CLI entry points, measured with
+# `python -X importtime` in fresh interpreters without GROQ_API_KEY.
+# Fails if an entry point loads a heavy dependency it shouldn't, or if
+# importing main.py exceeds its budget.
+#
+# Usage:
+#   python -m benchmarks.bench_import [--runs 5] [--budget-ms 60]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+HEAVY = ("groq", "dotenv", "duckduckgo_search", "readability", "lxml", "requests", "numpy")
+
+# entry point -> heavy modules it may load at import time
+TARGETS = {
+    "main": (),
+    "llm.groq_client": (),
+    "evidence.migrate_blobs": (),
+    "evidence.migrate_catalog": (),
+    "retrieval.retriever": (),
+    "orchestrator.reevaluate": ("numpy",),  # the integrity evaluator's fast path
+}
+
+# runs in the child: report what the import left loaded
+PROBE = "import sys, {module}; print(' '.join(sys.modules))"
+
+
+def importtime(module: str) -> tuple:
+    """
+    (cumulative microseconds for `module`, set of loaded modules).
+    """
+
+    env = dict(os.environ)
+    env.pop("GROQ_API_KEY", None)
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(module=module)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+    cumulative = 0
+    for line in proc.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented name>"
+        if not line.startswith("import time:"):
+            continue
+        _, cum, name = line[len("import time:"):].split("|")
+        if name.strip() == module and cum.strip().isdigit():
+            cumulative = int(cum)
+
+    return cumulative, set(proc.stdout.split())
+
+
+def help_ms(runs: int) -> float:
+    env = dict(os.environ)
+    env.pop("GROQ_API_KEY", None)
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "main.py", "--help"],
+            capture_output=True, env=env, check=True,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import-time budget for the CLI entry points"
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=60.0,
+                        help="Max median import time of main.py")
+    args = parser.parse_args()
+
+    failures = []
+
+    print(f"{'module':<28}{'import ms':>10}  heavy deps loaded")
+    for module, allowed in TARGETS.items():
+        samples, loaded = [], set()
+        for _ in range(args.runs):
+            cumulative, loaded = importtime(module)
+            samples.append(cumulative / 1000)
+
+        median = statistics.median(samples)
+        heavy = sorted(dep for dep in HEAVY if dep in loaded)
+        print(f"{module:<28}{median:>10.1f}  {', '.join(heavy) or '-'}")
+
+        unexpected = [dep for dep in heavy if dep not in allowed]
+        if unexpected:
+            failures.append(f"{module} imports {', '.join(unexpected)}")
+        if module == "main" and median > args.budget_ms:
+            failures.append(f"main takes {median:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    print(f"\n`main.py --help` wall time: {help_ms(args.runs):.0f} ms (median)")
+
+    if failures:
+        raise SystemExit("Cold-start budget exceeded:\n  " + "\n  ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
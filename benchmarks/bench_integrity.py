@@ -0,0 +1,117 @@
+# benchmarks/bench_integrity.py
+#
+# Single-pass IntegrityEvaluator vs. the original three-pass integrity_v1.
+# Also checks that every score and metric is bit-identical.
+#
+# Usage:
+#   python -m benchmarks.bench_integrity [--mb 4] [--rounds 5]
+
+import argparse
+import math
+import os
+import random
+import time
+from collections import Counter
+
+from validators import integrity
+from validators.integrity import IntegrityEvaluator, IntegrityResult
+
+
+def reference_v1(raw: bytes) -> IntegrityResult:
+    """
+    integrity_v1 as originally written: Counter twice plus a set.
+    """
+
+    flags = []
+    metrics = {"byte_length": len(raw)}
+
+    if not raw:
+        return IntegrityEvaluator._fail("empty_content", metrics)
+
+    counts = Counter(raw)
+    entropy = 0.0
+    for count in counts.values():
+        p = count / len(raw)
+        entropy -= p * math.log2(p)
+    metrics["entropy"] = entropy
+
+    if entropy < IntegrityEvaluator.ENTROPY_RANGE[0]:
+        flags.append("low_entropy_template_like")
+    if entropy > IntegrityEvaluator.ENTROPY_RANGE[1]:
+        flags.append("high_entropy_noise_like")
+
+    repetition_ratio = Counter(raw).most_common(1)[0][1] / len(raw)
+    metrics["repetition_ratio"] = repetition_ratio
+    if repetition_ratio > IntegrityEvaluator.MAX_REPETITION_RATIO:
+        flags.append("excessive_repetition")
+
+    unique_ratio = len(set(raw)) / len(raw)
+    metrics["unique_byte_ratio"] = unique_ratio
+    if unique_ratio < IntegrityEvaluator.MIN_UNIQUE_RATIO:
+        flags.append("low_unique_content")
+
+    score = IntegrityEvaluator._compose_score(entropy, repetition_ratio, unique_ratio)
+
+    return IntegrityResult(
+        integrity_score=score,
+        usable_for_reasoning=score >= IntegrityEvaluator.MIN_SCORE and not flags,
+        flags=flags,
+        metrics=metrics,
+    )
+
+
+def corpus(mb: float, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    size = int(mb * 1024 * 1024)
+
+    words = [bytes(rng.choice(b"abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 9)))
+             for _ in range(500)]
+    html = b" ".join(rng.choice(words) for _ in range(size // 5))[:size]
+
+    return [
+        ("html-like", html),
+        ("random", os.urandom(size)),
+        ("repetitive", b"<div></div>" * (size // 11)),
+        ("late-byte", b"a" * (size - 1) + b"\xff"),
+        ("tiny", b"<html>ok</html>"),
+    ]
+
+
+def timed(fn, data: bytes, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(data)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="IntegrityEvaluator single-pass micro-benchmark"
+    )
+    parser.add_argument("--mb", type=float, default=4.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    backend = "numpy" if integrity.np is not None else "pure-python"
+    print(f"Histogram backend: {backend}")
+    print(f"{'input':<12}{'v1 ms':>10}{'new ms':>10}{'speedup':>9}  identical")
+
+    for name, data in corpus(args.mb):
+        old = reference_v1(data)
+        new = IntegrityEvaluator.evaluate(data)
+        identical = old.to_dict() == new.to_dict()
+
+        old_s = timed(reference_v1, data, args.rounds)
+        new_s = timed(IntegrityEvaluator.evaluate, data, args.rounds)
+
+        print(
+            f"{name:<12}{old_s * 1000:>10.2f}{new_s * 1000:>10.2f}"
+            f"{old_s / new_s:>8.1f}x  {identical}"
+        )
+
+        if not identical:
+            raise SystemExit(f"integrity_v1 mismatch on {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/bench_scoring.py
+#
+# Scan-path scorers on a large synthetic chunk set:
+# set-overlap (lexical_overlap_score) vs. the vectorized SparseBM25.
+#
+# Usage:
+#   python -m benchmarks.bench_scoring [--chunks 100000] [--queries 50]
+
+import argparse
+import heapq
+import time
+
+import numpy as np
+
+from retrieval.chunker import ChunkSpan
+from retrieval.retriever import chunk_token_set, lexical_overlap_score, tokenize
+from retrieval.sparse_scorer import SparseBM25
+
+
+def synthetic_chunks(n: int, vocab: int = 50_000, tokens: int = 150, seed: int = 5) -> list:
+    """
+    Zipf-distributed words, roughly the shape of real text.
+    """
+
+    rng = np.random.default_rng(seed)
+    words = np.array([f"w{i}" for i in range(vocab)])
+    ids = np.minimum(rng.zipf(1.2, size=(n, tokens)) - 1, vocab - 1)
+    return [" ".join(words[row]) for row in ids]
+
+
+def overlap_top_k(query: str, chunks: list, k: int = 5) -> list:
+    # same ranking as the retriever's overlap scan, token sets warm
+    q_tokens = frozenset(tokenize(query))
+    heap = []
+    for seq, (cid, span) in enumerate(chunks):
+        score = len(q_tokens & chunk_token_set(cid, span)) / len(q_tokens)
+        if score > 0:
+            entry = (score, -seq, cid)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+    return sorted(heap, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Overlap vs. sparse BM25 scoring throughput"
+    )
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    texts = synthetic_chunks(args.chunks)
+    chunks = [
+        (f"bench:{i:016x}", ChunkSpan("bench", text, 0, len(text)))
+        for i, text in enumerate(texts)
+    ]
+
+    rng = np.random.default_rng(9)
+    queries = [
+        " ".join(f"w{w}" for w in rng.integers(0, 2_000, size=rng.integers(2, 6)))
+        for _ in range(args.queries)
+    ]
+
+    print(f"Chunks: {len(chunks)}, queries: {len(queries)}")
+
+    # ---- original scorer: two calls per chunk + full sort ----
+    start = time.perf_counter()
+    for query in queries[:3]:
+        scored = [text for text in texts if lexical_overlap_score(query, text) > 0]
+        scored.sort(key=lambda t: lexical_overlap_score(query, t), reverse=True)
+    original_ms = (time.perf_counter() - start) * 1000 / 3
+
+    # ---- heap + cached token sets ----
+    start = time.perf_counter()
+    overlap_top_k(queries[0], chunks)
+    warm_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for query in queries:
+        overlap_top_k(query, chunks)
+    overlap_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    # ---- sparse BM25 ----
+    sparse = SparseBM25()
+    start = time.perf_counter()
+    for cid, span in chunks:
+        sparse.add_chunk(cid, "bench", "", span.buffer)
+    sparse.search(queries[0], 5)  # compaction + tf weights
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for query in queries:
+        sparse.search(query, 5)
+    bm25_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    # ---- incremental add: 1% more chunks, then the next search ----
+    extra = synthetic_chunks(max(1, args.chunks // 100), seed=6)
+    start = time.perf_counter()
+    for i, text in enumerate(extra):
+        sparse.add_chunk(f"extra:{i:016x}", "bench", "", text)
+    sparse.search(queries[0], 5)
+    incremental_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{'scorer':<32}{'ms/query':>10}")
+    print(f"{'overlap (original, 2x + sort)':<32}{original_ms:>10.1f}")
+    print(f"{'overlap (heap, token sets warm)':<32}{overlap_ms:>10.1f}")
+    print(f"{'sparse BM25':<32}{bm25_ms:>10.1f}")
+    print()
+    print(f"Token-set cache warm-up: {warm_ms:.0f} ms")
+    print(f"SparseBM25 build:        {build_ms:.0f} ms")
+    print(f"Incremental add of {len(extra)} chunks + first search: {incremental_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
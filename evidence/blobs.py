@@ -0,0 +1,139 @@
+# evidence/blobs.py
+
+import os
+import tempfile
+from typing import Tuple
+
+from evidence.segments import open_segment_log
+
+
+BLOB_BACKENDS = ("files", "segments")
+
+
+class FileBlobBackend:
+    """
+    One file per SHA-256 digest in a flat directory.
+    Atomic temp-file + rename, write-once.
+
+    Deferred mode (group commit) leaves blobs in their temp
+    files until sync(), which fsyncs and renames the batch.
+    """
+
+    def __init__(self, blob_path: str):
+        self.blob_path = blob_path
+        self.deferred = False
+        self._staged = {}  # digest -> temp file awaiting sync()
+
+        os.makedirs(blob_path, exist_ok=True)
+
+    def exists(self, digest: str) -> bool:
+        return digest in self._staged or os.path.exists(
+            os.path.join(self.blob_path, digest)
+        )
+
+    def put(self, digest: str, body: bytes) -> None:
+        if self.exists(digest):
+            return
+
+        with tempfile.NamedTemporaryFile(
+            dir=self.blob_path, delete=False
+        ) as tmp:
+            tmp.write(body)
+            tmp.flush()
+            if not self.deferred:
+                os.fsync(tmp.fileno())
+            tmp_name = tmp.name
+
+        if self.deferred:
+            self._staged[digest] = tmp_name
+            return
+
+        os.rename(tmp_name, os.path.join(self.blob_path, digest))
+
+    def put_file(self, digest: str, path: str) -> None:
+        """
+        Adopt a finished file (in blob_path) as a blob by renaming it.
+        """
+
+        if self.exists(digest):
+            os.remove(path)
+            return
+
+        if self.deferred:
+            self._staged[digest] = path
+            return
+
+        fsync_path(path)
+        os.rename(path, os.path.join(self.blob_path, digest))
+
+    def get(self, digest: str) -> bytes:
+        staged = self._staged.get(digest)
+        if staged is not None:
+            try:
+                with open(staged, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                pass  # renamed by a concurrent sync()
+
+        with open(os.path.join(self.blob_path, digest), "rb") as f:
+            return f.read()
+
+    def locate(self, digest: str) -> Tuple[str, int, int]:
+        """
+        (file, offset, length) of a stored blob, for readers
+        in other processes that map the file themselves.
+        """
+        path = self._staged.get(digest) or os.path.join(self.blob_path, digest)
+        return path, 0, os.path.getsize(path)
+
+    def sync(self) -> None:
+        """
+        Make every staged blob durable under its final name.
+        """
+
+        if not self._staged:
+            return
+
+        for digest, tmp_name in list(self._staged.items()):
+            fsync_path(tmp_name)
+            os.rename(tmp_name, os.path.join(self.blob_path, digest))
+            del self._staged[digest]
+
+        fsync_path(self.blob_path)
+
+
+def fsync_path(path: str) -> None:
+    """
+    fsync a file or directory by path.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def segments_path(base_path: str) -> str:
+    return os.path.join(base_path, "segments")
+
+
+def open_blob_backend(base_path: str, backend: str = None):
+    """
+    Blob backend for an evidence directory.
+    With no explicit backend, a migrated store (segments/) wins.
+    """
+
+    if backend is None:
+        backend = (
+            "segments" if os.path.isdir(segments_path(base_path)) else "files"
+        )
+
+    if backend == "segments":
+        return open_segment_log(segments_path(base_path))
+
+    if backend == "files":
+        return FileBlobBackend(os.path.join(base_path, "blobs"))
+
+    raise ValueError(
+        f"Unknown blob backend: {backend} (expected one of {BLOB_BACKENDS})"
+    )
@@ -0,0 +1,343 @@
+# evidence/catalog.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from evidence.lifecycle import EvidenceState
+
+
+CATALOG_FILENAME = "catalog.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS evidence (
+    evidence_id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER,
+    headers TEXT NOT NULL,
+    body_sha256 TEXT NOT NULL,
+    body_size INTEGER NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evidence_by_url ON evidence (url, stored_at);
+
+CREATE TABLE IF NOT EXISTS states (
+    evidence_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS states_by_state ON states (state, updated_at);
+
+CREATE TABLE IF NOT EXISTS envelopes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    evidence_id TEXT NOT NULL,
+    validator_version TEXT NOT NULL,
+    decision TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    envelope TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS envelopes_by_evidence ON envelopes (evidence_id, seq);
+CREATE INDEX IF NOT EXISTS envelopes_by_validator
+    ON envelopes (validator_version, decision);
+"""
+
+
+def _state_value(state) -> str:
+    return getattr(state, "value", state)
+
+
+def catalog_path(base_path: str) -> str:
+    return os.path.join(base_path, CATALOG_FILENAME)
+
+
+class EvidenceCatalog:
+    """
+    Transactional metadata catalog (SQLite, WAL mode).
+
+    Holds base metadata, lifecycle state and the envelope
+    history in one file, indexed by state, URL and
+    validator_version. Same interface as FileMetadataBackend.
+
+    Deferred mode (group commit) keeps one transaction open
+    across writes; sync() commits it with a single WAL fsync.
+    """
+
+    def __init__(self, base_path: str):
+        os.makedirs(base_path, exist_ok=True)
+
+        self.path = catalog_path(base_path)
+        self.deferred = False
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    # --------------------------------------------------
+    # Metadata (write-once)
+    # --------------------------------------------------
+
+    def put_metadata(self, evidence_id: str, meta: Dict) -> None:
+        self._write(
+            "INSERT OR IGNORE INTO evidence VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                evidence_id,
+                meta["url"],
+                meta["status"],
+                json.dumps(meta["headers"], sort_keys=True),
+                meta["body_sha256"],
+                meta["body_size"],
+                time.time(),
+            ),
+        )
+
+    def get_metadata(self, evidence_id: str) -> Dict:
+        rows = self._query(
+            "SELECT url, status, headers, body_sha256, body_size "
+            "FROM evidence WHERE evidence_id = ?",
+            (evidence_id,),
+        )
+
+        if not rows:
+            raise KeyError(evidence_id)
+
+        url, status, headers, body_sha256, body_size = rows[0]
+        return {
+            "url": url,
+            "status": status,
+            "headers": json.loads(headers),
+            "body_sha256": body_sha256,
+            "body_size": body_size,
+        }
+
+    # --------------------------------------------------
+    # Envelopes (append-only)
+    # --------------------------------------------------
+
+    def append_envelope(self, evidence_id: str, envelope: Dict) -> None:
+        self._write(
+            "INSERT INTO envelopes "
+            "(evidence_id, validator_version, decision, created_at, envelope) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                evidence_id,
+                envelope["validator_version"],
+                envelope["decision"],
+                envelope["created_at"],
+                json.dumps(envelope, sort_keys=True),
+            ),
+        )
+
+    def envelopes(self, evidence_id: str) -> List[Dict]:
+        rows = self._query(
+            "SELECT envelope FROM envelopes WHERE evidence_id = ? ORDER BY seq",
+            (evidence_id,),
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    # --------------------------------------------------
+    # Lifecycle state
+    # --------------------------------------------------
+
+    def set_state(self, evidence_id: str, state: str) -> None:
+        self._write(
+            "INSERT INTO states VALUES (?, ?, ?) "
+            "ON CONFLICT (evidence_id) DO UPDATE SET "
+            "state = excluded.state, updated_at = excluded.updated_at",
+            (evidence_id, _state_value(state), time.time()),
+        )
+
+    def get_state(self, evidence_id: str) -> Optional[str]:
+        rows = self._query(
+            "SELECT state FROM states WHERE evidence_id = ?",
+            (evidence_id,),
+        )
+        return rows[0][0] if rows else None
+
+    # --------------------------------------------------
+    # Indexed queries
+    # --------------------------------------------------
+
+    def evidence_ids(self) -> List[str]:
+        rows = self._query("SELECT evidence_id FROM evidence")
+        return [row[0] for row in rows]
+
+    def ids_in_state(self, state: str, since: float = None) -> List[str]:
+        if since is None:
+            rows = self._query(
+                "SELECT evidence_id FROM states WHERE state = ? "
+                "ORDER BY updated_at",
+                (_state_value(state),),
+            )
+        else:
+            rows = self._query(
+                "SELECT evidence_id FROM states "
+                "WHERE state = ? AND updated_at >= ? ORDER BY updated_at",
+                (_state_value(state), since),
+            )
+        return [row[0] for row in rows]
+
+    def accepted_since(self, since: float) -> List[str]:
+        return self.ids_in_state(EvidenceState.RAW_ACCEPTED.value, since)
+
+    def quarantined_by(self, validator_version: str) -> List[str]:
+        """
+        Evidence whose QUARANTINE decision came from validator_version.
+        """
+        rows = self._query(
+            "SELECT DISTINCT e.evidence_id FROM envelopes e "
+            "JOIN states s ON s.evidence_id = e.evidence_id "
+            "WHERE e.validator_version = ? AND e.decision = 'QUARANTINE' "
+            "AND s.state != ?",
+            (validator_version, EvidenceState.RAW_ACCEPTED.value),
+        )
+        return [row[0] for row in rows]
+
+    def stale_ids(self, validator_version: str) -> List[str]:
+        """
+        Evidence never judged, or whose latest envelope came
+        from a validator version other than validator_version.
+        """
+        rows = self._query(
+            "SELECT ev.evidence_id FROM evidence ev "
+            "LEFT JOIN envelopes e ON e.seq = ("
+            "SELECT MAX(seq) FROM envelopes WHERE evidence_id = ev.evidence_id) "
+            "WHERE e.seq IS NULL OR e.validator_version != ? "
+            "ORDER BY ev.evidence_id",
+            (validator_version,),
+        )
+        return [row[0] for row in rows]
+
+    def ids_for_url(self, url: str) -> List[str]:
+        """
+        Evidence stored for a URL, newest first.
+        """
+        rows = self._query(
+            "SELECT evidence_id FROM evidence WHERE url = ? "
+            "ORDER BY stored_at DESC",
+            (url,),
+        )
+        return [row[0] for row in rows]
+
+    # --------------------------------------------------
+    # Migration from per-evidence files
+    # --------------------------------------------------
+
+    def import_files(self, meta_path: str) -> int:
+        """
+        Load <id>.json / .state / .envelopes.jsonl into the catalog.
+        One transaction; safe to re-run.
+        """
+
+        imported = 0
+
+        with self._lock, self.conn:
+            for filename in sorted(os.listdir(meta_path)):
+                if not filename.endswith(".json"):
+                    continue
+
+                evidence_id = filename.replace(".json", "")
+                known = self.conn.execute(
+                    "SELECT 1 FROM evidence WHERE evidence_id = ?",
+                    (evidence_id,),
+                ).fetchone()
+                if known:
+                    continue
+
+                base = os.path.join(meta_path, evidence_id)
+                stamp = os.path.getmtime(base + ".json")
+
+                with open(base + ".json", "r") as f:
+                    meta = json.load(f)
+
+                self.conn.execute(
+                    "INSERT INTO evidence VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        evidence_id,
+                        meta["url"],
+                        meta["status"],
+                        json.dumps(meta["headers"], sort_keys=True),
+                        meta["body_sha256"],
+                        meta["body_size"],
+                        stamp,
+                    ),
+                )
+
+                if os.path.exists(base + ".envelopes.jsonl"):
+                    with open(base + ".envelopes.jsonl", "r") as f:
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            envelope = json.loads(line)
+                            self.conn.execute(
+                                "INSERT INTO envelopes "
+                                "(evidence_id, validator_version, decision, "
+                                "created_at, envelope) VALUES (?, ?, ?, ?, ?)",
+                                (
+                                    evidence_id,
+                                    envelope["validator_version"],
+                                    envelope["decision"],
+                                    envelope["created_at"],
+                                    json.dumps(envelope, sort_keys=True),
+                                ),
+                            )
+
+                if os.path.exists(base + ".state"):
+                    with open(base + ".state", "r") as f:
+                        state = f.read().strip()
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO states VALUES (?, ?, ?)",
+                        (evidence_id, state, os.path.getmtime(base + ".state")),
+                    )
+
+                imported += 1
+
+        return imported
+
+    # --------------------------------------------------
+    # Group commit
+    # --------------------------------------------------
+
+    def sync(self) -> None:
+        with self._lock:
+            self.conn.commit()
+
+    def _write(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            if self.deferred:
+                self.conn.execute(sql, params)
+                return
+
+            with self.conn:
+                self.conn.execute(sql, params)
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+_OPEN_CATALOGS: Dict[str, EvidenceCatalog] = {}
+_OPEN_LOCK = threading.Lock()
+
+
+def open_catalog(base_path: str) -> EvidenceCatalog:
+    """
+    Shared catalog connection per evidence directory.
+    """
+
+    key = os.path.abspath(base_path)
+
+    with _OPEN_LOCK:
+        catalog = _OPEN_CATALOGS.get(key)
+        if catalog is None:
+            catalog = EvidenceCatalog(base_path)
+            _OPEN_CATALOGS[key] = catalog
+        return catalog
@@ -0,0 +1,334 @@
+# evidence/codecs.py
+
+import lzma
+import os
+from abc import ABC, abstractmethod
+import shutil
+import tempfile
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+
+
+# ---- blob framing ----
+# compressed blobs: FRAME_MAGIC | codec id (1 byte) | payload
+# raw blobs are stored unframed, unless they happen to start
+# with FRAME_MAGIC, in which case they are framed as identity.
+FRAME_MAGIC = b"\x00PVC"
+FRAME_HEADER_SIZE = len(FRAME_MAGIC) + 1
+
+
+class Codec(ABC):
+    """
+    Pluggable at-rest codec.
+    Subclasses set a unique `codec_id` (0-255) and `name`.
+    """
+
+    codec_id: int = None
+    name: str = None
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        ...
+
+    @abstractmethod
+    def decompress(self, data) -> bytes:
+        ...
+
+    @abstractmethod
+    def compressor(self):
+        """
+        Streaming compressor with compress(chunk) / flush().
+        """
+
+    @abstractmethod
+    def decompressor(self):
+        """
+        Streaming decompressor with decompress(chunk).
+        """
+
+
+class _PassThrough:
+    """
+    Streaming (de)compressor that copies chunks unchanged.
+    """
+
+    def compress(self, chunk) -> bytes:
+        return bytes(chunk)
+
+    def flush(self) -> bytes:
+        return b""
+
+    def decompress(self, chunk) -> bytes:
+        return bytes(chunk)
+
+
+class IdentityCodec(Codec):
+    codec_id = 0
+    name = "identity"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data) -> bytes:
+        return data
+
+    def compressor(self):
+        return _PassThrough()
+
+    def decompressor(self):
+        return _PassThrough()
+
+
+class ZlibCodec(Codec):
+    codec_id = 1
+    name = "zlib"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data) -> bytes:
+        return zlib.decompress(data)
+
+    def compressor(self):
+        return zlib.compressobj(self.level)
+
+    def decompressor(self):
+        return zlib.decompressobj()
+
+
+class LzmaCodec(Codec):
+    codec_id = 2
+    name = "lzma"
+
+    def __init__(self, preset: int = 6):
+        self.preset = preset
+
+    def compress(self, data: bytes) -> bytes:
+        return lzma.compress(data, preset=self.preset)
+
+    def decompress(self, data) -> bytes:
+        return lzma.decompress(data)
+
+    def compressor(self):
+        return lzma.LZMACompressor(preset=self.preset)
+
+    def decompressor(self):
+        return lzma.LZMADecompressor()
+
+
+_CODECS_BY_ID: Dict[int, Codec] = {}
+_CODECS_BY_NAME: Dict[str, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    existing = _CODECS_BY_ID.get(codec.codec_id)
+    if existing is not None and existing.name != codec.name:
+        raise ValueError(
+            f"Codec id {codec.codec_id} already used by {existing.name}"
+        )
+
+    _CODECS_BY_ID[codec.codec_id] = codec
+    _CODECS_BY_NAME[codec.name] = codec
+
+
+def get_codec(name: str) -> Codec:
+    try:
+        return _CODECS_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"Unknown codec: {name}") from None
+
+
+for _codec in (IdentityCodec(), ZlibCodec(), LzmaCodec()):
+    register_codec(_codec)
+
+
+# --------------------------------------------------
+# Encode / decode
+# --------------------------------------------------
+
+def encode_blob(body: bytes, codec: Codec) -> bytes:
+    """
+    Frame a body for storage.
+    Falls back to raw bytes when compression does not pay off.
+    """
+
+    if codec.codec_id != IdentityCodec.codec_id:
+        payload = codec.compress(body)
+        if len(payload) + FRAME_HEADER_SIZE < len(body):
+            return FRAME_MAGIC + bytes([codec.codec_id]) + payload
+
+    if body[:len(FRAME_MAGIC)] == FRAME_MAGIC:
+        return FRAME_MAGIC + bytes([IdentityCodec.codec_id]) + body
+
+    return body
+
+
+def encode_file(src_path: str, codec: Codec) -> str:
+    """
+    Streaming encode_blob for a spooled body.
+    Returns the at-rest file (possibly src_path itself, unchanged);
+    src_path is consumed either way.
+    """
+
+    tmp_dir = os.path.dirname(src_path)
+
+    if codec.codec_id != IdentityCodec.codec_id:
+        compressor = codec.compressor()
+
+        with open(src_path, "rb") as src, tempfile.NamedTemporaryFile(
+            dir=tmp_dir, prefix="spool-", delete=False
+        ) as dst:
+            dst.write(FRAME_MAGIC + bytes([codec.codec_id]))
+            for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                dst.write(compressor.compress(chunk))
+            dst.write(compressor.flush())
+            encoded = dst.name
+
+        if os.path.getsize(encoded) < os.path.getsize(src_path):
+            os.remove(src_path)
+            return encoded
+
+        os.remove(encoded)
+
+    with open(src_path, "rb") as src:
+        if src.read(len(FRAME_MAGIC)) != FRAME_MAGIC:
+            return src_path
+
+        src.seek(0)
+        with tempfile.NamedTemporaryFile(
+            dir=tmp_dir, prefix="spool-", delete=False
+        ) as dst:
+            dst.write(FRAME_MAGIC + bytes([IdentityCodec.codec_id]))
+            shutil.copyfileobj(src, dst)
+            framed = dst.name
+
+    os.remove(src_path)
+    return framed
+
+
+def decode_blob(stored):
+    """
+    Inverse of encode_blob.
+    Unframed blobs are returned as-is (no copy).
+    """
+
+    if stored[:len(FRAME_MAGIC)] != FRAME_MAGIC:
+        return stored
+
+    codec_id = stored[len(FRAME_MAGIC)]
+    codec = _CODECS_BY_ID.get(codec_id)
+    if codec is None:
+        raise ValueError(f"Blob written with unknown codec id {codec_id}")
+
+    return codec.decompress(memoryview(stored)[FRAME_HEADER_SIZE:])
+
+
+def iter_decoded(stored, chunk_size: int = 1024 * 1024) -> Iterator:
+    """
+    decode_blob in chunks, so a large stored blob (e.g. an mmap
+    view) is never decompressed whole. Raw chunks are zero-copy.
+    """
+
+    view = memoryview(stored)
+    codec = None
+
+    if stored[:len(FRAME_MAGIC)] == FRAME_MAGIC:
+        codec_id = stored[len(FRAME_MAGIC)]
+        codec = _CODECS_BY_ID.get(codec_id)
+        if codec is None:
+            raise ValueError(f"Blob written with unknown codec id {codec_id}")
+        view = view[FRAME_HEADER_SIZE:]
+
+    if codec is None or codec.codec_id == IdentityCodec.codec_id:
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+        return
+
+    decompressor = codec.decompressor()
+    for start in range(0, len(view), chunk_size):
+        chunk = decompressor.decompress(view[start:start + chunk_size])
+        if chunk:
+            yield chunk
+
+
+def blob_codec_name(stored) -> str:
+    if stored[:len(FRAME_MAGIC)] != FRAME_MAGIC:
+        return IdentityCodec.name
+    return _CODECS_BY_ID[stored[len(FRAME_MAGIC)]].name
+
+
+# --------------------------------------------------
+# Codec choice
+# --------------------------------------------------
+
+# Content types already compressed on the wire format level.
+INCOMPRESSIBLE_PREFIXES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/octet-stream",
+)
+
+
+class CompressionPolicy:
+    """
+    Chooses a codec per blob from its content type and size.
+
+    - Small bodies are stored raw (framing overhead wins)
+    - Known-incompressible types are stored raw
+    - `by_content_type` maps type prefixes to codec names;
+      the longest matching prefix wins
+    """
+
+    def __init__(
+        self,
+        default_codec: str = "zlib",
+        min_size: int = 1024,
+        by_content_type: Optional[Dict[str, str]] = None,
+    ):
+        self.default_codec = get_codec(default_codec)
+        self.min_size = min_size
+        self.by_content_type = {
+            prefix: get_codec(name)
+            for prefix, name in (by_content_type or {}).items()
+        }
+
+    def choose(self, content_type: str, size: int) -> Codec:
+        if size < self.min_size:
+            return _CODECS_BY_NAME["identity"]
+
+        content_type = (content_type or "").split(";")[0].strip().lower()
+
+        matches = [
+            prefix for prefix in self.by_content_type
+            if content_type.startswith(prefix)
+        ]
+        if matches:
+            return self.by_content_type[max(matches, key=len)]
+
+        if content_type.startswith(INCOMPRESSIBLE_PREFIXES):
+            return _CODECS_BY_NAME["identity"]
+
+        return self.default_codec
+
+    def choose_for(self, headers: Dict, size: int) -> Codec:
+        return self.choose(content_type_of(headers), size)
+
+    def encode(self, body: bytes, headers: Dict) -> Tuple[bytes, str]:
+        codec = self.choose(content_type_of(headers), len(body))
+        stored = encode_blob(body, codec)
+        return stored, blob_codec_name(stored)
+
+
+def content_type_of(headers: Dict) -> str:
+    for key, value in (headers or {}).items():
+        if key.lower() == "content-type":
+            return value
+    return ""
@@ -0,0 +1,164 @@
+# evidence/durability.py
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, List
+
+
+DURABILITY_MODES = ("sync", "group")
+
+
+@dataclass(frozen=True)
+class GroupCommitConfig:
+    """
+    When a pending batch is made durable.
+    Whichever limit is reached first triggers the commit.
+    """
+    max_batch_ops: int = 64
+    max_delay_ms: int = 50
+    max_batch_bytes: int = 8 * 1024 * 1024
+
+
+def completed_ticket() -> Future:
+    ticket = Future()
+    ticket.set_result(True)
+    return ticket
+
+
+class GroupCommitter:
+    """
+    Batches durability for many writes into one sync pass.
+
+    Writers hold `write_lock` while writing and call `submit()`;
+    the returned ticket (a Future) resolves once a sync pass
+    covering that write has completed. Sync functions run in
+    order under the same lock, so no write is half-included.
+    """
+
+    def __init__(self, sync_fns: List[Callable[[], None]], config: GroupCommitConfig):
+        self.sync_fns = sync_fns
+        self.config = config
+
+        self.write_lock = threading.RLock()
+
+        self._cond = threading.Condition()
+        self._pending: List[Future] = []
+        self._pending_bytes = 0
+        # last ticket of the batch being synced: taken out of
+        # _pending, but not durable until its sync pass finishes
+        self._in_flight: Future = None
+        self._deadline = None
+        self._closed = False
+
+        self.batches_committed = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="evidence-group-commit", daemon=True
+        )
+        self._thread.start()
+
+    # --------------------------------------------------
+    # Writer side
+    # --------------------------------------------------
+
+    def submit(self, byte_count: int = 0) -> Future:
+        ticket = Future()
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("GroupCommitter is closed")
+
+            self._pending.append(ticket)
+            self._pending_bytes += byte_count
+
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self.config.max_delay_ms / 1000
+
+            if (
+                len(self._pending) >= self.config.max_batch_ops
+                or self._pending_bytes >= self.config.max_batch_bytes
+            ):
+                self._deadline = time.monotonic()
+
+            self._cond.notify()
+
+        return ticket
+
+    def last_ticket(self) -> Future:
+        """
+        Ticket covering every write submitted so far.
+        """
+        with self._cond:
+            if self._pending:
+                return self._pending[-1]
+            if self._in_flight is not None:
+                return self._in_flight
+        return completed_ticket()
+
+    def flush(self) -> None:
+        """
+        Commit the pending batch now, in the caller's thread.
+        """
+        with self.write_lock:
+            with self._cond:
+                batch = self._pending
+                self._pending = []
+                self._pending_bytes = 0
+                self._deadline = None
+                if batch:
+                    self._in_flight = batch[-1]
+
+            if not batch:
+                return
+
+            try:
+                for sync in self.sync_fns:
+                    sync()
+            except BaseException as e:
+                for ticket in batch:
+                    ticket.set_exception(e)
+                raise
+            finally:
+                with self._cond:
+                    self._in_flight = None
+
+            self.batches_committed += 1
+
+            # resolved before write_lock is released, so no later
+            # batch's tickets can resolve ahead of these
+            for ticket in batch:
+                ticket.set_result(True)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    # --------------------------------------------------
+    # Background committer
+    # --------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and (
+                    self._deadline is None
+                    or time.monotonic() < self._deadline
+                ):
+                    timeout = (
+                        None if self._deadline is None
+                        else self._deadline - time.monotonic()
+                    )
+                    self._cond.wait(timeout)
+
+                if self._closed:
+                    return
+
+            try:
+                self.flush()
+            except Exception:
+                pass  # surfaced to writers through their tickets
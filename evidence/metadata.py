@@ -0,0 +1,222 @@
+# evidence/metadata.py
+
+import os
+import json
+import tempfile
+from typing import Dict, List, Optional
+
+from evidence.blobs import fsync_path
+from evidence.catalog import open_catalog, catalog_path
+
+
+METADATA_BACKENDS = ("files", "catalog")
+
+
+class FileMetadataBackend:
+    """
+    Per-evidence files under meta/:
+
+    - <id>.json             base metadata (write-once)
+    - <id>.state            latest lifecycle state
+    - <id>.envelopes.jsonl  append-only integrity envelopes
+
+    Deferred mode (group commit) stages .json/.state writes in
+    temp files and skips envelope fsyncs until sync().
+    """
+
+    def __init__(self, meta_path: str):
+        self.meta_path = meta_path
+        self.deferred = False
+        self._staged: Dict[str, str] = {}  # final path -> temp file
+        self._unsynced_envelopes = set()
+
+        os.makedirs(meta_path, exist_ok=True)
+
+    # ---- metadata ----
+
+    def put_metadata(self, evidence_id: str, meta: Dict) -> None:
+        meta_file = os.path.join(self.meta_path, f"{evidence_id}.json")
+
+        if meta_file in self._staged or os.path.exists(meta_file):
+            return
+
+        data = json.dumps(meta, indent=2, sort_keys=True)
+
+        if self.deferred:
+            self._stage(meta_file, data)
+            return
+
+        with open(meta_file, "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def get_metadata(self, evidence_id: str) -> Dict:
+        meta_file = os.path.join(self.meta_path, f"{evidence_id}.json")
+        with open(self._readable(meta_file), "r") as f:
+            return json.load(f)
+
+    # ---- envelopes ----
+
+    def append_envelope(self, evidence_id: str, envelope: Dict) -> None:
+        envelope_path = os.path.join(
+            self.meta_path, f"{evidence_id}.envelopes.jsonl"
+        )
+
+        line = json.dumps(envelope, sort_keys=True) + "\n"
+
+        with open(envelope_path, "ab") as f:
+            f.write(line.encode("utf-8"))
+            f.flush()
+            if self.deferred:
+                self._unsynced_envelopes.add(envelope_path)
+            else:
+                os.fsync(f.fileno())
+
+    def envelopes(self, evidence_id: str) -> List[Dict]:
+        envelope_path = os.path.join(
+            self.meta_path, f"{evidence_id}.envelopes.jsonl"
+        )
+
+        if not os.path.exists(envelope_path):
+            return []
+
+        envelopes = []
+
+        with open(envelope_path, "r") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # torn, never-acknowledged tail
+                if line.strip():
+                    envelopes.append(json.loads(line))
+
+        return envelopes
+
+    # ---- lifecycle state ----
+
+    def set_state(self, evidence_id: str, state: str) -> None:
+        state_file = os.path.join(self.meta_path, f"{evidence_id}.state")
+
+        if self.deferred:
+            self._stage(state_file, state)
+            return
+
+        with open(state_file, "w") as f:
+            f.write(state)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def get_state(self, evidence_id: str) -> Optional[str]:
+        state_file = self._readable(
+            os.path.join(self.meta_path, f"{evidence_id}.state")
+        )
+        if not os.path.exists(state_file):
+            return None
+
+        with open(state_file, "r") as f:
+            return f.read().strip()
+
+    # ---- listing (directory walk) ----
+
+    def evidence_ids(self) -> List[str]:
+        names = set(os.listdir(self.meta_path))
+        names.update(os.path.basename(path) for path in list(self._staged))
+
+        return [
+            filename.replace(".json", "")
+            for filename in names
+            if filename.endswith(".json")
+        ]
+
+    def ids_in_state(self, state: str) -> List[str]:
+        return [
+            evidence_id
+            for evidence_id in self.evidence_ids()
+            if self.get_state(evidence_id) == state
+        ]
+
+    def ids_for_url(self, url: str) -> List[str]:
+        """
+        Evidence stored for a URL, newest first (metadata file mtime).
+        Reads every metadata file; the catalog has an index for this.
+        """
+        found = []
+        for evidence_id in self.evidence_ids():
+            meta_file = self._readable(
+                os.path.join(self.meta_path, f"{evidence_id}.json")
+            )
+            with open(meta_file, "r") as f:
+                if json.load(f).get("url") == url:
+                    found.append((os.path.getmtime(meta_file), evidence_id))
+
+        return [evidence_id for _, evidence_id in sorted(found, reverse=True)]
+
+    def stale_ids(self, validator_version: str) -> List[str]:
+        stale = []
+        for evidence_id in sorted(self.evidence_ids()):
+            envelopes = self.envelopes(evidence_id)
+            if not envelopes or envelopes[-1]["validator_version"] != validator_version:
+                stale.append(evidence_id)
+        return stale
+
+    # ---- group commit ----
+
+    def sync(self) -> None:
+        """
+        Make every deferred write durable under its final name.
+        """
+
+        for envelope_path in list(self._unsynced_envelopes):
+            fsync_path(envelope_path)
+            self._unsynced_envelopes.discard(envelope_path)
+
+        if not self._staged:
+            return
+
+        for final_path, tmp_name in list(self._staged.items()):
+            fsync_path(tmp_name)
+            os.replace(tmp_name, final_path)
+            del self._staged[final_path]
+
+        fsync_path(self.meta_path)
+
+    def _stage(self, final_path: str, data: str) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.meta_path, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(data)
+            tmp_name = tmp.name
+
+        # a newer staged write supersedes the older one
+        previous = self._staged.get(final_path)
+        self._staged[final_path] = tmp_name
+        if previous is not None:
+            os.remove(previous)
+
+    def _readable(self, final_path: str) -> str:
+        staged = self._staged.get(final_path)
+        if staged is not None and os.path.exists(staged):
+            return staged
+        return final_path
+
+
+def open_metadata_backend(base_path: str, backend: str = None):
+    """
+    Metadata backend for an evidence directory.
+    With no explicit backend, an existing catalog wins.
+    """
+
+    if backend is None:
+        backend = (
+            "catalog" if os.path.exists(catalog_path(base_path)) else "files"
+        )
+
+    if backend == "catalog":
+        return open_catalog(base_path)
+
+    if backend == "files":
+        return FileMetadataBackend(os.path.join(base_path, "meta"))
+
+    raise ValueError(
+        f"Unknown metadata backend: {backend} (expected one of {METADATA_BACKENDS})"
+    )
@@ -0,0 +1,84 @@
+# evidence/migrate_blobs.py
+#
+# Usage:
+#   python -m evidence.migrate_blobs ./evidence_data [--remove-flat]
+
+import argparse
+import hashlib
+import os
+import re
+
+from evidence.blobs import segments_path
+from evidence.codecs import decode_blob
+from evidence.segments import open_segment_log
+
+
+DIGEST_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+
+def migrate_flat_blobs(base_path: str, remove_flat: bool = False) -> dict:
+    """
+    Copy every flat blob file into the segment log.
+
+    - Each blob is re-hashed; mismatches are reported, never migrated
+    - Safe to re-run: digests already in the log are skipped
+    - Flat files are only removed on request, after the log is durable
+    """
+
+    blob_path = os.path.join(base_path, "blobs")
+    log = open_segment_log(segments_path(base_path))
+
+    report = {"migrated": 0, "skipped": 0, "corrupt": [], "removed": 0}
+
+    if not os.path.isdir(blob_path):
+        return report
+
+    names = sorted(n for n in os.listdir(blob_path) if DIGEST_NAME.match(n))
+
+    for name in names:
+        with open(os.path.join(blob_path, name), "rb") as f:
+            body = f.read()
+
+        if hashlib.sha256(decode_blob(body)).hexdigest() != name:
+            report["corrupt"].append(name)
+            continue
+
+        if log.exists(name):
+            report["skipped"] += 1
+        else:
+            log.put(name, body)
+            report["migrated"] += 1
+
+    if remove_flat:
+        for name in names:
+            if name in report["corrupt"] or not log.exists(name):
+                continue
+            os.remove(os.path.join(blob_path, name))
+            report["removed"] += 1
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Migrate flat evidence blobs into segment files"
+    )
+    parser.add_argument("base_path", help="Evidence directory, e.g. ./evidence_data")
+    parser.add_argument(
+        "--remove-flat",
+        action="store_true",
+        help="Delete flat blob files once they are in the segment log",
+    )
+    args = parser.parse_args()
+
+    report = migrate_flat_blobs(args.base_path, remove_flat=args.remove_flat)
+
+    print("Migrated:", report["migrated"])
+    print("Already present:", report["skipped"])
+    print("Removed flat files:", report["removed"])
+    if report["corrupt"]:
+        print("Digest mismatch (left in place):", ", ".join(report["corrupt"]))
+
+
+if __name__ == "__main__":
+    main()
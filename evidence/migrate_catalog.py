@@ -0,0 +1,27 @@
+# evidence/migrate_catalog.py
+#
+# Usage:
+#   python -m evidence.migrate_catalog ./evidence_data
+
+import argparse
+import os
+
+from evidence.catalog import open_catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import per-evidence meta/ files into the SQLite catalog"
+    )
+    parser.add_argument("base_path", help="Evidence directory, e.g. ./evidence_data")
+    args = parser.parse_args()
+
+    catalog = open_catalog(args.base_path)
+    imported = catalog.import_files(os.path.join(args.base_path, "meta"))
+
+    print("Imported:", imported)
+    print("Catalog:", catalog.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+# evidence/segments.py
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Tuple
+
+from evidence.codecs import decode_blob
+
+
+SEGMENT_MAX_BYTES = 256 * 1024 * 1024
+
+# ---- on-disk record layouts ----
+# segment record: magic | sha256 digest | body length | body
+RECORD_MAGIC = b"PVSG"
+RECORD_HEADER = struct.Struct("<4s32sQ")
+
+# index entry: sha256 digest | segment number | body offset | body length
+INDEX_ENTRY = struct.Struct("<32sIQQ")
+
+INDEX_FILENAME = "index.bin"
+
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+class SegmentLog:
+    """
+    Append-only, content-addressed blob log.
+
+    - Blobs packed into large segment files
+    - Compact digest -> (segment, offset, length) index
+    - Zero-copy reads via mmap / memoryview
+    - Write-once: a digest is appended at most one time
+
+    Deferred mode (group commit) skips the per-blob fsyncs;
+    sync() flushes the segments, then the batch's index entries.
+    """
+
+    def __init__(self, path: str, segment_max_bytes: int = SEGMENT_MAX_BYTES):
+        self.path = path
+        self.segment_max_bytes = segment_max_bytes
+
+        os.makedirs(path, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._entries: Dict[bytes, Tuple[int, int, int]] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+
+        self.deferred = False
+        self._unsynced_entries = []
+        self._unsynced_segments = []
+
+        self._index_file = os.path.join(path, INDEX_FILENAME)
+        self._load_index()
+        self._recover_tail()
+
+        self._index_fh = open(self._index_file, "ab")
+        self._segment_fh = open(self._segment_file(self._active), "ab")
+
+    # --------------------------------------------------
+    # Public API
+    # --------------------------------------------------
+
+    def exists(self, digest: str) -> bool:
+        return bytes.fromhex(digest) in self._entries
+
+    def put(self, digest: str, body: bytes) -> None:
+        """
+        Append a (possibly codec-framed) blob under the SHA-256
+        digest of its uncompressed bytes (write-once).
+        The segment is fsynced before the index entry that points at it.
+        """
+        self._append(bytes.fromhex(digest), len(body), [body])
+
+    def put_file(self, digest: str, path: str) -> None:
+        """
+        Append a blob from a file, copying it in chunks,
+        then remove the file.
+        """
+
+        def chunks():
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(COPY_CHUNK_BYTES)
+                    if not chunk:
+                        return
+                    yield chunk
+
+        self._append(bytes.fromhex(digest), os.path.getsize(path), chunks())
+        os.remove(path)
+
+    def _append(self, key: bytes, length: int, chunks) -> None:
+        with self._lock:
+            if key in self._entries:
+                return
+
+            if (
+                self._segment_fh.tell() > 0
+                and self._segment_fh.tell() + RECORD_HEADER.size + length
+                > self.segment_max_bytes
+            ):
+                self._rotate()
+
+            header = RECORD_HEADER.pack(RECORD_MAGIC, key, length)
+            offset = self._segment_fh.tell() + RECORD_HEADER.size
+
+            self._segment_fh.write(header)
+            for chunk in chunks:
+                self._segment_fh.write(chunk)
+            self._segment_fh.flush()
+
+            if self.deferred:
+                self._unsynced_entries.append((key, self._active, offset, length))
+                self._entries[key] = (self._active, offset, length)
+                return
+
+            os.fsync(self._segment_fh.fileno())
+            self._append_entry(key, self._active, offset, length)
+
+    def sync(self) -> None:
+        """
+        Make every deferred append durable and indexed.
+        """
+
+        with self._lock:
+            if not self._unsynced_entries:
+                return
+
+            for fh in self._unsynced_segments:
+                os.fsync(fh.fileno())
+                fh.close()
+            self._unsynced_segments = []
+
+            os.fsync(self._segment_fh.fileno())
+
+            for key, segment, offset, length in self._unsynced_entries:
+                self._index_fh.write(
+                    INDEX_ENTRY.pack(key, segment, offset, length)
+                )
+            self._index_fh.flush()
+            os.fsync(self._index_fh.fileno())
+
+            self._unsynced_entries = []
+
+    def get(self, digest: str) -> memoryview:
+        """
+        Zero-copy view of a stored blob.
+        Raises KeyError for unknown digests.
+        """
+
+        segment, offset, length = self._entries[bytes.fromhex(digest)]
+        return memoryview(self._map(segment, offset + length))[
+            offset:offset + length
+        ]
+
+    def locate(self, digest: str) -> Tuple[str, int, int]:
+        """
+        (segment file, offset, length) of a stored blob.
+        """
+        segment, offset, length = self._entries[bytes.fromhex(digest)]
+        return self._segment_file(segment), offset, length
+
+    def digests(self):
+        return [key.hex() for key in self._entries]
+
+    def close(self) -> None:
+        with self._lock:
+            self._index_fh.close()
+            self._segment_fh.close()
+            for mapped in self._maps.values():
+                try:
+                    mapped.close()
+                except BufferError:
+                    pass  # still referenced by a live memoryview
+            self._maps.clear()
+
+    # --------------------------------------------------
+    # Internals
+    # --------------------------------------------------
+
+    def _segment_file(self, segment: int) -> str:
+        return os.path.join(self.path, f"seg-{segment:06d}.log")
+
+    def _load_index(self) -> None:
+        # a freshly rotated segment may exist before its first entry
+        self._active = max(
+            (
+                int(name[4:10])
+                for name in os.listdir(self.path)
+                if name.startswith("seg-") and name.endswith(".log")
+            ),
+            default=0,
+        )
+
+        if not os.path.exists(self._index_file):
+            return
+
+        with open(self._index_file, "rb") as f:
+            data = f.read()
+
+        # drop a torn trailing entry left by a crash
+        usable = len(data) - len(data) % INDEX_ENTRY.size
+        if usable != len(data):
+            with open(self._index_file, "r+b") as f:
+                f.truncate(usable)
+
+        sizes: Dict[int, int] = {}
+
+        for pos in range(0, usable, INDEX_ENTRY.size):
+            key, segment, offset, length = INDEX_ENTRY.unpack_from(data, pos)
+
+            if segment not in sizes:
+                seg_file = self._segment_file(segment)
+                sizes[segment] = (
+                    os.path.getsize(seg_file) if os.path.exists(seg_file) else 0
+                )
+
+            if offset + length > sizes[segment]:
+                continue  # points past the durable end of its segment
+
+            self._entries[key] = (segment, offset, length)
+
+    def _recover_tail(self) -> None:
+        """
+        Re-index records appended after the last durable index entry,
+        and truncate any torn record at the end of the active segment.
+        """
+
+        seg_file = self._segment_file(self._active)
+        if not os.path.exists(seg_file):
+            return
+
+        indexed_end = max(
+            (
+                offset + length
+                for segment, offset, length in self._entries.values()
+                if segment == self._active
+            ),
+            default=0,
+        )
+
+        recovered = []
+
+        with open(seg_file, "r+b") as f:
+            size = os.fstat(f.fileno()).st_size
+            pos = indexed_end
+
+            while pos + RECORD_HEADER.size <= size:
+                f.seek(pos)
+                magic, key, length = RECORD_HEADER.unpack(
+                    f.read(RECORD_HEADER.size)
+                )
+                body_offset = pos + RECORD_HEADER.size
+
+                if magic != RECORD_MAGIC or body_offset + length > size:
+                    break
+
+                body = f.read(length)
+                if hashlib.sha256(decode_blob(body)).digest() != key:
+                    break
+
+                if key not in self._entries:
+                    recovered.append((key, body_offset, length))
+                pos = body_offset + length
+
+            if pos < size:
+                f.truncate(pos)
+                f.flush()
+                os.fsync(f.fileno())
+
+        if recovered:
+            with open(self._index_file, "ab") as index_fh:
+                for key, offset, length in recovered:
+                    index_fh.write(
+                        INDEX_ENTRY.pack(key, self._active, offset, length)
+                    )
+                    self._entries[key] = (self._active, offset, length)
+                index_fh.flush()
+                os.fsync(index_fh.fileno())
+
+    def _append_entry(self, key: bytes, segment: int, offset: int, length: int) -> None:
+        self._index_fh.write(INDEX_ENTRY.pack(key, segment, offset, length))
+        self._index_fh.flush()
+        os.fsync(self._index_fh.fileno())
+
+        self._entries[key] = (segment, offset, length)
+
+    def _rotate(self) -> None:
+        if self.deferred:
+            self._unsynced_segments.append(self._segment_fh)
+        else:
+            self._segment_fh.close()
+        self._active += 1
+        self._segment_fh = open(self._segment_file(self._active), "ab")
+
+    def _map(self, segment: int, needed: int) -> mmap.mmap:
+        mapped = self._maps.get(segment)
+
+        # the active segment grows; remap once a read runs past the view
+        if mapped is None or len(mapped) < needed:
+            with open(self._segment_file(segment), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+
+        return mapped
+
+
+_OPEN_LOGS: Dict[str, SegmentLog] = {}
+_OPEN_LOCK = threading.Lock()
+
+
+def open_segment_log(path: str) -> SegmentLog:
+    """
+    Shared SegmentLog per directory, so readers and the
+    writer in one process see the same in-memory index.
+    """
+
+    key = os.path.abspath(path)
+
+    with _OPEN_LOCK:
+        log = _OPEN_LOGS.get(key)
+        if log is None:
+            log = SegmentLog(path)
+            _OPEN_LOGS[key] = log
+        return log
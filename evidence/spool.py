@@ -0,0 +1,96 @@
+# evidence/spool.py
+
+import hashlib
+import os
+import tempfile
+from typing import Iterable, Iterator
+
+
+SPOOL_CHUNK_BYTES = 64 * 1024
+
+
+class BodyTooLarge(Exception):
+    pass
+
+
+class SpooledBlob:
+    """
+    Lazy handle to a body spooled to disk.
+
+    Carries the SHA-256 and size computed while streaming,
+    so the pipeline never needs the whole body in memory.
+    """
+
+    def __init__(self, path: str, sha256: str, size: int):
+        self.path = path
+        self.sha256 = sha256
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def iter_chunks(self, chunk_size: int = SPOOL_CHUNK_BYTES) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def head(self, n: int) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read(n)
+
+    def discard(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class BlobSpool:
+    """
+    Streams a body to a temp file in `spool_dir`.
+
+    - SHA-256 updated incrementally
+    - Observers (e.g. validators) see every chunk once
+    - Aborts and removes the temp file past max_bytes
+    """
+
+    def __init__(self, spool_dir: str, max_bytes: int = None, observers: Iterable = ()):
+        self.max_bytes = max_bytes
+        self.observers = list(observers)
+
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._tmp = tempfile.NamedTemporaryFile(
+            dir=spool_dir, prefix="spool-", delete=False
+        )
+
+    def write(self, chunk: bytes) -> None:
+        self._size += len(chunk)
+
+        if self.max_bytes is not None and self._size > self.max_bytes:
+            self.abort()
+            raise BodyTooLarge(f"Body exceeds {self.max_bytes} bytes")
+
+        self._hash.update(chunk)
+        self._tmp.write(chunk)
+
+        for observer in self.observers:
+            observer.update(chunk)
+
+    def finish(self) -> SpooledBlob:
+        self._tmp.close()
+        return SpooledBlob(self._tmp.name, self._hash.hexdigest(), self._size)
+
+    def abort(self) -> None:
+        self._tmp.close()
+        try:
+            os.remove(self._tmp.name)
+        except FileNotFoundError:
+            pass
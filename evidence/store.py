@@ -1,85 +1,191 @@
 # evidence/store.py
 
 import hashlib
+import mmap
 import os
-import json
-import tempfile
-from typing import Dict
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+from evidence.blobs import open_blob_backend
+from evidence.codecs import (
+    CompressionPolicy,
+    IdentityCodec,
+    decode_blob,
+    encode_blob,
+    encode_file,
+    iter_decoded,
+)
+from evidence.durability import (
+    DURABILITY_MODES,
+    GroupCommitConfig,
+    GroupCommitter,
+    completed_ticket,
+)
+from evidence.lifecycle import EvidenceState
+from evidence.metadata import open_metadata_backend
+from evidence.spool import SPOOL_CHUNK_BYTES, BlobSpool, SpooledBlob
 
 
 class EvidenceStore:
     """
     Write-once, content-addressable evidence store.
 
-    - Raw bytes stored as blobs
-    - Metadata stored as JSON
-    - Integrity envelopes stored append-only (JSONL)
+    - Raw bytes stored as blobs (flat files or packed segments),
+      optionally compressed; IDs always hash the uncompressed bytes
+    - Metadata stored as JSON (per-evidence files or a SQLite catalog)
+    - Integrity envelopes stored append-only
     - Lifecycle state stored explicitly
+    - Optional retrieval index kept in step with accepted state
+
+    Durability:
+    - "sync":  every write is fsynced before it returns
+    - "group": writes are batched and made durable together;
+               durability_ticket() resolves once they are on disk
     """
 
-    def __init__(self, base_path: str):
+    def __init__(
+        self,
+        base_path: str,
+        index=None,
+        blob_backend: str = None,
+        metadata_backend: str = None,
+        durability: str = "sync",
+        group_commit: GroupCommitConfig = None,
+        compression: CompressionPolicy = None,
+    ):
         self.base_path = base_path
+        self.index = index
+        self.compression = compression
         self.blob_path = os.path.join(base_path, "blobs")
         self.meta_path = os.path.join(base_path, "meta")
 
         os.makedirs(self.blob_path, exist_ok=True)
         os.makedirs(self.meta_path, exist_ok=True)
 
+        self.blobs = open_blob_backend(base_path, blob_backend)
+        self.meta = open_metadata_backend(base_path, metadata_backend)
+
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                f"Unknown durability mode: {durability} "
+                f"(expected one of {DURABILITY_MODES})"
+            )
+
+        self.committer = None
+        if durability == "group":
+            self.blobs.deferred = True
+            self.meta.deferred = True
+            # blobs first: metadata must never reference a lost blob
+            self.committer = GroupCommitter(
+                [self.blobs.sync, self.meta.sync],
+                group_commit or GroupCommitConfig(),
+            )
+
     # --------------------------------------------------
     # Evidence write (Phase-1B)
     # --------------------------------------------------
 
+    @property
+    def spool_path(self) -> str:
+        """
+        Where streamed bodies are spooled; same filesystem as
+        the flat blobs, so adopting one is a rename.
+        """
+        return self.blob_path
+
     def write(self, payload: Dict) -> str:
-        body: bytes = payload["body"]
+        return self.write_with_ticket(payload)[0]
 
-        digest = hashlib.sha256(body).hexdigest()
+    def write_with_ticket(self, payload: Dict) -> Tuple[str, Future]:
+        """
+        write(), plus a ticket that resolves once this write is durable.
+        """
+        body = payload["body"]
 
-        blob_file = os.path.join(self.blob_path, digest)
-        meta_file = os.path.join(self.meta_path, f"{digest}.json")
+        if isinstance(body, SpooledBlob):
+            return self._write_spooled(payload, body)
 
-        # ---- write blob (atomic, write-once) ----
-        if not os.path.exists(blob_file):
-            with tempfile.NamedTemporaryFile(
-                dir=self.blob_path, delete=False
-            ) as tmp:
-                tmp.write(body)
-                tmp.flush()
-                os.fsync(tmp.fileno())
-                tmp_name = tmp.name
+        digest = hashlib.sha256(body).hexdigest()
 
-            os.rename(tmp_name, blob_file)
+        with self._batched(len(body)) as batch:
+            # ---- write blob (atomic, write-once) ----
+            if not self.blobs.exists(digest):
+                self.blobs.put(digest, self._encode(body, payload["headers"]))
 
-        # ---- write base metadata ----
-        if not os.path.exists(meta_file):
-            meta = {
+            # ---- write base metadata (write-once) ----
+            self.meta.put_metadata(digest, {
                 "url": payload["url"],
                 "status": payload["status"],
                 "headers": payload["headers"],
                 "body_sha256": digest,
                 "body_size": len(body),
-            }
+            })
+
+        return digest, batch.ticket
+
+    def _write_spooled(self, payload: Dict, body: SpooledBlob) -> Tuple[str, Future]:
+        """
+        write() for a streamed body: the digest was computed while
+        spooling and the temp file is adopted, never read whole.
+        """
+
+        digest = body.sha256
+
+        with self._batched(body.size) as batch:
+            if self.blobs.exists(digest):
+                body.discard()
+            else:
+                codec = (
+                    IdentityCodec() if self.compression is None
+                    else self.compression.choose_for(payload["headers"], body.size)
+                )
+                self.blobs.put_file(digest, encode_file(body.path, codec))
+
+            self.meta.put_metadata(digest, {
+                "url": payload["url"],
+                "status": payload["status"],
+                "headers": payload["headers"],
+                "body_sha256": digest,
+                "body_size": body.size,
+            })
 
-            with open(meta_file, "w") as f:
-                json.dump(meta, f, indent=2, sort_keys=True)
-                f.flush()
-                os.fsync(f.fileno())
+        return digest, batch.ticket
+
+    def _encode(self, body: bytes, headers: Dict) -> bytes:
+        """
+        At-rest form of a body: compressed per policy, or raw.
+        """
+        if self.compression is None:
+            return encode_blob(body, IdentityCodec())
 
-        return digest
+        stored, _ = self.compression.encode(body, headers)
+        return stored
 
     # --------------------------------------------------
     # Phase-2B: append-only integrity envelope
     # --------------------------------------------------
 
-    def append_envelope(self, evidence_id: str, envelope: Dict) -> None:
+    def append_envelope(self, evidence_id: str, envelope: Dict) -> Future:
         """
-        Append-only integrity envelope log (JSONL).
+        Append-only integrity envelope log.
 
         Guarantees:
-        - atomic line writes
+        - atomic appends (JSONL line or catalog row)
         - no overwrite
         - ordered forensic history
+
+        Returns a ticket that resolves once the append is durable.
         """
 
+        self._check_envelope(envelope)
+
+        with self._batched() as batch:
+            self.meta.append_envelope(evidence_id, envelope)
+
+        return batch.ticket
+
+    @staticmethod
+    def _check_envelope(envelope: Dict) -> None:
         required_fields = {
             "evidence_id",
             "integrity_score",
@@ -97,33 +203,193 @@ class EvidenceStore:
                 f"Invalid IntegrityEnvelope, missing fields: {missing}"
             )
 
-        envelope_path = os.path.join(
-            self.meta_path, f"{evidence_id}.envelopes.jsonl"
-        )
-
-        line = json.dumps(envelope, sort_keys=True) + "\n"
-
-        with open(envelope_path, "ab") as f:
-            f.write(line.encode("utf-8"))
-            f.flush()
-            os.fsync(f.fileno())
-
     # --------------------------------------------------
     # Phase-2B: lifecycle state
     # --------------------------------------------------
 
-    def write_state(self, evidence_id: str, state: str) -> None:
+    def write_state(self, evidence_id: str, state: str) -> Future:
         """
         Persist current lifecycle state.
 
         This is NOT mutable in-place; it represents
         the latest authoritative state.
+        Returns a ticket that resolves once it is durable.
         """
-        state_file = os.path.join(
-            self.meta_path, f"{evidence_id}.state"
+        state = getattr(state, "value", state)
+
+        with self._batched() as batch:
+            self.meta.set_state(evidence_id, state)
+
+        if self.index is not None:
+            self._update_index(evidence_id, state)
+
+        return batch.ticket
+
+    def write_judgments(self, judgments: List[Tuple[str, str, Dict]]) -> Future:
+        """
+        Bulk (evidence_id, state, envelope) writes, made durable
+        together: one catalog transaction / one fsync pass.
+        """
+
+        for _, _, envelope in judgments:
+            self._check_envelope(envelope)
+
+        with self._batched() as batch:
+            deferred = self.meta.deferred
+            self.meta.deferred = True
+            try:
+                for evidence_id, state, envelope in judgments:
+                    self.meta.set_state(evidence_id, getattr(state, "value", state))
+                    self.meta.append_envelope(evidence_id, envelope)
+            finally:
+                self.meta.deferred = deferred
+                if not deferred:
+                    self.meta.sync()
+
+        if self.index is not None:
+            for evidence_id, state, _ in judgments:
+                self._update_index(evidence_id, getattr(state, "value", state))
+
+        return batch.ticket
+
+    # --------------------------------------------------
+    # Durability (group commit)
+    # --------------------------------------------------
+
+    def durability_ticket(self) -> Future:
+        """
+        Resolves once every write made so far is durable.
+        """
+        if self.committer is None:
+            return completed_ticket()
+        return self.committer.last_ticket()
+
+    def flush(self) -> None:
+        if self.committer is not None:
+            self.committer.flush()
+
+    def close(self) -> None:
+        if self.committer is not None:
+            self.committer.close()
+
+    def _batched(self, byte_count: int = 0):
+        if self.committer is None:
+            return _SyncWrite()
+        return _GroupWrite(self.committer, byte_count)
+
+    # --------------------------------------------------
+    # Retrieval index maintenance
+    # --------------------------------------------------
+
+    def _update_index(self, evidence_id: str, state: str) -> None:
+        if state != EvidenceState.RAW_ACCEPTED:
+            self.index.remove_document(evidence_id)
+            return
+
+        meta = self.read_metadata(evidence_id)
+        self.index.add_document(
+            evidence_id, meta["url"], self.read_blob(evidence_id)
         )
 
-        with open(state_file, "w") as f:
-            f.write(state)
-            f.flush()
-            os.fsync(f.fileno())
+    # --------------------------------------------------
+    # Reads
+    # --------------------------------------------------
+
+    def read_metadata(self, evidence_id: str) -> Dict:
+        return self.meta.get_metadata(evidence_id)
+
+    def read_state(self, evidence_id: str):
+        return self.meta.get_state(evidence_id)
+
+    def read_envelopes(self, evidence_id: str):
+        return self.meta.envelopes(evidence_id)
+
+    def read_blob(self, evidence_id: str) -> bytes:
+        return decode_blob(self.blobs.get(evidence_id))
+
+    def spool_blob(self, evidence_id: str, spool_dir: str, observers=()) -> SpooledBlob:
+        """
+        read_blob() into a SpooledBlob: the stored blob is mapped and
+        decoded chunk by chunk, never held whole. Observers see every
+        chunk, as they would for a streamed download.
+        """
+
+        spool = BlobSpool(spool_dir, observers=observers)
+        try:
+            try:
+                self._spool_located(self.blobs.locate(evidence_id), spool)
+            except FileNotFoundError:
+                # a staged blob renamed by a concurrent sync()
+                self._spool_located(self.blobs.locate(evidence_id), spool)
+        except BaseException:
+            spool.abort()
+            raise
+
+        return spool.finish()
+
+    @staticmethod
+    def _spool_located(location: Tuple[str, int, int], spool: BlobSpool) -> None:
+        path, offset, length = location
+        if not length:
+            return
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            view = memoryview(mapped)[offset:offset + length]
+            chunks = iter_decoded(view, SPOOL_CHUNK_BYTES)
+            try:
+                # raw chunks are views into the map; observers (and
+                # closing the map) need them copied out as bytes
+                for chunk in map(bytes, chunks):
+                    spool.write(chunk)
+            finally:
+                # drop the generator's views before the map closes
+                chunks.close()
+                view.release()
+
+    def ids_for_url(self, url: str) -> List[str]:
+        """
+        Evidence stored for a URL, newest first.
+        """
+        return self.meta.ids_for_url(url)
+
+
+class _SyncWrite:
+    """
+    One logical write in sync mode: durable once it returns.
+    """
+
+    def __init__(self):
+        self.ticket = completed_ticket()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _GroupWrite:
+    """
+    Holds the commit lock across one logical write,
+    then queues it for the next durable batch.
+    The write's ticket is set on exit.
+    """
+
+    def __init__(self, committer: GroupCommitter, byte_count: int):
+        self.committer = committer
+        self.byte_count = byte_count
+        self.ticket: Future = None
+
+    def __enter__(self):
+        self.committer.write_lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.ticket = self.committer.submit(self.byte_count)
+        finally:
+            self.committer.write_lock.release()
+        return False
@@ -1,29 +1,81 @@
 
 import os
 import json
-from dotenv import load_dotenv
-from groq import Groq
+import time
 
+from llm.response_cache import ResponseCache, response_key
 
-load_dotenv()
 
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+DEFAULT_GROQ_MODEL = "llama-3.3-70b-versatile"
 
-if not GROQ_API_KEY:
-    raise RuntimeError("GROQ_API_KEY not found in .env")
+# built on first use: importing this module needs neither the groq
+# package nor credentials (offline tools, --help, cached replays)
+_client = None
+_env_loaded = False
 
-client = Groq(api_key=GROQ_API_KEY)
+
+def _load_env() -> None:
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+
+
+def groq_model() -> str:
+    _load_env()
+    return os.getenv("GROQ_MODEL", DEFAULT_GROQ_MODEL)
+
+
+def get_client():
+    """
+    The shared Groq client; raises if GROQ_API_KEY is missing.
+    """
+
+    global _client
+    if _client is None:
+        _load_env()
+
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key:
+            raise RuntimeError("GROQ_API_KEY not found in .env")
+
+        from groq import Groq
+
+        _client = Groq(api_key=api_key)
+
+    return _client
+
+# optional ResponseCache shared by planner and reasoner calls
+_response_cache = None
+
+
+def set_response_cache(cache: ResponseCache) -> None:
+    global _response_cache
+    _response_cache = cache
 
 
 def call_llm(system_prompt: str, user_prompt: str) -> dict:
     """
     Deterministic LLM call.
-    Temperature forced to 0.
+    Temperature forced to 0, so parsed responses are cached
+    by (model, prompts) when a response cache is set.
     """
 
-    response = client.chat.completions.create(
-        model=GROQ_MODEL,
+    model = groq_model()
+
+    cache = _response_cache
+    key = None
+    if cache is not None:
+        key = response_key(model, system_prompt, user_prompt)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    started = time.perf_counter()
+    response = get_client().chat.completions.create(
+        model=model,
         temperature=0.0,
         response_format={"type": "json_object"},
         messages=[
@@ -38,8 +90,13 @@ def call_llm(system_prompt: str, user_prompt: str) -> dict:
         if not content:
             raise ValueError("LLM returned empty content")
             
-        return json.loads(content)
+        result = json.loads(content)
     except (json.JSONDecodeError, TypeError) as e:
         print(f"❌ LLM JSON Error: {e}")
         # Return a safe fallback to prevent crash
         return {"error": "Invalid JSON from LLM", "raw": content}
+
+    if cache is not None:
+        cache.put(key, model, result, time.perf_counter() - started)
+
+    return result
@@ -0,0 +1,155 @@
+
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from retrieval.context_block import ContextBlock
+
+
+# word n-gram size for alignment; shorter claims are never grounded
+# (one or two words appear somewhere in almost any chunk)
+SHINGLE_SIZE = 3
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class GroundingMatch:
+    """
+    Best local alignment of a claim inside one chunk.
+    """
+
+    score: float
+    start: int  # character span of the matched window in chunk_text
+    end: int
+
+
+def words(text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Lowercased words and their character offsets.
+    """
+
+    tokens, offsets = [], []
+    for m in WORD_PATTERN.finditer(text):
+        tokens.append(m.group().lower())
+        offsets.append(m.span())
+
+    return tokens, offsets
+
+
+class ShingleIndex:
+    """
+    Word shingles of one chunk: shingle -> word positions.
+    Built once per block; n-gram sizes are indexed on demand.
+    """
+
+    def __init__(self, text: str):
+        self.words, self.offsets = words(text)
+        self._positions: Dict[int, Dict[tuple, List[int]]] = {}
+
+    def positions(self, k: int) -> Dict[tuple, List[int]]:
+        table = self._positions.get(k)
+        if table is None:
+            table = defaultdict(list)
+            w = self.words
+            for i in range(len(w) - k + 1):
+                table[tuple(w[i:i + k])].append(i)
+            table = self._positions[k] = dict(table)
+        return table
+
+    def match(self, claim: str) -> Optional[GroundingMatch]:
+        """
+        Densest window of shared shingles, scored against that
+        window only; linear in claim length plus shingle hits.
+        """
+
+        claim_words, _ = words(claim)
+        if len(claim_words) < SHINGLE_SIZE or not self.words:
+            return None
+
+        k = SHINGLE_SIZE
+        shingles = [
+            tuple(claim_words[j:j + k]) for j in range(len(claim_words) - k + 1)
+        ]
+        table = self.positions(k)
+
+        # (chunk word position, claim shingle) for every shared shingle
+        hits = sorted(
+            (p, j)
+            for j, shingle in enumerate(shingles)
+            for p in table.get(shingle, ())
+        )
+        if not hits:
+            return None
+
+        # slide a window a bit wider than the claim over the hits and
+        # keep the one covering the most distinct claim shingles
+        width = len(claim_words) + max(2, len(claim_words) // 2)
+        inside = Counter()
+        best = (0, 0, 0)  # (distinct, first hit, last hit)
+        left = 0
+
+        for right, (p, j) in enumerate(hits):
+            inside[j] += 1
+            while p - hits[left][0] >= width:
+                lj = hits[left][1]
+                inside[lj] -= 1
+                if not inside[lj]:
+                    del inside[lj]
+                left += 1
+            if len(inside) > best[0]:
+                best = (len(inside), left, right)
+
+        distinct, first, last = best
+
+        # trim repeated shingles off the window edges
+        counts = Counter(j for _, j in hits[first:last + 1])
+        while counts[hits[first][1]] > 1:
+            counts[hits[first][1]] -= 1
+            first += 1
+        while counts[hits[last][1]] > 1:
+            counts[hits[last][1]] -= 1
+            last -= 1
+
+        lo = hits[first][0]
+        hi = hits[last][0] + k  # exclusive word position
+
+        # word containment over the window, widened by a shingle on each
+        # side so an edited first/last word still finds its neighbours
+        window = set(self.words[max(0, lo - k):hi + k])
+        claim_set = set(claim_words)
+        word_score = len(claim_set & window) / len(claim_set)
+        shingle_score = distinct / len(shingles)
+
+        return GroundingMatch(
+            score=(shingle_score + word_score) / 2,
+            start=self.offsets[lo][0],
+            end=self.offsets[hi - 1][1],
+        )
+
+
+class GroundingIndex:
+    """
+    Shingle indexes for a set of context blocks, built lazily
+    and reused across every claim that cites the same chunk.
+    """
+
+    def __init__(self, blocks: List[ContextBlock]):
+        self._blocks = {b.chunk_id: b for b in blocks}
+        self._indexes: Dict[str, ShingleIndex] = {}
+
+    def match(self, claim: str, chunk_id: str) -> Optional[GroundingMatch]:
+        index = self._indexes.get(chunk_id)
+        if index is None:
+            block = self._blocks.get(chunk_id)
+            if block is None:
+                return None
+            index = self._indexes[chunk_id] = ShingleIndex(block.chunk_text)
+
+        return index.match(claim)
+
+
+def grounding_score(claim: str, text: str) -> float:
+    match = ShingleIndex(text).match(claim)
+    return match.score if match else 0.0
@@ -0,0 +1,156 @@
+
+import json
+from dataclasses import dataclass
+from typing import Dict, List
+
+from retrieval.context_block import ContextBlock
+from retrieval.near_duplicates import similarity, simhash
+
+
+# budget for the user prompt (question + sources + context blocks)
+CONTEXT_TOKEN_BUDGET = 4000
+
+# no tokenizer dependency: ~4 characters per token for English/JSON
+CHARS_PER_TOKEN = 4
+
+# chunks at least this similar (SimHash) to a kept chunk are dropped
+CHUNK_DUP_THRESHOLD = 0.9
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass
+class PackedContext:
+    """
+    A packed reasoner prompt plus what packing did to get there.
+
+    Blocks are referenced by short aliases ("C1", ...) and sources
+    by "S1", ...; `aliases` maps block aliases back to chunk_ids.
+    `baseline_tokens` is the same blocks in the unpacked format,
+    so tokens_saved counts what the compact format saves.
+    """
+
+    user_prompt: str
+    blocks: List[ContextBlock]
+    aliases: Dict[str, str]
+    prompt_tokens: int
+    baseline_tokens: int
+    duplicates_dropped: int = 0
+    over_budget_dropped: int = 0
+
+    def stats(self) -> Dict:
+        return {
+            "blocks": len(self.blocks),
+            "duplicates_dropped": self.duplicates_dropped,
+            "over_budget_dropped": self.over_budget_dropped,
+            "prompt_tokens": self.prompt_tokens,
+            "baseline_tokens": self.baseline_tokens,
+            "tokens_saved": self.baseline_tokens - self.prompt_tokens,
+        }
+
+
+def baseline_prompt(query: str, blocks: List[ContextBlock]) -> str:
+    """
+    The unpacked prompt (the original build_prompt format):
+    metadata repeated per block, indented JSON.
+    """
+
+    return json.dumps({
+        "question": query,
+        "context_blocks": [
+            {
+                "chunk_id": b.chunk_id,
+                "evidence_id": b.evidence_id,
+                "source_url": b.source_url,
+                "text": b.chunk_text,
+            }
+            for b in blocks
+        ],
+    }, indent=2)
+
+
+def pack_context(
+    query: str,
+    blocks: List[ContextBlock],
+    token_budget: int = CONTEXT_TOKEN_BUDGET,
+    max_blocks: int = None,
+) -> PackedContext:
+    """
+    Greedy fill in retrieval (score) order: skip near-duplicates
+    of chunks already packed, skip blocks that would overflow the
+    budget, stop at max_blocks. Compact JSON, sources factored out.
+    """
+
+    sources: Dict[str, dict] = {}  # evidence_id -> source entry
+    entries = []
+    kept: List[ContextBlock] = []
+    fingerprints = []
+    duplicates = over_budget = 0
+
+    # fixed part: question and the JSON skeleton
+    used = estimate_tokens(
+        json.dumps({"question": query, "sources": [], "context_blocks": []}, **COMPACT)
+    )
+
+    for block in blocks:
+        if max_blocks is not None and len(kept) >= max_blocks:
+            break
+
+        fingerprint = simhash(block.chunk_text)
+        if fingerprint is not None and any(
+            similarity(fingerprint, other) >= CHUNK_DUP_THRESHOLD
+            for other in fingerprints
+        ):
+            duplicates += 1
+            continue
+
+        source = sources.get(block.evidence_id)
+        new_source = source is None
+        if new_source:
+            source = {
+                "id": f"S{len(sources) + 1}",
+                "evidence_id": block.evidence_id,
+                "url": block.source_url,
+            }
+
+        entry = {
+            "chunk_id": f"C{len(kept) + 1}",
+            "source": source["id"],
+            "text": block.chunk_text,
+        }
+
+        cost = estimate_tokens(json.dumps(entry, **COMPACT)) + 1
+        if new_source:
+            cost += estimate_tokens(json.dumps(source, **COMPACT)) + 1
+
+        if used + cost > token_budget:
+            over_budget += 1
+            continue
+
+        used += cost
+        if new_source:
+            sources[block.evidence_id] = source
+        entries.append(entry)
+        kept.append(block)
+        if fingerprint is not None:
+            fingerprints.append(fingerprint)
+
+    user_prompt = json.dumps({
+        "question": query,
+        "sources": list(sources.values()),
+        "context_blocks": entries,
+    }, **COMPACT)
+
+    return PackedContext(
+        user_prompt=user_prompt,
+        blocks=kept,
+        aliases={e["chunk_id"]: b.chunk_id for e, b in zip(entries, kept)},
+        prompt_tokens=estimate_tokens(user_prompt),
+        baseline_tokens=estimate_tokens(baseline_prompt(query, kept)),
+        duplicates_dropped=duplicates,
+        over_budget_dropped=over_budget,
+    )
@@ -1,39 +1,18 @@
 
-import json
-from typing import List
+from typing import List, Optional
 from retrieval.context_block import ContextBlock
 from llm.groq_client import call_llm
+from llm.packing import CONTEXT_TOKEN_BUDGET, pack_context
 from llm.schema import ANSWER_SCHEMA_DESCRIPTION
 from llm.verifier import verify_claims
 
 
-
-def build_prompt(query: str, blocks: List[ContextBlock]) -> tuple[str, str]:
-    """
-    Build deterministic structured prompt.
-    """
-
-    context_payload = []
-
-    for b in blocks:
-        context_payload.append({
-            "chunk_id": b.chunk_id,
-            "evidence_id": b.evidence_id, 
-            "source_url": b.source_url,
-            "text": b.chunk_text,
-        })
-
-    system_prompt = ANSWER_SCHEMA_DESCRIPTION
-
-    user_prompt = json.dumps({
-        "question": query,
-        "context_blocks": context_payload
-    }, indent=2)
-
-    return system_prompt, user_prompt
-
-
-def grounded_reason(query: str, blocks: List[ContextBlock]) -> dict:
+def grounded_reason(
+    query: str,
+    blocks: List[ContextBlock],
+    token_budget: int = CONTEXT_TOKEN_BUDGET,
+    max_blocks: Optional[int] = None,
+) -> dict:
 
     if not blocks:
         return {
@@ -41,9 +20,17 @@ def grounded_reason(query: str, blocks: List[ContextBlock]) -> dict:
             "claims": []
         }
 
-    system_prompt, user_prompt = build_prompt(query, blocks)
+    packed = pack_context(query, blocks, token_budget, max_blocks)
+
+    raw_result = call_llm(ANSWER_SCHEMA_DESCRIPTION, packed.user_prompt)
 
-    raw_result = call_llm(system_prompt, user_prompt)
+    # claims cite the short block aliases; map them back to chunk_ids
+    for claim in raw_result.get("claims", []):
+        chunk_id = claim.get("chunk_id")
+        if chunk_id in packed.aliases:
+            claim["chunk_id"] = packed.aliases[chunk_id]
 
-    return verify_claims(raw_result, blocks)
+    result = verify_claims(raw_result, packed.blocks)
+    result["packing"] = packed.stats()
 
+    return result
@@ -0,0 +1,170 @@
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+RESPONSE_CACHE_FILENAME = "llm_responses.sqlite3"
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+RESPONSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    latency REAL NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_by_last_used
+    ON responses (last_used);
+"""
+
+
+def response_key(model: str, system_prompt: str, user_prompt: str) -> str:
+    """
+    Content address of one deterministic (temperature 0) call.
+    """
+
+    digest = hashlib.sha256()
+    for part in (model, system_prompt, user_prompt):
+        encoded = part.encode("utf-8")
+        # length-prefixed, so part boundaries can't collide
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Disk-backed cache of parsed LLM responses.
+
+    - Keyed by hash of (model, system prompt, user prompt)
+    - Entries older than ttl_seconds are misses (and dropped)
+    - Least-recently-used entries evicted past max_bytes
+    - read_only: serve hits, never write (replays)
+
+    Tracks hits, misses, and the API latency the hits saved.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        read_only: bool = False,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.read_only = read_only
+
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+        self._lock = threading.Lock()
+
+        self.path = os.path.join(base_path, RESPONSE_CACHE_FILENAME)
+
+        if read_only:
+            # replays must not create or touch the cache
+            self.conn = None
+            if os.path.exists(self.path):
+                self.conn = sqlite3.connect(
+                    f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+                )
+            return
+
+        os.makedirs(base_path, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(RESPONSE_SCHEMA)
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = None
+            if self.conn is not None:
+                row = self.conn.execute(
+                    "SELECT response, latency, created_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+
+            now = time.time()
+            if row is not None and now - row[2] > self.ttl_seconds:
+                if not self.read_only:
+                    with self.conn:
+                        self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.saved_seconds += row[1]
+
+            if not self.read_only:
+                with self.conn:
+                    self.conn.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?",
+                        (now, key),
+                    )
+
+        return json.loads(row[0])
+
+    def put(self, key: str, model: str, response: dict, latency: float) -> None:
+        if self.read_only:
+            return
+
+        payload = json.dumps(response)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, model, payload, latency, size, now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        # caller holds the lock and an open transaction
+        self.conn.execute(
+            "DELETE FROM responses WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+
+        total = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self.conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall():
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+    def stats(self) -> Dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "saved_seconds": round(self.saved_seconds, 3),
+        }
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
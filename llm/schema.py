@@ -17,6 +17,7 @@ Rules:
 - Do NOT invent chunk_id.
 - Only use chunk_ids provided in context.
 - Every claim must cite a valid chunk_id.
+- Each context block names its source by id; see "sources" for its evidence_id and url.
 - If insufficient evidence, return:
 
 {
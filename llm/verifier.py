@@ -1,7 +1,7 @@
 
 from typing import List, Dict
 from retrieval.context_block import ContextBlock
-from difflib import SequenceMatcher
+from llm.grounding import GroundingIndex, grounding_score
 
 
 SIMILARITY_THRESHOLD = 0.82
@@ -16,6 +16,7 @@ def verify_claims(
     """
 
     valid_chunk_ids = {b.chunk_id: b for b in context_blocks}
+    grounding = GroundingIndex(context_blocks)
 
     verified_claims = []
     conflicts = []
@@ -30,7 +31,8 @@ def verify_claims(
 
         block = valid_chunk_ids[chunk_id]
 
-        similarity = similarity_score(statement, block.chunk_text)
+        match = grounding.match(statement or "", chunk_id)
+        similarity = match.score if match else 0.0
 
         if similarity < SIMILARITY_THRESHOLD:
             continue  # reject weak grounding
@@ -40,6 +42,8 @@ def verify_claims(
             "chunk_id": chunk_id,
             "evidence_id": block.evidence_id,
             "similarity_score": round(similarity, 4),
+            # matched window in the chunk text, [start, end)
+            "span": [match.start, match.end],
         })
 
     if not verified_claims:
@@ -62,9 +66,10 @@ def verify_claims(
 
 def similarity_score(a: str, b: str) -> float:
     """
-    Deterministic normalized similarity.
+    Deterministic grounding score of claim `a` in text `b`,
+    against the best-matching local window of `b`.
     """
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    return grounding_score(a, b)
 
 
 def compute_confidence(claims: List[Dict]) -> float:
@@ -1,11 +1,7 @@
 
 import argparse
-from tools.http.client import HttpClient
-from tools.http.timeouts import TimeoutConfig
-from tools.crawl.robots import RobotsPolicy
-from evidence.store import EvidenceStore
-from orchestrator.execution_context import ExecutionContext
-from orchestrator.research_agent import ResearchAgent
+
+from llm.response_cache import DEFAULT_TTL_SECONDS
 
 
 def main():
@@ -18,29 +14,277 @@ def main():
         required=True,
         help="Research goal for the agent"
     )
+    parser.add_argument(
+        "--blob-backend",
+        choices=["files", "segments"],
+        default=None,
+        help="Blob layout (default: segments if already migrated, else files)"
+    )
+    parser.add_argument(
+        "--metadata-backend",
+        choices=["files", "catalog"],
+        default=None,
+        help="Metadata layout (default: catalog if present, else files)"
+    )
+    parser.add_argument(
+        "--durability",
+        choices=["sync", "group"],
+        default="sync",
+        help="fsync every evidence write, or batch them (group commit)"
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["none", "zlib", "lzma"],
+        default="none",
+        help="Compress stored blobs at rest (chosen per content type and size)"
+    )
+    parser.add_argument(
+        "--near-dup-threshold",
+        type=float,
+        default=None,
+        help="SimHash similarity (0-1] at which a page counts as a near-duplicate"
+    )
+    parser.add_argument(
+        "--near-dup-mode",
+        choices=["mark", "skip"],
+        default="mark",
+        help="Store and annotate near-duplicates, or skip them"
+    )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=None,
+        help="Processes for bulk HTML cleaning when (re)building the index (default: CPU count)"
+    )
+    parser.add_argument(
+        "--ingest-workers",
+        type=int,
+        default=2,
+        help="Background workers for integrity gating and indexing"
+    )
+    parser.add_argument(
+        "--llm-cache",
+        choices=["on", "read-only", "off"],
+        default="on",
+        help="Cache LLM responses on disk; read-only replays without writing"
+    )
+    parser.add_argument(
+        "--llm-cache-ttl",
+        type=float,
+        default=DEFAULT_TTL_SECONDS,
+        help="Seconds a cached LLM response stays valid"
+    )
+    parser.add_argument(
+        "--http-transport",
+        choices=["close", "pooled"],
+        default="close",
+        help="New connection per request, or keep-alive pools reused per host"
+    )
+    parser.add_argument(
+        "--http-pool-size",
+        type=int,
+        default=4,
+        help="Kept-alive connections per host (pooled transport)"
+    )
+    parser.add_argument(
+        "--http-pool-hosts",
+        type=int,
+        default=16,
+        help="Hosts whose connection pool is kept (pooled transport)"
+    )
+    parser.add_argument(
+        "--http-cache",
+        choices=["on", "off"],
+        default=None,
+        help="Revalidate stored evidence (ETag/Last-Modified, Cache-Control) instead of "
+             "re-downloading (default: on with the metadata catalog, which indexes URLs)"
+    )
+    parser.add_argument(
+        "--scorer",
+        choices=["index", "overlap", "bm25"],
+        default="index",
+        help="Context ranking: the chunk index, or a scan of accepted evidence "
+             "scored by term overlap or BM25 (needs numpy)"
+    )
+    parser.add_argument(
+        "--content-types",
+        choices=["all", "text"],
+        default="all",
+        help="Page bodies to download: any Content-Type, or only HTML/XML/plain "
+             "text (others are rejected from their headers, before the body)"
+    )
+    parser.add_argument(
+        "--search-fetch",
+        type=int,
+        default=2,
+        help="Search results fetched (concurrently) per SEARCH step"
+    )
+    parser.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=8,
+        help="Max concurrent page fetches"
+    )
+    parser.add_argument(
+        "--fetch-per-host",
+        type=int,
+        default=2,
+        help="Max concurrent page fetches per host"
+    )
+    parser.add_argument(
+        "--fetch-retries",
+        type=int,
+        default=3,
+        help="Retries per URL after transient failures (5xx, 429, network, deadline)"
+    )
+    parser.add_argument(
+        "--retry-max-delay",
+        type=float,
+        default=30.0,
+        help="Backoff cap in seconds; a longer Retry-After gives up on the URL"
+    )
     args = parser.parse_args()
 
+    # imported after argument parsing, so --help (and importing this
+    # module) doesn't load requests, lxml, numpy or the LLM client
+    from tools.http.client import TEXT_CONTENT_TYPES, HttpClient
+    from tools.http.timeouts import TimeoutConfig
+    from tools.http.pool import PoolConfig
+    from tools.http.cache import HttpCache
+    from tools.crawl.robots import RobotsPolicy
+    from tools.crawl.async_fetch import AsyncFetcher
+    from evidence.codecs import CompressionPolicy
+    from evidence.store import EvidenceStore
+    from evidence.catalog import EvidenceCatalog
+    from llm.groq_client import set_response_cache
+    from llm.response_cache import ResponseCache
+    from retrieval.derived_cache import DerivedCache
+    from retrieval.index import ChunkIndex
+    from retrieval.near_duplicates import NearDuplicateIndex
+    from retrieval.retriever import rebuild_index
+    from orchestrator.execution_context import ExecutionContext
+    from orchestrator.ingest import IngestPipeline
+    from orchestrator.research_agent import ResearchAgent
+    from orchestrator.retry_scheduler import BackoffConfig, RetryScheduler
+    from orchestrator.task import TaskOrchestrator
+
     # ---- core infrastructure setup ----
     ctx = ExecutionContext()
-    http = HttpClient(TimeoutConfig())
+    pool = None
+    if args.http_transport == "pooled":
+        pool = PoolConfig(
+            pool_connections=args.http_pool_hosts,
+            pool_maxsize=args.http_pool_size,
+        )
+    http = HttpClient(
+        TimeoutConfig(),
+        pool=pool,
+        content_types=TEXT_CONTENT_TYPES if args.content_types == "text" else None,
+    )
     robots = RobotsPolicy(http)
-    evidence = EvidenceStore("./evidence_data")
+    index = ChunkIndex("./evidence_data", cache=DerivedCache("./evidence_data"))
+    evidence = EvidenceStore(
+        "./evidence_data",
+        index=index,
+        blob_backend=args.blob_backend,
+        metadata_backend=args.metadata_backend,
+        durability=args.durability,
+        compression=(
+            None if args.compress == "none"
+            else CompressionPolicy(default_codec=args.compress)
+        ),
+    )
+
+    # page fetches go through the evidence-backed cache; robots.txt
+    # isn't stored as evidence, so it uses the client directly.
+    # Per-file metadata has no URL index (a lookup reads every
+    # meta/*.json), so the cache is opt-in there.
+    use_http_cache = args.http_cache == "on" or (
+        args.http_cache is None and isinstance(evidence.meta, EvidenceCatalog)
+    )
+    fetch_http = http
+    http_cache = None
+    if use_http_cache:
+        fetch_http = http_cache = HttpCache(http, evidence)
+
+    if index.created:
+        rebuild_index(index, "./evidence_data", workers=args.extract_workers)
+
+    near_duplicates = None
+    if args.near_dup_threshold is not None:
+        near_duplicates = NearDuplicateIndex(
+            "./evidence_data", threshold=args.near_dup_threshold
+        )
+
+    ingest = IngestPipeline(evidence, workers=args.ingest_workers)
+
+    llm_cache = None
+    if args.llm_cache != "off":
+        llm_cache = ResponseCache(
+            "./evidence_data",
+            ttl_seconds=args.llm_cache_ttl,
+            read_only=args.llm_cache == "read-only",
+        )
+        set_response_cache(llm_cache)
 
     # ---- initialize research agent ----
     agent = ResearchAgent(
         goal=args.goal,
         execution_context=ctx,
-        http_client=http,
+        http_client=fetch_http,
         robots_policy=robots,
         evidence_store=evidence,
+        near_duplicates=near_duplicates,
+        near_duplicate_mode=args.near_dup_mode,
+        ingest=ingest,
+        fetcher=AsyncFetcher(
+            fetch_http,
+            robots,
+            max_concurrency=args.fetch_concurrency,
+            max_per_host=args.fetch_per_host,
+            spool_dir=evidence.spool_path,
+        ),
+        search_fetch_count=args.search_fetch,
+        scorer=args.scorer,
+        extract_workers=args.extract_workers,
+        retries=RetryScheduler(
+            TaskOrchestrator(ctx),
+            BackoffConfig(
+                max_delay=args.retry_max_delay,
+                max_attempts=args.fetch_retries,
+            ),
+        ),
     )
 
     # ---- run agent loop ----
     result = agent.run()
+    ingest.close()
+
+    http.close()
+
+    # make any batched evidence writes durable before exiting
+    evidence.close()
 
     print("\n=== AGENT HALTED ===")
     print("Reason:", result.get("halt_reason"))
     print("Steps taken:", result.get("steps_taken"))
+    print("Prompt tokens saved by packing (vs. the same blocks unpacked):", result.get("prompt_tokens_saved", 0))
+
+    if http_cache is not None:
+        stats = http_cache.stats()
+        print(
+            f"HTTP cache: {stats['hit_ratio']:.0%} hit ratio "
+            f"({stats['fresh']} fresh, {stats['revalidated']} revalidated, "
+            f"{stats['misses']} misses), {stats['bytes_saved']} bytes saved"
+        )
+
+    if llm_cache is not None:
+        stats = llm_cache.stats()
+        print(
+            f"LLM cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['saved_seconds']:.1f}s of API latency saved"
+        )
+        llm_cache.close()
 
 
 if __name__ == "__main__":
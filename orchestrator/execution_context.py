@@ -8,6 +8,7 @@ from typing import Dict
 
 class FailureClass(str, Enum):
     NETWORK = "network"
+    DEADLINE = "deadline"
     RATE_LIMIT = "rate_limit"
     SERVER_ERROR = "server_error"
     CLIENT_ERROR = "client_error"
@@ -0,0 +1,128 @@
+# orchestrator/ingest.py
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+from evidence.lifecycle import EvidenceState
+from orchestrator.integrity_integration import integrate_integrity
+from validators.integrity import IntegrityEvaluator, IntegrityResult
+
+
+@dataclass
+class IngestResult:
+    evidence_id: str
+    state: Optional[EvidenceState] = None
+    decision: Optional[str] = None
+    integrity_score: Optional[float] = None
+    error: Optional[str] = None
+
+
+class IngestPipeline:
+    """
+    Post-fetch ingest stage, off the agent's main thread.
+
+    For each stored evidence_id a worker:
+    - evaluates integrity (or reuses the result computed while streaming)
+    - appends the integrity envelope
+    - writes lifecycle state, which indexes (pre-cleans) accepted text
+
+    The queue is bounded, so a slow ingest back-pressures fetching.
+    Results are handed back via drain(); wait() blocks only while
+    items are still in flight.
+    """
+
+    def __init__(self, evidence_store, workers: int = 2, max_pending: int = 32):
+        self.evidence = evidence_store
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._results: queue.Queue = queue.Queue()
+
+        self._in_flight = 0
+        self._idle = threading.Condition()
+
+        self._workers = [
+            threading.Thread(target=self._run, name=f"ingest-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    # --------------------------------------------------
+    # Producer side (agent thread)
+    # --------------------------------------------------
+
+    def submit(self, evidence_id: str, integrity: IntegrityResult = None) -> None:
+        with self._idle:
+            self._in_flight += 1
+        self._queue.put((evidence_id, integrity))
+
+    def in_flight(self) -> int:
+        with self._idle:
+            return self._in_flight
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Block until every submitted item has been ingested.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def drain(self) -> List[IngestResult]:
+        """
+        Finished results since the last drain (non-blocking).
+        """
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def close(self) -> None:
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
+    # --------------------------------------------------
+    # Workers
+    # --------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            evidence_id, integrity = item
+            try:
+                result = self._ingest(evidence_id, integrity)
+            except Exception as e:
+                result = IngestResult(evidence_id, error=str(e))
+
+            self._results.put(result)
+
+            with self._idle:
+                self._in_flight -= 1
+                if self._in_flight == 0:
+                    self._idle.notify_all()
+
+    def _ingest(self, evidence_id: str, integrity: IntegrityResult) -> IngestResult:
+        if integrity is None:
+            integrity = IntegrityEvaluator.evaluate(
+                self.evidence.read_blob(evidence_id)
+            )
+
+        state, envelope = integrate_integrity(evidence_id, integrity)
+
+        self.evidence.append_envelope(evidence_id, envelope.to_dict())
+        self.evidence.write_state(evidence_id, state)
+
+        return IngestResult(
+            evidence_id=evidence_id,
+            state=state,
+            decision=envelope.decision,
+            integrity_score=envelope.integrity_score,
+        )
@@ -0,0 +1,148 @@
+# orchestrator/reevaluate.py
+#
+# Re-score stored evidence after IntegrityEvaluator changes.
+#
+# Usage:
+#   python -m orchestrator.reevaluate ./evidence_data [--workers 4] [--batch-size 256]
+#
+# Picks up evidence never judged, or last judged by a validator
+# version other than VALIDATOR_VERSION. Each finished batch is
+# committed with a current envelope, so an interrupted run simply
+# resumes with whatever is still stale.
+
+import argparse
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Tuple
+
+from evidence.codecs import iter_decoded
+from evidence.store import EvidenceStore
+from orchestrator.integrity_integration import integrate_integrity
+from retrieval.index import ChunkIndex
+from retrieval.retriever import rebuild_index
+from validators.integrity import VALIDATOR_VERSION, IntegrityAccumulator, IntegrityResult
+
+
+READ_CHUNK_BYTES = 1024 * 1024
+
+# (evidence_id, file, offset, length)
+BlobLocation = Tuple[str, str, int, int]
+
+
+def evaluate_location(location: BlobLocation) -> Tuple[str, IntegrityResult]:
+    """
+    Worker: map the blob's file and feed it to the evaluator in
+    chunks. Only the current chunk is ever paged in or decompressed.
+    """
+
+    evidence_id, path, offset, length = location
+    accumulator = IntegrityAccumulator()
+
+    if length:
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            view = memoryview(mapped)[offset:offset + length]
+            try:
+                for chunk in iter_decoded(view, READ_CHUNK_BYTES):
+                    accumulator.update(chunk)
+                    del chunk
+            finally:
+                view.release()
+
+    return evidence_id, accumulator.result()
+
+
+def _batches(items: List, size: int) -> Iterator[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def reevaluate(
+    store: EvidenceStore,
+    workers: int = None,
+    batch_size: int = 256,
+    progress=None,
+) -> dict:
+    """
+    Re-judge every stale evidence item.
+    Returns counts of decisions made.
+    """
+
+    stale = store.meta.stale_ids(VALIDATOR_VERSION)
+    totals = {"stale": len(stale), "ALLOW": 0, "QUARANTINE": 0, "missing_blob": 0}
+
+    if not stale:
+        return totals
+
+    started = time.monotonic()
+    done = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch in _batches(stale, batch_size):
+            locations = []
+            for evidence_id in batch:
+                try:
+                    locations.append((evidence_id, *store.blobs.locate(evidence_id)))
+                except (KeyError, FileNotFoundError):
+                    totals["missing_blob"] += 1
+
+            judgments = []
+            for evidence_id, integrity in pool.map(
+                evaluate_location, locations, chunksize=16
+            ):
+                state, envelope = integrate_integrity(evidence_id, integrity)
+                judgments.append((evidence_id, state, envelope.to_dict()))
+                totals[envelope.decision] += 1
+
+            store.write_judgments(judgments)
+
+            done += len(batch)
+            if progress is not None:
+                progress(done, len(stale), time.monotonic() - started)
+
+    return totals
+
+
+def _print_progress(done: int, total: int, elapsed: float) -> None:
+    rate = done / elapsed if elapsed else 0.0
+    print(
+        f"\r[reevaluate] {done}/{total} ({rate:.0f} blobs/s)",
+        end="", file=sys.stderr, flush=True,
+    )
+    if done == total:
+        print(file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=f"Re-score stored evidence with {VALIDATOR_VERSION}"
+    )
+    parser.add_argument("base_path", help="Evidence directory, e.g. ./evidence_data")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    index = ChunkIndex(args.base_path)
+    store = EvidenceStore(args.base_path, index=index)
+
+    if index.created:
+        rebuild_index(index, args.base_path, workers=args.workers)
+
+    totals = reevaluate(
+        store,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        progress=_print_progress,
+    )
+
+    print("Validator:", VALIDATOR_VERSION)
+    for key, value in totals.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,22 @@
 # orchestrator/research_agent.py
 
+import asyncio
 from typing import Set, Dict, List
 
 from orchestrator.goal_state import GoalState
 from orchestrator.planner import plan_next_action
 from orchestrator.action_types import ActionType
 from tools.crawl.fetch_page import fetch_page
+from tools.crawl.async_fetch import AsyncFetcher
 from orchestrator.failure_event import FailureEvent
-from retrieval.retriever import retrieve_context
+from retrieval.retriever import MAX_CONTEXT_BLOCKS, retrieve_context
 from llm.reasoner import grounded_reason
 from tools.search.duckduckgo_search import search_duckduckgo
+from evidence.spool import SpooledBlob
+from retrieval.near_duplicates import fingerprint_html, fingerprint_spooled
+from orchestrator.ingest import IngestPipeline
+from orchestrator.retry_scheduler import RetryScheduler
+from orchestrator.task import TaskOrchestrator
 
 
 class ResearchAgent:
@@ -21,12 +28,44 @@ class ResearchAgent:
         http_client,
         robots_policy,
         evidence_store,
+        near_duplicates=None,
+        near_duplicate_mode: str = "mark",
+        ingest=None,
+        fetcher=None,
+        search_fetch_count: int = 2,
+        retries: RetryScheduler = None,
+        scorer: str = "index",
+        extract_workers: int = 1,
     ):
         self.ctx = execution_context
         self.http = http_client
         self.robots = robots_policy
         self.evidence = evidence_store
 
+        # optional NearDuplicateIndex; "mark" stores and annotates,
+        # "skip" drops pages near-identical to stored evidence
+        self.near_duplicates = near_duplicates
+        self.near_duplicate_mode = near_duplicate_mode
+
+        # integrity gating + indexing run in the background
+        self.ingest = ingest or IngestPipeline(evidence_store)
+
+        # search results are fetched concurrently: the first
+        # search_fetch_count of them per SEARCH
+        self.fetcher = fetcher or AsyncFetcher(
+            http_client, robots_policy, spool_dir=evidence_store.spool_path
+        )
+        self.search_fetch_count = search_fetch_count
+
+        # transient fetch failures wait in a delay queue and are
+        # retried between steps, without blocking other fetches
+        self.retries = retries or RetryScheduler(TaskOrchestrator(execution_context))
+
+        # "index" answers from the chunk index; "overlap"/"bm25"
+        # scan accepted evidence and rank with that scorer
+        self.scorer = scorer
+        self.extract_workers = extract_workers
+
         self.state = GoalState(
             goal=goal,
             requirements=[goal],  # Placeholder ECC (expand later)
@@ -39,6 +78,9 @@ class ResearchAgent:
         self.no_progress_steps = 0
         self.reason_attempted = False
 
+        # prompt tokens saved by context packing, over all REASON steps
+        self.prompt_tokens_saved = 0
+
     # --------------------------------------------------
     # Build Planner State Map (No Raw Text)
     # --------------------------------------------------
@@ -81,9 +123,24 @@ class ResearchAgent:
             self.no_progress_steps += 1
             return
 
-        # Progressive fetch: first 2 results
-        for url in urls[:2]:
-            self.execute_fetch(url)
+        # Progressive fetch: the top results, concurrently
+        pending = []
+        for url in urls[:self.search_fetch_count]:
+            if url in self.visited_urls:
+                print("⚠️ URL already visited, blocked")
+                self.no_progress_steps += 1
+                continue
+            self.visited_urls.add(url)
+            print(f"🌐 FETCH: {url}")
+            pending.append(url)
+
+        if not pending:
+            return
+
+        results = asyncio.run(self.fetcher.fetch_many(pending))
+
+        for url, result in zip(pending, results):
+            self.store_fetched(url, result)
 
     # --------------------------------------------------
     # FETCH
@@ -103,10 +160,53 @@ class ResearchAgent:
 
         print(f"🌐 FETCH: {url}")
 
-        result = fetch_page(url, self.http, self.robots)
+        # stream the body to disk instead of buffering it whole
+        result = fetch_page(
+            url, self.http, self.robots, spool_dir=self.evidence.spool_path
+        )
+
+        self.store_fetched(url, result)
+
+    def execute_retries(self):
+        """
+        Refetch, concurrently, every URL whose retry is due.
+        """
+
+        urls = self.retries.due()
+        if not urls:
+            return
+
+        for url in urls:
+            print(f"🔁 RETRY: {url}")
+
+        results = asyncio.run(self.fetcher.fetch_many(urls))
+
+        for url, result in zip(urls, results):
+            self.store_fetched(url, result)
+
+    def store_fetched(self, url: str, result):
+        """
+        Store one fetch_page result (or report its failure).
+        """
 
         if isinstance(result, FailureEvent):
             print("❌ Fetch failed:", result.message)
+
+            delay = self.retries.schedule(url, result)
+            if delay is not None:
+                print(f"🔁 Retry scheduled in {delay:.1f}s")
+                return
+
+            self.no_progress_steps += 1
+            return
+
+        fingerprint, duplicate_of = self.check_near_duplicate(result)
+
+        if duplicate_of and self.near_duplicate_mode == "skip":
+            print(f"⚠️ Near-duplicate of {duplicate_of[0]} "
+                  f"(similarity {duplicate_of[1]:.2f}), skipped")
+            if isinstance(result["body"], SpooledBlob):
+                result["body"].discard()
             self.no_progress_steps += 1
             return
 
@@ -115,14 +215,74 @@ class ResearchAgent:
 
         print("✅ Evidence stored:", evidence_id)
 
-        self.state.evidence_summary.append({
+        summary = {
             "evidence_id": evidence_id,
             "source_url": url,
-        })
+        }
+
+        if duplicate_of and duplicate_of[0] != evidence_id:
+            print(f"⚠️ Near-duplicate of {duplicate_of[0]} "
+                  f"(similarity {duplicate_of[1]:.2f})")
+            summary["near_duplicate_of"] = duplicate_of[0]
+
+        if fingerprint is not None:
+            self.near_duplicates.add(evidence_id, fingerprint)
+
+        self.state.evidence_summary.append(summary)
+
+        # already judged (identical body fetched before): nothing to ingest
+        known_state = self.evidence.read_state(evidence_id)
+        if known_state is None:
+            self.ingest.submit(evidence_id, result.get("integrity"))
+        else:
+            summary["state"] = known_state
 
         # Progress made
         self.no_progress_steps = 0
 
+    def check_near_duplicate(self, result: Dict):
+        """
+        (fingerprint, (evidence_id, similarity) | None) for a fetched page.
+        """
+
+        if self.near_duplicates is None:
+            return None, None
+
+        body = result["body"]
+        if isinstance(body, SpooledBlob):
+            # never pull the spooled body into memory whole
+            fingerprint = fingerprint_spooled(body)
+        else:
+            fingerprint = fingerprint_html(body)
+        if fingerprint is None:
+            return None, None
+
+        return fingerprint, self.near_duplicates.find(fingerprint)
+
+    # --------------------------------------------------
+    # INGEST (results from the background stage)
+    # --------------------------------------------------
+
+    def collect_ingest(self):
+        """
+        Apply finished ingest results on the agent thread,
+        the only writer of the execution context.
+        """
+
+        for result in self.ingest.drain():
+            if result.error:
+                print(f"❌ Ingest failed for {result.evidence_id}:", result.error)
+                continue
+
+            for summary in self.state.evidence_summary:
+                if summary["evidence_id"] == result.evidence_id:
+                    summary["state"] = result.state.value
+
+            if result.decision == "QUARANTINE":
+                self.ctx.record_quarantine()
+                print(f"⚠️ Quarantined {result.evidence_id} "
+                      f"(integrity {result.integrity_score})")
+
     # --------------------------------------------------
     # REASON
     # --------------------------------------------------
@@ -131,17 +291,46 @@ class ResearchAgent:
 
         print("🧠 REASONING...")
 
-        blocks = retrieve_context(
-            query=self.state.goal,
-            base_path="./evidence_data"
-        )
+        # only accepted evidence is retrievable: let in-flight items land
+        self.ingest.wait()
+        self.collect_ingest()
+
+        # over-fetch: packing drops near-duplicate chunks, and the
+        # next candidates take their slots
+        if self.scorer == "index":
+            blocks = retrieve_context(
+                query=self.state.goal,
+                base_path="./evidence_data",
+                index=self.evidence.index,
+                k=2 * MAX_CONTEXT_BLOCKS,
+            )
+        else:
+            index = self.evidence.index
+            blocks = retrieve_context(
+                query=self.state.goal,
+                base_path="./evidence_data",
+                cache=index.cache if index is not None else None,
+                workers=self.extract_workers,
+                scorer=self.scorer,
+                k=2 * MAX_CONTEXT_BLOCKS,
+            )
 
         if not blocks:
             print("⚠️ No usable context")
             self.no_progress_steps += 1
             return
 
-        result = grounded_reason(self.state.goal, blocks)
+        result = grounded_reason(
+            self.state.goal, blocks, max_blocks=MAX_CONTEXT_BLOCKS
+        )
+
+        packing = result.get("packing")
+        if packing:
+            self.prompt_tokens_saved += packing["tokens_saved"]
+            print(f"📦 Context: {packing['blocks']} blocks, "
+                  f"~{packing['prompt_tokens']} tokens "
+                  f"(~{packing['tokens_saved']} fewer than the same blocks unpacked, "
+                  f"{packing['duplicates_dropped']} near-duplicates dropped)")
 
         confidence = result.get("confidence", 0.0)
 
@@ -183,6 +372,8 @@ class ResearchAgent:
                 self.state.halt_reason = "MAX_STEPS_REACHED"
                 break
 
+            self.execute_retries()
+
             state_map = self.build_state_map()
 
             # --------------------------------------------------
@@ -226,13 +417,22 @@ class ResearchAgent:
 
             self.state.increment_step()
 
+            self.collect_ingest()
+
             self.check_stagnation()
 
+        self.ingest.wait()
+        self.collect_ingest()
+
         print("\n=== AGENT HALTED ===")
         print("Reason:", self.state.halt_reason)
         print("Steps:", self.state.step_count)
+        print("Fetch retries:", self.ctx.retry_count_total)
+        if len(self.retries):
+            print(f"⚠️ {len(self.retries)} queued retries abandoned")
 
         return {
             "halt_reason": self.state.halt_reason,
             "steps_taken": self.state.step_count,
+            "prompt_tokens_saved": self.prompt_tokens_saved,
         }
@@ -5,6 +5,14 @@ from orchestrator.execution_context import ExecutionContext, FailureClass
 from orchestrator.failure_event import FailureEvent
 
 
+# failures a later attempt may not repeat
+TRANSIENT = (
+    FailureClass.NETWORK,
+    FailureClass.DEADLINE,
+    FailureClass.SERVER_ERROR,
+)
+
+
 class RetryDecision(str, Enum):
     RETRY_NOW = "retry_now"
     RETRY_BACKOFF = "retry_backoff"
@@ -34,11 +42,8 @@ class RetryPolicy:
                 return RetryDecision.HALT_TASK
             return RetryDecision.RETRY_BACKOFF
 
-        # ---- server/network errors ----
-        if failure.failure_class in (
-            FailureClass.NETWORK,
-            FailureClass.SERVER_ERROR,
-        ):
+        # ---- server/network errors, fetches cut off at the deadline ----
+        if failure.failure_class in TRANSIENT:
             return RetryDecision.RETRY_BACKOFF
 
         # ---- client errors (401/403/404 etc.) ----
@@ -0,0 +1,142 @@
+# orchestrator/retry_scheduler.py
+
+import heapq
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from orchestrator.execution_context import FailureClass
+from orchestrator.failure_event import FailureEvent
+from orchestrator.retry_policy import TRANSIENT, RetryDecision
+from orchestrator.task import TaskOrchestrator
+
+
+@dataclass(frozen=True)
+class BackoffConfig:
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    max_attempts: int = 3  # retries per URL
+
+    def delay(self, attempt: int, rng: random.Random) -> float:
+        # "full jitter": uniform over [0, capped exponential backoff],
+        # so retries of many URLs don't land in lockstep
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return rng.uniform(0.0, ceiling)
+
+
+class RetryScheduler:
+    """
+    Time-ordered delay queue of fetch retries.
+
+    Transient and rate-limit failures go through TaskOrchestrator:
+    RetryPolicy decides, and retries are charged to the
+    ExecutionContext. Anything else is simply not retried.
+    Retries wait in a heap keyed by due time instead of sleeping;
+    the agent takes due() URLs between steps. A host that asked
+    to back off (429, Retry-After) holds back all of its queued
+    URLs, while other hosts' retries go ahead.
+    """
+
+    def __init__(
+        self,
+        orchestrator: TaskOrchestrator,
+        config: BackoffConfig = None,
+        clock=time.monotonic,
+        rng: random.Random = None,
+    ):
+        self.orchestrator = orchestrator
+        self.config = config or BackoffConfig()
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        self._queue = []  # (due, seq, url)
+        self._seq = itertools.count()
+        self._attempts: Dict[str, int] = {}
+        self._host_ready: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def schedule(self, url: str, failure: FailureEvent) -> Optional[float]:
+        """
+        Park url for a retry after failure.
+        Seconds until it is due, or None if it won't be retried.
+        """
+
+        # content rejections, 4xx: not retried, and not charged to the
+        # context (handle_failure would spend quarantine budget on them)
+        if not (
+            failure.failure_class in TRANSIENT
+            or failure.failure_class == FailureClass.RATE_LIMIT
+        ):
+            return None
+
+        attempt = self._attempts.get(url, 0) + 1
+        if attempt > self.config.max_attempts:
+            return None
+
+        retry_after = failure.retry_after_seconds
+        if retry_after is not None and retry_after > self.config.max_delay:
+            # the host won't take us back within our backoff budget
+            return None
+
+        decision = self.orchestrator.handle_failure(failure)
+        if decision not in (RetryDecision.RETRY_NOW, RetryDecision.RETRY_BACKOFF):
+            return None
+
+        self._attempts[url] = attempt
+
+        delay = 0.0
+        if decision == RetryDecision.RETRY_BACKOFF:
+            delay = self.config.delay(attempt, self.rng)
+        if retry_after is not None:
+            delay = max(delay, float(retry_after))
+
+        now = self.clock()
+        due = now + delay
+
+        # rate limiting applies to the whole host
+        if retry_after is not None or failure.failure_class == FailureClass.RATE_LIMIT:
+            host = _host(url)
+            self._host_ready[host] = max(self._host_ready.get(host, 0.0), due)
+
+        heapq.heappush(self._queue, (due, next(self._seq), url))
+        return delay
+
+    def due(self) -> List[str]:
+        """
+        Pop every URL whose retry is due and whose host isn't
+        backing off; never waits.
+        """
+
+        now = self.clock()
+        ready, held = [], []
+
+        while self._queue and self._queue[0][0] <= now:
+            _, seq, url = heapq.heappop(self._queue)
+
+            host_ready = self._host_ready.get(_host(url), 0.0)
+            if host_ready > now:
+                held.append((host_ready, seq, url))
+            else:
+                ready.append(url)
+
+        for entry in held:
+            heapq.heappush(self._queue, entry)
+
+        return ready
+
+    def next_due(self) -> Optional[float]:
+        """
+        Seconds until the earliest queued retry (0 if overdue).
+        """
+        if not self._queue:
+            return None
+        return max(0.0, self._queue[0][0] - self.clock())
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc
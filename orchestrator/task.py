@@ -7,7 +7,8 @@ from orchestrator.retry_policy import RetryPolicy, RetryDecision
 
 class TaskOrchestrator:
     """
-    Demonstrates how ExecutionContext + RetryPolicy interact.
+    Applies RetryPolicy to a failure and charges the
+    ExecutionContext (retries, quarantines) for the decision.
     """
 
     def __init__(self, ctx: ExecutionContext):
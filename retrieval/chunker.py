@@ -1,46 +1,113 @@
-
 import hashlib
+from array import array
 from typing import List
 
 
 MAX_CHUNK_CHARS = 1200  # deterministic limit
 
+# bump when the splitting rules change (MAX_CHUNK_CHARS is keyed separately)
+CHUNKER_VERSION = "paragraph_v1"
 
-def deterministic_chunk(text: str) -> List[str]:
+PARAGRAPH_SEP = "\n\n"
+
+
+class ChunkSpan:
     """
-    Structure-aware deterministic chunking.
-    Splits on paragraph boundaries, caps size.
+    One chunk as a (start, end) reference into a normalized
+    text buffer; the chunk text is only copied out by text().
     """
 
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-    chunks = []
-    current = ""
+    __slots__ = ("evidence_id", "buffer", "start", "end")
+
+    def __init__(self, evidence_id: str, buffer: str, start: int, end: int):
+        self.evidence_id = evidence_id
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def text(self) -> str:
+        return self.buffer[self.start:self.end]
+
+
+def normalize_paragraphs(text: str) -> str:
+    """
+    Stripped, non-empty paragraphs joined by a single separator.
+    Every chunk is a contiguous slice of this form.
+    """
+    return PARAGRAPH_SEP.join(
+        p.strip() for p in text.split(PARAGRAPH_SEP) if p.strip()
+    )
+
+
+def chunk_spans(normalized: str) -> array:
+    """
+    Chunk boundaries over normalize_paragraphs() output,
+    as flat (start, end, start, end, ...) offsets.
+
+    Same splitting rules as deterministic_chunk: packs whole
+    paragraphs up to MAX_CHUNK_CHARS, hard-splits oversized ones.
+    """
+
+    bounds = array("I")
+    if not normalized:
+        return bounds
+
+    sep = len(PARAGRAPH_SEP)
+
+    # open chunk [start, end); its packed size is end - start + sep,
+    # the trailing separator the old string builder carried
+    start = end = -1
+    position = 0
+
+    for para in normalized.split(PARAGRAPH_SEP):
+        p_start, p_end = position, position + len(para)
+        position = p_end + sep
 
-    for para in paragraphs:
         # Handle oversized paragraphs
         if len(para) > MAX_CHUNK_CHARS:
-            # If current has content, flush it first
-            if current:
-                chunks.append(current.strip())
-                current = ""
-            
+            # If a chunk is open, flush it first
+            if start >= 0:
+                bounds.extend((start, end))
+                start = -1
+
             # Split big paragraph into hard chunks
-            for i in range(0, len(para), MAX_CHUNK_CHARS):
-                chunks.append(para[i:i + MAX_CHUNK_CHARS])
-            
+            for i in range(p_start, p_end, MAX_CHUNK_CHARS):
+                bounds.extend((i, min(i + MAX_CHUNK_CHARS, p_end)))
+
             continue
 
-        if len(current) + len(para) <= MAX_CHUNK_CHARS:
-            current += para + "\n\n"
+        packed = end - start + sep if start >= 0 else 0
+        if packed + len(para) <= MAX_CHUNK_CHARS:
+            if start < 0:
+                start = p_start
+            end = p_end
         else:
-            if current:
-                chunks.append(current.strip())
-            current = para + "\n\n"
+            if start >= 0:
+                bounds.extend((start, end))
+            start, end = p_start, p_end
+
+    if start >= 0:
+        bounds.extend((start, end))
+
+    return bounds
+
+
+def deterministic_chunk(text: str) -> List[str]:
+    """
+    Structure-aware deterministic chunking.
+    Splits on paragraph boundaries, caps size.
+    """
 
-    if current:
-        chunks.append(current.strip())
+    normalized = normalize_paragraphs(text)
+    bounds = chunk_spans(normalized)
 
-    return chunks
+    return [
+        normalized[bounds[i]:bounds[i + 1]]
+        for i in range(0, len(bounds), 2)
+    ]
 
 
 def chunk_id(evidence_id: str, chunk_text: str) -> str:
@@ -0,0 +1,230 @@
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from retrieval import chunker
+from retrieval.chunker import (
+    CHUNKER_VERSION,
+    ChunkSpan,
+    chunk_id,
+    chunk_spans,
+    normalize_paragraphs,
+)
+from retrieval.html_cleaner import CLEANER_VERSION, document_text_tiered
+
+
+DERIVED_FILENAME = "derived.sqlite3"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+DERIVED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS derived (
+    evidence_id TEXT NOT NULL,
+    cleaner_version TEXT NOT NULL,
+    chunker_version TEXT NOT NULL,
+    text TEXT NOT NULL,
+    bounds BLOB NOT NULL,
+    chunk_ids TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (evidence_id, cleaner_version, chunker_version)
+);
+CREATE INDEX IF NOT EXISTS derived_by_last_used
+    ON derived (last_used);
+"""
+
+
+class DerivedText:
+    """
+    Cleaned text of one blob plus its chunking.
+
+    Paragraphs are kept in their normalized form ("\\n\\n"-joined,
+    stripped), in which every chunk is a contiguous slice, so
+    chunks are stored as (start, end) offsets, not copies.
+    `tier` records which cleaner tier produced the text.
+    """
+
+    __slots__ = ("text", "bounds", "chunk_ids", "tier")
+
+    def __init__(self, text: str, bounds: array, chunk_ids: List[str], tier: str):
+        self.text = text
+        self.bounds = bounds  # flat start, end, start, end, ...
+        self.chunk_ids = chunk_ids
+        self.tier = tier
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    def chunk(self, i: int) -> str:
+        return self.text[self.bounds[2 * i]:self.bounds[2 * i + 1]]
+
+    def chunks(self) -> Iterator[Tuple[str, str]]:
+        """
+        (chunk_id, chunk_text) in chunker order.
+        """
+        for i, cid in enumerate(self.chunk_ids):
+            yield cid, self.chunk(i)
+
+    def spans(self, evidence_id: str) -> Iterator[Tuple[str, ChunkSpan]]:
+        """
+        (chunk_id, span) in chunker order; no chunk text is copied.
+        """
+        bounds = self.bounds
+        for i, cid in enumerate(self.chunk_ids):
+            yield cid, ChunkSpan(evidence_id, self.text, bounds[2 * i], bounds[2 * i + 1])
+
+
+def derive(evidence_id: str, raw) -> DerivedText:
+    """
+    Clean and chunk one blob; same output as
+    deterministic_chunk(document_text(raw)).
+    """
+
+    cleaned, tier = document_text_tiered(raw)
+    text = normalize_paragraphs(cleaned)
+
+    bounds = chunk_spans(text)
+    chunk_ids = [
+        chunk_id(evidence_id, text[bounds[i]:bounds[i + 1]])
+        for i in range(0, len(bounds), 2)
+    ]
+
+    return DerivedText(text, bounds, chunk_ids, tier)
+
+
+def derivation_key() -> Tuple[str, str]:
+    """
+    (cleaner_version, chunker_version); the chunk size is part
+    of the chunker version, so changing it invalidates entries.
+    """
+    return CLEANER_VERSION, f"{CHUNKER_VERSION}/{chunker.MAX_CHUNK_CHARS}"
+
+
+class DerivedCache:
+    """
+    Persistent cache of cleaned text and chunk boundaries.
+
+    - Keyed by (evidence_id, cleaner_version, chunker_version);
+      blobs are immutable, so entries never go stale otherwise
+    - Populated lazily on first use
+    - Least-recently-used entries evicted past max_bytes
+    """
+
+    def __init__(self, base_path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        os.makedirs(base_path, exist_ok=True)
+
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+
+        self.path = os.path.join(base_path, DERIVED_FILENAME)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(DERIVED_SCHEMA)
+        self.conn.commit()
+
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(derived)")}
+        if "tier" not in columns:
+            # pre-tier cache: every entry is from an older cleaner anyway
+            with self.conn:
+                self.conn.execute("DROP TABLE derived")
+            self.conn.executescript(DERIVED_SCHEMA)
+
+        # entries from older cleaner/chunker versions are dead weight
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM derived "
+                "WHERE cleaner_version != ? OR chunker_version != ?",
+                derivation_key(),
+            )
+
+    def get(self, evidence_id: str) -> Optional[DerivedText]:
+        key = (evidence_id, *derivation_key())
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT text, bounds, chunk_ids, tier FROM derived WHERE "
+                "evidence_id = ? AND cleaner_version = ? AND chunker_version = ?",
+                key,
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE derived SET last_used = ? WHERE "
+                    "evidence_id = ? AND cleaner_version = ? AND chunker_version = ?",
+                    (time.time(), *key),
+                )
+
+        text, bounds_blob, chunk_ids, tier = row
+        bounds = array("I")
+        bounds.frombytes(bounds_blob)
+
+        return DerivedText(text, bounds, json.loads(chunk_ids), tier)
+
+    def put(self, evidence_id: str, derived: DerivedText) -> None:
+        bounds_blob = derived.bounds.tobytes()
+        chunk_ids = json.dumps(derived.chunk_ids)
+        size = len(derived.text.encode("utf-8")) + len(bounds_blob) + len(chunk_ids)
+
+        if size > self.max_bytes:
+            return
+
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO derived VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    evidence_id, *derivation_key(),
+                    derived.text, bounds_blob, chunk_ids, derived.tier,
+                    size, time.time(),
+                ),
+            )
+            self._evict()
+
+    def get_or_build(self, evidence_id: str, load_raw: Callable) -> DerivedText:
+        """
+        Cached entry, or derive it from load_raw() and store it.
+        """
+
+        derived = self.get(evidence_id)
+        if derived is None:
+            derived = derive(evidence_id, load_raw())
+            self.put(evidence_id, derived)
+
+        return derived
+
+    def _evict(self) -> None:
+        # caller holds the lock and an open transaction
+        total = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM derived"
+        ).fetchone()[0]
+
+        if total <= self.max_bytes:
+            return
+
+        for evidence_id, cleaner_version, chunker_version, size in self.conn.execute(
+            "SELECT evidence_id, cleaner_version, chunker_version, size "
+            "FROM derived ORDER BY last_used"
+        ).fetchall():
+            self.conn.execute(
+                "DELETE FROM derived WHERE "
+                "evidence_id = ? AND cleaner_version = ? AND chunker_version = ?",
+                (evidence_id, cleaner_version, chunker_version),
+            )
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+    def close(self) -> None:
+        self.conn.close()
@@ -1,32 +1,204 @@
+from typing import Tuple
 
-from readability import Document
-from lxml import html
+# lxml and readability are imported on first use: anything that only
+# touches stored evidence (or just parses CLI flags) shouldn't pay for them
 
 
-def extract_main_content(raw_html: bytes) -> str:
+# bump whenever extraction output can change; derived caches key on it
+CLEANER_VERSION = "tiered_v1"
+
+# ---- fast tier ----
+# below this much text the fast tier defers to readability
+FAST_TIER_MIN_CHARS = 250
+
+# link-heavy blocks are navigation, not content
+MAX_LINK_DENSITY = 0.5
+
+BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "template", "iframe", "svg",
+    "nav", "footer", "header", "aside", "form", "button",
+)
+
+BLOCK_TAGS = (
+    "p", "div", "section", "article", "main", "li", "ul", "ol",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre",
+    "tr", "table", "dd", "dt", "figcaption", "br",
+)
+
+# extraction tiers, as recorded alongside derived text
+TIER_FAST = "fast"
+TIER_READABILITY = "readability"
+TIER_RAW = "raw"
+TIER_NONE = "none"
+
+
+def extract_main_content(raw_html) -> str:
     """
-    Extract main readable content from raw HTML.
+    Extract main readable content from raw HTML
+    (bytes or any buffer, e.g. an mmap view).
     Does NOT mutate stored evidence.
     Returns cleaned text.
     """
+    return extract_main_content_tiered(raw_html)[0]
+
+
+def extract_main_content_tiered(raw_html) -> Tuple[str, str]:
+    """
+    (cleaned text, tier used).
+
+    The fast tier is one lxml parse; readability runs only
+    when it finds too little text.
+    """
 
     try:
-        decoded = raw_html.decode("utf-8", errors="ignore")
+        decoded = str(raw_html, "utf-8", errors="ignore")
     except Exception:
+        return "", TIER_NONE
+
+    fast = fast_text(decoded)
+    if len(fast) >= FAST_TIER_MIN_CHARS:
+        return fast, TIER_FAST
+
+    text = readability_text(decoded)
+    if text:
+        return text, TIER_READABILITY
+
+    # a genuinely short page: whatever the fast tier found
+    if fast:
+        return fast, TIER_FAST
+
+    return "", TIER_NONE
+
+
+def fast_text(decoded: str) -> str:
+    """
+    Single-parse extraction: strip boilerplate, prefer
+    <article>/<main>, else the densest paragraph container.
+    """
+
+    from lxml import etree, html
+
+    try:
+        tree = html.document_fromstring(decoded)
+    except (etree.ParserError, ValueError):
         return ""
 
+    return _tree_text(tree)
+
+
+def _tree_text(tree) -> str:
+    """
+    fast_text() on a parsed document; mutates the tree.
+    """
+
+    for element in list(tree.iter(*BOILERPLATE_TAGS)):
+        element.drop_tree()
+
+    root = _content_root(tree)
+    if root is None:
+        return ""
+
+    # keep block boundaries as line breaks
+    for element in root.iter(*BLOCK_TAGS):
+        element.tail = "\n" + (element.tail or "")
+
+    return _normalize(root.text_content())
+
+
+def extract_main_content_spooled(blob) -> str:
+    """
+    extract_main_content() for a SpooledBlob. The fast tier feeds
+    the spool to lxml chunk by chunk, so the raw body is never
+    held whole; only the readability fallback reads it in full.
+    """
+
+    from lxml import etree, html
+
+    parser = html.HTMLParser(encoding="utf-8")
+    try:
+        for chunk in blob.iter_chunks():
+            parser.feed(chunk)
+        tree = parser.close()
+    except (etree.ParserError, etree.XMLSyntaxError, ValueError):
+        tree = None
+
+    fast = _tree_text(tree) if tree is not None else ""
+    if len(fast) >= FAST_TIER_MIN_CHARS:
+        return fast
+
+    return extract_main_content(blob.read())
+
+
+def readability_text(decoded: str) -> str:
+    """
+    Full readability scoring pass (the fallback tier).
+    """
+
+    from lxml import html
+    from readability import Document
+
     try:
         doc = Document(decoded)
         main_html = doc.summary()
 
         tree = html.fromstring(main_html)
-        text = tree.text_content()
+        return _normalize(tree.text_content())
+
+    except Exception:
+        return ""
+
+
+def _content_root(tree):
+    hinted = tree.xpath("//article | //main | //*[@role='main']")
+    if hinted:
+        return max(hinted, key=lambda element: len(element.text_content()))
 
-        cleaned = "\n\n".join(
-            line.strip() for line in text.splitlines() if line.strip()
+    # text density: credit each paragraph's text to its container,
+    # discounting link-heavy paragraphs
+    scores = {}
+    for paragraph in tree.iter("p", "pre", "blockquote"):
+        text_length = len(paragraph.text_content().strip())
+        if not text_length:
+            continue
+
+        link_length = sum(
+            len(link.text_content()) for link in paragraph.iter("a")
         )
+        if link_length / text_length > MAX_LINK_DENSITY:
+            continue
 
-        return cleaned
+        parent = paragraph.getparent()
+        if parent is not None:
+            scores[parent] = scores.get(parent, 0) + text_length
 
-    except Exception:
-        return ""
+    if scores:
+        return max(scores, key=scores.get)
+
+    return tree.find("body")
+
+
+def _normalize(text: str) -> str:
+    return "\n\n".join(
+        line.strip() for line in text.splitlines() if line.strip()
+    )
+
+
+def document_text(raw) -> str:
+    """
+    Text used for chunking a stored blob.
+    Falls back to the raw decoded body if cleaning fails.
+    """
+    return document_text_tiered(raw)[0]
+
+
+def document_text_tiered(raw) -> Tuple[str, str]:
+    """
+    document_text() plus the extraction tier that produced it.
+    """
+
+    text, tier = extract_main_content_tiered(raw)
+
+    if not text:
+        text, tier = str(raw, "utf-8", errors="ignore"), TIER_RAW
+
+    return text, tier
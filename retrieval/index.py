@@ -0,0 +1,244 @@
+
+import heapq
+import math
+import os
+import sqlite3
+import threading
+from collections import Counter
+from typing import List
+
+from retrieval.context_block import ContextBlock
+from retrieval.derived_cache import derivation_key, derive
+
+
+INDEX_FILENAME = "index.sqlite3"
+
+# ---- BM25 parameters ----
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Same token rules as lexical_overlap_score.
+    """
+    return text.lower().split()
+
+
+class ChunkIndex:
+    """
+    Persistent inverted index over RAW_ACCEPTED chunks.
+
+    - Postings per token, keyed by chunk_id
+    - Updated incrementally as evidence is accepted
+    - Chunk text read back only for the winning chunks
+    - Tagged with the cleaner/chunker derivation_key(); an index
+      built by other versions is purged on open, and `created`
+      is set so callers backfill it like a new one
+    """
+
+    def __init__(self, base_path: str, cache=None):
+        os.makedirs(base_path, exist_ok=True)
+
+        # optional DerivedCache: cleaned text/chunks shared with the scan path
+        self.cache = cache
+
+        self.path = os.path.join(base_path, INDEX_FILENAME)
+        self.created = not os.path.exists(self.path)
+
+        # shared by the agent and the ingest workers
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS chunks (
+                chunk_id TEXT PRIMARY KEY,
+                evidence_id TEXT NOT NULL,
+                source_url TEXT NOT NULL,
+                length INTEGER NOT NULL,
+                text TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS chunks_by_evidence
+                ON chunks (evidence_id);
+
+            CREATE TABLE IF NOT EXISTS postings (
+                token TEXT NOT NULL,
+                chunk_id TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                PRIMARY KEY (token, chunk_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_by_chunk
+                ON postings (chunk_id);
+
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self.conn.commit()
+
+        if self._check_derivation():
+            self.created = True
+
+    def _check_derivation(self) -> bool:
+        """
+        Purge chunks derived by another cleaner/chunker version
+        (or by one that predates the tag). True if purged.
+        """
+
+        current = "/".join(derivation_key())
+
+        with self._lock, self.conn:
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'derivation'"
+            ).fetchone()
+            if row is not None and row[0] == current:
+                return False
+
+            purged = self.conn.execute("SELECT 1 FROM chunks LIMIT 1").fetchone()
+            if purged:
+                self.conn.execute("DELETE FROM postings")
+                self.conn.execute("DELETE FROM chunks")
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('derivation', ?)", (current,)
+            )
+
+        return purged is not None
+
+    # --------------------------------------------------
+    # Incremental updates
+    # --------------------------------------------------
+
+    def has_document(self, evidence_id: str) -> bool:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM chunks WHERE evidence_id = ? LIMIT 1",
+                (evidence_id,),
+            ).fetchone()
+        return row is not None
+
+    def add_document(self, evidence_id: str, source_url: str, raw: bytes) -> int:
+        """
+        Index one accepted blob. Idempotent.
+        Returns the number of chunks indexed.
+        """
+
+        if self.has_document(evidence_id):
+            return 0
+
+        if self.cache is None:
+            derived = derive(evidence_id, raw)
+        else:
+            derived = self.cache.get_or_build(evidence_id, lambda: raw)
+
+        return self.add_derived(evidence_id, source_url, derived)
+
+    def add_derived(self, evidence_id: str, source_url: str, derived) -> int:
+        """
+        add_document() for text already cleaned and chunked.
+        """
+
+        chunk_rows = []
+        posting_rows = []
+
+        for cid, chunk in derived.chunks():
+            tokens = tokenize(chunk)
+
+            chunk_rows.append((cid, evidence_id, source_url, len(tokens), chunk))
+
+            for token, tf in Counter(tokens).items():
+                posting_rows.append((token, cid, tf, len(tokens)))
+
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO chunks VALUES (?, ?, ?, ?, ?)",
+                chunk_rows,
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO postings VALUES (?, ?, ?, ?)",
+                posting_rows,
+            )
+
+        return len(chunk_rows)
+
+    def remove_document(self, evidence_id: str) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM postings WHERE chunk_id IN "
+                "(SELECT chunk_id FROM chunks WHERE evidence_id = ?)",
+                (evidence_id,),
+            )
+            self.conn.execute(
+                "DELETE FROM chunks WHERE evidence_id = ?",
+                (evidence_id,),
+            )
+
+    # --------------------------------------------------
+    # Query
+    # --------------------------------------------------
+
+    def search(self, query: str, k: int) -> List[ContextBlock]:
+        """
+        BM25 top-K from postings alone.
+        """
+        with self._lock:
+            return self._search(query, k)
+
+    def _search(self, query: str, k: int) -> List[ContextBlock]:
+        q_tokens = sorted(set(tokenize(query)))
+        if not q_tokens:
+            return []
+
+        n_chunks, total_length = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM chunks"
+        ).fetchone()
+
+        if n_chunks == 0:
+            return []
+
+        avg_length = total_length / n_chunks or 1.0
+        scores = {}
+
+        for token in q_tokens:
+            postings = self.conn.execute(
+                "SELECT chunk_id, tf, length FROM postings WHERE token = ?",
+                (token,),
+            ).fetchall()
+
+            if not postings:
+                continue
+
+            df = len(postings)
+            idf = math.log(1.0 + (n_chunks - df + 0.5) / (df + 0.5))
+
+            for cid, tf, length in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                scores[cid] = scores.get(cid, 0.0) + (
+                    idf * tf * (BM25_K1 + 1) / (tf + norm)
+                )
+
+        winners = heapq.nsmallest(
+            k, scores.items(), key=lambda item: (-item[1], item[0])
+        )
+
+        return [self._load_block(cid) for cid, _ in winners]
+
+    def _load_block(self, cid: str) -> ContextBlock:
+        evidence_id, source_url, text = self.conn.execute(
+            "SELECT evidence_id, source_url, text FROM chunks WHERE chunk_id = ?",
+            (cid,),
+        ).fetchone()
+
+        return ContextBlock(
+            chunk_id=cid,
+            evidence_id=evidence_id,
+            source_url=source_url,
+            chunk_text=text,
+            integrity_score=1.0,  # only accepted evidence is indexed
+        )
+
+    def close(self) -> None:
+        self.conn.close()
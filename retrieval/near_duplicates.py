@@ -0,0 +1,175 @@
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from retrieval.html_cleaner import extract_main_content, extract_main_content_spooled
+
+
+FINGERPRINT_BITS = 64
+SHINGLE_WORDS = 3
+
+NEAR_DUP_FILENAME = "near_duplicates.sqlite3"
+
+_WORD = re.compile(r"\w+")
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    64-bit SimHash over word 3-shingles of normalized text.
+    Returns None when there is no text to fingerprint.
+    """
+
+    words = _WORD.findall(text.lower())
+    if not words:
+        return None
+
+    if len(words) < SHINGLE_WORDS:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [
+            " ".join(words[i:i + SHINGLE_WORDS])
+            for i in range(len(words) - SHINGLE_WORDS + 1)
+        ]
+
+    weights = [0] * FINGERPRINT_BITS
+
+    for shingle, count in Counter(shingles).items():
+        h = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(),
+            "big",
+        )
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if (h >> bit) & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+
+    return fingerprint
+
+
+def fingerprint_html(raw) -> Optional[int]:
+    """
+    SimHash of the readable content, so boilerplate, ads and
+    timestamps outside the main text do not count.
+    """
+    text = extract_main_content(raw)
+    return simhash(text) if text else None
+
+
+def fingerprint_spooled(blob) -> Optional[int]:
+    """
+    fingerprint_html() for a SpooledBlob, read in chunks.
+    """
+    text = extract_main_content_spooled(blob)
+    return simhash(text) if text else None
+
+
+def similarity(a: int, b: int) -> float:
+    return 1.0 - bin(a ^ b).count("1") / FINGERPRINT_BITS
+
+
+class NearDuplicateIndex:
+    """
+    Persistent SimHash fingerprints with a banded LSH lookup.
+
+    The fingerprint is split into (max_distance + 1) bands, so by
+    pigeonhole any fingerprint within the similarity threshold
+    shares at least one band with the query. Candidates are then
+    confirmed by exact Hamming distance.
+    """
+
+    def __init__(self, base_path: str, threshold: float = 0.9):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+
+        os.makedirs(base_path, exist_ok=True)
+
+        self.threshold = threshold
+        self.max_distance = int((1.0 - threshold) * FINGERPRINT_BITS)
+        self._bands = _band_ranges(self.max_distance + 1)
+
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[str, int] = {}
+        self._buckets: Dict[Tuple[int, int], Set[str]] = {}
+
+        self.path = os.path.join(base_path, NEAR_DUP_FILENAME)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "evidence_id TEXT PRIMARY KEY, simhash TEXT NOT NULL)"
+        )
+        self.conn.commit()
+
+        for evidence_id, hex_value in self.conn.execute(
+            "SELECT evidence_id, simhash FROM fingerprints"
+        ):
+            self._insert(evidence_id, int(hex_value, 16))
+
+    def find(self, fingerprint: int) -> Optional[Tuple[str, float]]:
+        """
+        Most similar stored evidence at or above the threshold.
+        """
+
+        with self._lock:
+            candidates = set()
+            for band, key in enumerate(self._band_keys(fingerprint)):
+                candidates |= self._buckets.get((band, key), set())
+
+            best = None
+            for evidence_id in sorted(candidates):
+                score = similarity(fingerprint, self._fingerprints[evidence_id])
+                if score >= self.threshold and (best is None or score > best[1]):
+                    best = (evidence_id, score)
+
+        return best
+
+    def add(self, evidence_id: str, fingerprint: int) -> None:
+        with self._lock:
+            if evidence_id in self._fingerprints:
+                return
+
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO fingerprints VALUES (?, ?)",
+                    (evidence_id, f"{fingerprint:016x}"),
+                )
+            self._insert(evidence_id, fingerprint)
+
+    def _insert(self, evidence_id: str, fingerprint: int) -> None:
+        self._fingerprints[evidence_id] = fingerprint
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            self._buckets.setdefault((band, key), set()).add(evidence_id)
+
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        return [
+            (fingerprint >> start) & ((1 << width) - 1)
+            for start, width in self._bands
+        ]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _band_ranges(bands: int) -> List[Tuple[int, int]]:
+    """
+    Split the fingerprint into `bands` near-equal bit ranges.
+    """
+
+    bands = max(1, min(bands, FINGERPRINT_BITS))
+    base, extra = divmod(FINGERPRINT_BITS, bands)
+
+    ranges = []
+    start = 0
+    for band in range(bands):
+        width = base + (1 if band < extra else 0)
+        ranges.append((start, width))
+        start += width
+
+    return ranges
@@ -0,0 +1,101 @@
+
+import mmap
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from evidence.codecs import decode_blob
+from retrieval.derived_cache import DerivedCache, DerivedText, derive
+
+
+# (evidence_id, file, offset, length), as from a blob backend's locate()
+BlobLocation = Tuple[str, str, int, int]
+
+
+def extract_location(location: BlobLocation) -> Tuple[str, DerivedText]:
+    """
+    Worker: map the blob's file, then clean and chunk it.
+    Only the path crosses the process boundary, never the bytes.
+    """
+
+    evidence_id, path, offset, length = location
+
+    if not length:
+        return evidence_id, derive(evidence_id, b"")
+
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        view = memoryview(mapped)[offset:offset + length]
+        try:
+            derived = derive(evidence_id, decode_blob(view))
+        finally:
+            view.release()
+
+    return evidence_id, derived
+
+
+def extract_many(
+    locations: List[BlobLocation],
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[str, DerivedText]]:
+    """
+    Clean and chunk many blobs across a process pool.
+
+    Results stream back in input order as they complete, so
+    output (and every chunk_id) matches the serial path.
+    workers=1 runs in-process.
+    """
+
+    if workers == 1 or len(locations) <= 1:
+        for location in locations:
+            yield extract_location(location)
+        return
+
+    # spawn, not fork: the parent runs threads (ingest workers, group
+    # commit, fetcher) whose held locks a forked child would inherit
+    pool = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        yield from pool.map(extract_location, locations, chunksize=4)
+    finally:
+        # a consumer that stops early (top-K saturated) drops the rest
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def extract_evidence(
+    blobs,
+    evidence_ids: List[str],
+    cache: Optional[DerivedCache] = None,
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[str, DerivedText]]:
+    """
+    extract_many over stored evidence, in evidence_ids order.
+    Cache hits are served directly; only misses go to the pool,
+    and their results are written back to the cache.
+    """
+
+    cached = {}
+    if cache is not None:
+        for evidence_id in evidence_ids:
+            derived = cache.get(evidence_id)
+            if derived is not None:
+                cached[evidence_id] = derived
+
+    misses = [
+        (evidence_id, *blobs.locate(evidence_id))
+        for evidence_id in evidence_ids
+        if evidence_id not in cached
+    ]
+    extracted = extract_many(misses, workers)
+
+    for evidence_id in evidence_ids:
+        if evidence_id in cached:
+            yield evidence_id, cached.pop(evidence_id)
+            continue
+
+        extracted_id, derived = next(extracted)
+        if cache is not None:
+            cache.put(extracted_id, derived)
+        yield extracted_id, derived
@@ -1,90 +1,199 @@
 
-import os
-import json
-from typing import List
-from retrieval.context_block import ContextBlock
-from retrieval.chunker import deterministic_chunk, chunk_id
-from retrieval.html_cleaner import extract_main_content
-
-
-MAX_CONTEXT_BLOCKS = 5
 
+import heapq
+import os
+import sys
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-def _load_state(meta_path: str, evidence_id: str) -> str:
-    state_file = os.path.join(meta_path, f"{evidence_id}.state")
-    if not os.path.exists(state_file):
-        return None
+from evidence.blobs import open_blob_backend
+from evidence.metadata import open_metadata_backend
+from retrieval.chunker import ChunkSpan
+from retrieval.context_block import ContextBlock
+from retrieval.derived_cache import DerivedCache
+from retrieval.index import ChunkIndex, tokenize
+from retrieval.parallel_extract import extract_evidence
 
-    with open(state_file, "r") as f:
-        return f.read().strip()
+if TYPE_CHECKING:  # numpy is only loaded once the bm25 scorer is used
+    from retrieval.sparse_scorer import SparseBM25
 
 
-def _load_metadata(meta_path: str, evidence_id: str) -> dict:
-    with open(os.path.join(meta_path, f"{evidence_id}.json"), "r") as f:
-        return json.load(f)
+MAX_CONTEXT_BLOCKS = 5
 
+# scan-path rankers: set overlap (default) or vectorized BM25 (needs numpy)
+SCORERS = ("overlap", "bm25")
 
-def _load_blob(blob_path: str, evidence_id: str) -> bytes:
-    with open(os.path.join(blob_path, evidence_id), "rb") as f:
-        return f.read()
+# chunk_id -> token set; chunk ids hash the text, so entries never go stale
+TOKEN_SET_CACHE_SIZE = 100_000
+_TOKEN_SETS: "OrderedDict[str, frozenset]" = OrderedDict()
 
 
 def retrieve_context(
     query: str,
     base_path: str,
+    index: Optional[ChunkIndex] = None,
+    cache: Optional[DerivedCache] = None,
+    workers: int = 1,
+    scorer: str = "overlap",
+    k: int = MAX_CONTEXT_BLOCKS,
 ) -> List[ContextBlock]:
     """
-    Returns top-K context blocks from RAW_ACCEPTED evidence only.
+    Returns top-K context blocks from RAW_ACCEPTED evidence only,
+    best first.
+
+    With an index, answers from postings without touching blobs.
+    Without one, falls back to a full scan of the store, reusing
+    cleaned text and chunks from `cache` when given and cleaning
+    the rest across `workers` processes.
+
+    `scorer` applies to the scan only; the index ranks by its own
+    postings. scorer="bm25" ranks with an in-memory SparseBM25 kept
+    per evidence directory and updated incrementally between calls.
     """
 
-    blob_path = os.path.join(base_path, "blobs")
-    meta_path = os.path.join(base_path, "meta")
+    if index is not None:
+        return index.search(query, k)
+
+    if scorer not in SCORERS:
+        raise ValueError(f"Unknown scorer: {scorer} (expected one of {SCORERS})")
+
+    blobs = open_blob_backend(base_path)
+    metadata = open_metadata_backend(base_path)
+
+    if scorer == "bm25":
+        sparse = sparse_scorer_for(base_path, blobs, metadata, cache, workers)
+        return sparse.search(query, k)
 
+    q_tokens = frozenset(tokenize(query))
+    if not q_tokens:
+        return []
+
+    # min-heap of the best K so far: (score, -seq, chunk_id, span);
+    # -seq makes earlier chunks win ties, as the old stable sort did.
+    # Spans point into each blob's cleaned text; only winners are copied out
+    heap = []
+    seq = 0
+    saturated = False
+
+    accepted = metadata.ids_in_state("RAW_ACCEPTED")
+
+    for evidence_id, derived in extract_evidence(blobs, accepted, cache, workers):
+        for cid, span in derived.spans(evidence_id):
+            seq += 1
+            score = len(q_tokens & chunk_token_set(cid, span)) / len(q_tokens)
+
+            if score <= 0:
+                continue
+
+            entry = (score, -seq, cid, span)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+            # K perfect scores: later chunks can at best tie, and ties lose
+            saturated = len(heap) == k and heap[0][0] >= 1.0
+            if saturated:
+                break
+
+        if saturated:
+            break
+
+    urls = {}
     blocks: List[ContextBlock] = []
 
-    for filename in os.listdir(meta_path):
-        if not filename.endswith(".json"):
-            continue
-
-        evidence_id = filename.replace(".json", "")
-        state = _load_state(meta_path, evidence_id)
-
-        if state != "RAW_ACCEPTED":
-            continue
-
-        meta = _load_metadata(meta_path, evidence_id)
-        raw = _load_blob(blob_path, evidence_id)
-
-        # Try to clean HTML first
-        text = extract_main_content(raw)
-        
-        # Fallback to raw text if cleaning fails or returns empty
-        if not text:
-            text = raw.decode("utf-8", errors="ignore")
-
-        chunks = deterministic_chunk(text)
-
-        for chunk in chunks:
-            score = lexical_overlap_score(query, chunk)
-
-            if score > 0:
-                blocks.append(
-                    ContextBlock(
-                        chunk_id=chunk_id(evidence_id, chunk),
-                        evidence_id=evidence_id,
-                        source_url=meta["url"],
-                        chunk_text=chunk,
-                        integrity_score=1.0,  # integrity already validated
-                    )
-                )
-
-    # simple lexical ranking
-    blocks.sort(
-        key=lambda b: lexical_overlap_score(query, b.chunk_text),
-        reverse=True,
-    )
-
-    return blocks[:MAX_CONTEXT_BLOCKS]
+    for _, _, cid, span in sorted(heap, reverse=True):
+        evidence_id = span.evidence_id
+        if evidence_id not in urls:
+            urls[evidence_id] = metadata.get_metadata(evidence_id)["url"]
+
+        blocks.append(
+            ContextBlock(
+                chunk_id=cid,
+                evidence_id=evidence_id,
+                source_url=urls[evidence_id],
+                chunk_text=span.text(),
+                integrity_score=1.0,  # integrity already validated
+            )
+        )
+
+    return blocks
+
+
+_SPARSE_SCORERS: Dict[str, "SparseBM25"] = {}
+
+
+def sparse_scorer_for(base_path: str, blobs, metadata, cache=None, workers: int = 1) -> "SparseBM25":
+    """
+    The SparseBM25 for an evidence directory, brought in line with
+    its RAW_ACCEPTED set: new evidence added, demoted evidence removed.
+    """
+
+    key = os.path.abspath(base_path)
+    sparse = _SPARSE_SCORERS.get(key)
+    if sparse is None:
+        from retrieval.sparse_scorer import SparseBM25
+
+        sparse = _SPARSE_SCORERS[key] = SparseBM25()
+
+    accepted = metadata.ids_in_state("RAW_ACCEPTED")
+    accepted_set = set(accepted)
+
+    for evidence_id in sparse.document_ids():
+        if evidence_id not in accepted_set:
+            sparse.remove_document(evidence_id)
+
+    new = [e for e in accepted if not sparse.has_document(e)]
+    for evidence_id, derived in extract_evidence(blobs, new, cache, workers):
+        meta = metadata.get_metadata(evidence_id)
+        sparse.add_document(evidence_id, meta["url"], derived)
+
+    return sparse
+
+
+def chunk_token_set(cid: str, span: ChunkSpan) -> frozenset:
+    """
+    Interned token set of a chunk, cached by its content-derived id.
+    The span's text is only copied out on a cache miss.
+    """
+
+    tokens = _TOKEN_SETS.get(cid)
+    if tokens is not None:
+        _TOKEN_SETS.move_to_end(cid)
+        return tokens
+
+    tokens = frozenset(sys.intern(token) for token in tokenize(span.text()))
+    _TOKEN_SETS[cid] = tokens
+    if len(_TOKEN_SETS) > TOKEN_SET_CACHE_SIZE:
+        _TOKEN_SETS.popitem(last=False)
+
+    return tokens
+
+
+def rebuild_index(index: ChunkIndex, base_path: str, workers: int = 1) -> int:
+    """
+    Backfill an index from RAW_ACCEPTED evidence already on disk.
+    Returns the number of chunks indexed.
+    """
+
+    blobs = open_blob_backend(base_path)
+    metadata = open_metadata_backend(base_path)
+
+    pending = [
+        evidence_id
+        for evidence_id in sorted(metadata.ids_in_state("RAW_ACCEPTED"))
+        if not index.has_document(evidence_id)
+    ]
+
+    indexed = 0
+
+    for evidence_id, derived in extract_evidence(
+        blobs, pending, index.cache, workers
+    ):
+        meta = metadata.get_metadata(evidence_id)
+        indexed += index.add_derived(evidence_id, meta["url"], derived)
+
+    return indexed
 
 
 def lexical_overlap_score(query: str, text: str) -> float:
@@ -0,0 +1,257 @@
+
+import threading
+import zlib
+from typing import Dict, List
+
+try:
+    import numpy as np
+except ImportError:  # the "bm25" scorer needs numpy; "overlap" does not
+    np = None
+
+from retrieval.chunker import ChunkSpan
+from retrieval.context_block import ContextBlock
+from retrieval.index import BM25_B, BM25_K1, tokenize
+
+
+# hashed vocabulary: token -> crc32 bucket (stable across processes)
+HASH_BITS = 20
+
+
+def token_bucket(token: str, bits: int = HASH_BITS) -> int:
+    return zlib.crc32(token.encode("utf-8")) & ((1 << bits) - 1)
+
+
+class SparseBM25:
+    """
+    In-memory BM25 over a hashed-vocabulary sparse matrix.
+
+    - Chunk x term-bucket counts, kept row-major (CSR: per-chunk
+      terms, for removal) and column-major (CSC: per-term postings)
+    - A query is one sparse matrix-vector product: only the query's
+      columns are gathered, weighted and summed per chunk, vectorized
+    - Chunks are added incrementally; pending rows are merged into
+      the arrays on the next search (a merge of sorted runs)
+    - Removed evidence is tombstoned and drops out of df/avgdl
+
+    Hash collisions merge rare terms; scores are BM25 over buckets.
+    """
+
+    def __init__(self, bits: int = HASH_BITS, k1: float = BM25_K1, b: float = BM25_B):
+        if np is None:
+            raise RuntimeError("SparseBM25 requires numpy")
+
+        self.bits = bits
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, int] = {}
+
+        # per-row metadata
+        self._rows: List[tuple] = []  # (chunk_id, source_url, ChunkSpan)
+        self._doc_rows: Dict[str, List[int]] = {}
+
+        # CSR: row -> term buckets
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int32)
+
+        # CSC: term bucket -> (row, tf) postings
+        self._col_keys = np.zeros(0, dtype=np.int32)
+        self._col_rows = np.zeros(0, dtype=np.int32)
+        self._col_tf = np.zeros(0, dtype=np.float32)
+        self._col_ptr = np.zeros((1 << bits) + 1, dtype=np.int64)
+
+        self._lengths = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._df = np.zeros(1 << bits, dtype=np.int32)
+
+        self._alive_count = 0
+        self._alive_length = 0.0
+
+        # rows added since the last merge
+        self._pending: List[tuple] = []  # (indices, tf, length)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # --------------------------------------------------
+    # Incremental updates
+    # --------------------------------------------------
+
+    def has_document(self, evidence_id: str) -> bool:
+        return evidence_id in self._doc_rows
+
+    def document_ids(self) -> List[str]:
+        return list(self._doc_rows)
+
+    def add_document(self, evidence_id: str, source_url: str, derived) -> int:
+        """
+        Add every chunk of a DerivedText. Idempotent per evidence_id.
+        """
+
+        with self._lock:
+            if evidence_id in self._doc_rows:
+                return 0
+
+            rows = self._doc_rows.setdefault(evidence_id, [])
+            for cid, span in derived.spans(evidence_id):
+                rows.append(self._add_row(cid, source_url, span))
+
+            return len(rows)
+
+    def add_chunk(self, chunk_id: str, evidence_id: str, source_url: str, text: str) -> None:
+        with self._lock:
+            span = ChunkSpan(evidence_id, text, 0, len(text))
+            row = self._add_row(chunk_id, source_url, span)
+            self._doc_rows.setdefault(evidence_id, []).append(row)
+
+    def remove_document(self, evidence_id: str) -> None:
+        with self._lock:
+            rows = self._doc_rows.pop(evidence_id, None)
+            if not rows:
+                return
+
+            self._merge()
+            for row in rows:
+                if not self._alive[row]:
+                    continue
+                self._alive[row] = False
+                self._alive_count -= 1
+                self._alive_length -= float(self._lengths[row])
+                start, end = self._indptr[row], self._indptr[row + 1]
+                np.subtract.at(self._df, self._indices[start:end], 1)
+
+    def _add_row(self, chunk_id: str, source_url: str, span: ChunkSpan) -> int:
+        # rows keep the span, not a copy: text is sliced out for winners only
+        tokens = tokenize(span.text())
+
+        buckets = self._buckets
+        hashed = []
+        for token in tokens:
+            bucket = buckets.get(token)
+            if bucket is None:
+                bucket = buckets[token] = token_bucket(token, self.bits)
+            hashed.append(bucket)
+
+        indices, counts = np.unique(
+            np.asarray(hashed, dtype=np.int32), return_counts=True
+        )
+
+        self._pending.append((indices, counts.astype(np.float32), len(tokens)))
+        self._rows.append((chunk_id, source_url, span))
+
+        return len(self._rows) - 1
+
+    def _merge(self) -> None:
+        """
+        Fold pending rows into the CSR and CSC arrays.
+        """
+
+        if not self._pending:
+            return
+
+        first_row = len(self._lengths)
+        sizes = np.fromiter((len(i) for i, _, _ in self._pending), dtype=np.int64)
+        lengths = np.fromiter((n for _, _, n in self._pending), dtype=np.float32)
+
+        added = np.concatenate([indices for indices, _, _ in self._pending])
+        added_tf = np.concatenate([tf for _, tf, _ in self._pending])
+        added_rows = np.repeat(
+            np.arange(first_row, first_row + len(sizes), dtype=np.int32), sizes
+        )
+
+        np.add.at(self._df, added, 1)
+
+        self._indices = np.concatenate([self._indices, added])
+        self._indptr = np.concatenate(
+            [self._indptr, self._indptr[-1] + np.cumsum(sizes)]
+        )
+        self._lengths = np.concatenate([self._lengths, lengths])
+        self._alive = np.concatenate([self._alive, np.ones(len(sizes), dtype=bool)])
+
+        self._alive_count += len(sizes)
+        self._alive_length += float(lengths.sum())
+
+        # existing postings are already sorted by bucket, so the stable
+        # sort is a merge of two runs; rows stay ascending per bucket
+        keys = np.concatenate([self._col_keys, added])
+        order = np.argsort(keys, kind="stable")
+
+        self._col_keys = keys[order]
+        self._col_rows = np.concatenate([self._col_rows, added_rows])[order]
+        self._col_tf = np.concatenate([self._col_tf, added_tf])[order]
+        self._col_ptr = np.searchsorted(
+            self._col_keys, np.arange((1 << self.bits) + 1), side="left"
+        )
+
+        self._pending = []
+
+    # --------------------------------------------------
+    # Query
+    # --------------------------------------------------
+
+    def search(self, query: str, k: int) -> List[ContextBlock]:
+        """
+        BM25 top-K, ties broken by chunk_id.
+        """
+
+        with self._lock:
+            self._merge()
+
+            if self._alive_count == 0:
+                return []
+
+            q_buckets = np.unique(np.asarray(
+                [token_bucket(t, self.bits) for t in set(tokenize(query))],
+                dtype=np.int32,
+            ))
+            q_buckets = q_buckets[self._df[q_buckets] > 0]
+            if not len(q_buckets):
+                return []
+
+            df = self._df[q_buckets].astype(np.float64)
+            idf = np.log(1.0 + (self._alive_count - df + 0.5) / (df + 0.5))
+
+            # gather the query's columns
+            starts = self._col_ptr[q_buckets]
+            ends = self._col_ptr[q_buckets + 1]
+            spans = [np.arange(s, e) for s, e in zip(starts.tolist(), ends.tolist())]
+            postings = np.concatenate(spans)
+
+            rows = self._col_rows[postings]
+            tf = self._col_tf[postings]
+            column_idf = np.repeat(idf, ends - starts)
+
+            avg_length = self._alive_length / self._alive_count or 1.0
+            norm = self.k1 * (1 - self.b + self.b * self._lengths[rows] / avg_length)
+
+            scores = np.bincount(
+                rows,
+                weights=column_idf * tf * (self.k1 + 1) / (tf + norm),
+                minlength=len(self._lengths),
+            )
+            scores[~self._alive] = 0.0
+
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > k:
+                # anything tied with the k-th best must stay for the tie-break
+                kth = np.partition(scores[candidates], -k)[-k]
+                candidates = candidates[scores[candidates] >= kth]
+
+            # same (-score, chunk_id) order as ChunkIndex.search
+            winners = sorted(
+                candidates.tolist(),
+                key=lambda row: (-scores[row], self._rows[row][0]),
+            )[:k]
+
+            return [self._block(row) for row in winners]
+
+    def _block(self, row: int) -> ContextBlock:
+        chunk_id, source_url, span = self._rows[row]
+        return ContextBlock(
+            chunk_id=chunk_id,
+            evidence_id=span.evidence_id,
+            source_url=source_url,
+            chunk_text=span.text(),
+            integrity_score=1.0,  # only accepted evidence is added
+        )
@@ -0,0 +1,7 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# modules are imported from the repository root, as main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,39 @@
+# tests/test_codecs.py
+
+import pytest
+
+from evidence.codecs import Codec, get_codec
+
+BODY = b"<html><body>" + b"<p>compressible evidence text</p>" * 500 + b"</body></html>"
+
+
+def test_codec_is_abstract():
+    with pytest.raises(TypeError):
+        Codec()
+
+    class Partial(Codec):
+        codec_id, name = 250, "partial"
+
+        def compress(self, data):
+            return data
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+@pytest.mark.parametrize("name", ["identity", "zlib", "lzma"])
+def test_streaming_round_trip(name):
+    codec = get_codec(name)
+
+    compressor = codec.compressor()
+    stored = b"".join(
+        compressor.compress(BODY[i:i + 1000]) for i in range(0, len(BODY), 1000)
+    ) + compressor.flush()
+
+    decompressor = codec.decompressor()
+    restored = b"".join(
+        decompressor.decompress(stored[i:i + 700]) for i in range(0, len(stored), 700)
+    )
+
+    assert restored == BODY
+    assert codec.decompress(codec.compress(BODY)) == BODY
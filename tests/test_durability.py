@@ -0,0 +1,104 @@
+# tests/test_durability.py
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from evidence.durability import GroupCommitConfig, GroupCommitter
+from evidence.store import EvidenceStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# child: write N items in group mode, wait for their tickets, report
+# the acknowledged IDs, leave more writes in flight and die without
+# any cleanup (no close(), no atexit, no buffered-file flush)
+CHILD = """
+import json, os, sys
+from evidence.durability import GroupCommitConfig, GroupCommitter
+from evidence.store import EvidenceStore
+
+base, blob_backend, metadata_backend, n = sys.argv[1:5]
+store = EvidenceStore(
+    base, blob_backend=blob_backend, metadata_backend=metadata_backend,
+    durability="group",
+)
+
+def payload(i):
+    return {
+        "url": f"https://example.test/{i}",
+        "status": 200,
+        "headers": {"Content-Type": "text/html"},
+        "body": f"<html><body>item {i}</body></html>".encode() * 40,
+    }
+
+acked, tickets = [], []
+for i in range(int(n)):
+    evidence_id, ticket = store.write_with_ticket(payload(i))
+    acked.append(evidence_id)
+    tickets.append(ticket)
+for ticket in tickets:
+    ticket.result(timeout=30)
+
+print(json.dumps(acked), flush=True)
+
+for i in range(int(n), int(n) + 20):
+    store.write(payload(i))
+
+os._exit(0)
+"""
+
+
+@pytest.mark.parametrize("metadata_backend", ["files", "catalog"])
+@pytest.mark.parametrize("blob_backend", ["files", "segments"])
+def test_acknowledged_writes_survive_crash(tmp_path, blob_backend, metadata_backend):
+    base = str(tmp_path / "evidence")
+
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD, base, blob_backend, metadata_backend, "200"],
+        cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    acked = json.loads(proc.stdout)
+    assert len(acked) == 200
+
+    store = EvidenceStore(
+        base, blob_backend=blob_backend, metadata_backend=metadata_backend
+    )
+
+    for evidence_id in acked:
+        meta = store.read_metadata(evidence_id)
+        assert meta["body_sha256"] == evidence_id
+        assert meta["url"].startswith("https://example.test/")
+
+        body = bytes(store.read_blob(evidence_id))
+        assert len(body) == meta["body_size"]
+        assert hashlib.sha256(body).hexdigest() == evidence_id
+
+
+def test_ticket_pending_while_batch_syncs():
+    syncing, release = threading.Event(), threading.Event()
+
+    def slow_sync():
+        syncing.set()
+        release.wait(timeout=10)
+
+    committer = GroupCommitter([slow_sync], GroupCommitConfig(max_delay_ms=1))
+    try:
+        ticket = committer.submit()
+        assert syncing.wait(timeout=10)
+
+        # batch taken off the queue, but not on disk yet
+        assert not ticket.done()
+        assert committer.last_ticket() is ticket
+
+        release.set()
+        assert ticket.result(timeout=10) is True
+        assert committer.last_ticket().done()
+    finally:
+        release.set()
+        committer.close()
@@ -0,0 +1,26 @@
+# tests/test_grounding.py
+
+import pytest
+
+from llm.grounding import grounding_score
+from llm.verifier import SIMILARITY_THRESHOLD
+
+CHUNK = (
+    "Python was conceived in the late 1980s by Guido van Rossum. "
+    "Python 3.0 was released in 2008 after a long testing period."
+)
+
+
+@pytest.mark.parametrize("claim", ["Guido", "released", "van Rossum"])
+def test_short_claims_are_not_grounded(claim):
+    assert grounding_score(claim, CHUNK) == 0.0
+
+
+def test_supported_claim_is_grounded():
+    claim = "Python 3.0 was released in 2008"
+    assert grounding_score(claim, CHUNK) >= SIMILARITY_THRESHOLD
+
+
+def test_unsupported_claim_is_not_grounded():
+    claim = "Rust 1.0 shipped in 2015 with a borrow checker"
+    assert grounding_score(claim, CHUNK) < SIMILARITY_THRESHOLD
@@ -0,0 +1,96 @@
+# tests/test_http_cache.py
+
+import hashlib
+import http.server
+import threading
+
+import pytest
+
+from evidence.codecs import CompressionPolicy
+from evidence.spool import SpooledBlob
+from evidence.store import EvidenceStore
+from tools.crawl.fetch_page import fetch_page
+from tools.crawl.robots import RobotsPolicy
+from tools.http.cache import HttpCache
+from tools.http.client import HttpClient
+from tools.http.timeouts import TimeoutConfig
+
+ETAG = '"v1"'
+BODY = b"<html><body><p>" + b"cached words " * 100 + b"</p></body></html>"
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/robots.txt":
+            body, content_type = b"User-agent: *\nAllow: /\n", "text/plain"
+        elif self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        else:
+            body, content_type = BODY + self.path.encode(), "text/html"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.mark.parametrize("compress", [None, "zlib"])
+@pytest.mark.parametrize("blob_backend", ["files", "segments"])
+@pytest.mark.parametrize("streamed", [False, True])
+def test_revalidated_from_store(tmp_path, server, blob_backend, streamed, compress):
+    url = f"{server}/page"
+    http = HttpClient(TimeoutConfig())
+    robots = RobotsPolicy(http)
+
+    def run():
+        evidence = EvidenceStore(
+            str(tmp_path), blob_backend=blob_backend, metadata_backend="catalog",
+            compression=compress and CompressionPolicy(default_codec=compress),
+        )
+        cache = HttpCache(http, evidence)
+        spool_dir = evidence.spool_path if streamed else None
+
+        resp = fetch_page(url, cache, robots, spool_dir=spool_dir)
+        assert isinstance(resp, dict), resp
+
+        # streamed callers get a spool, buffered callers bytes
+        body = resp["body"]
+        assert isinstance(body, SpooledBlob if streamed else bytes)
+        content = body.read() if streamed else body
+
+        evidence.write(resp)
+        evidence.close()
+        return resp, content, cache.stats()
+
+    first, _, stats = run()
+    assert first["cache"] == "miss"
+    assert stats["misses"] == 1
+
+    # a later run: the stored ETag earns a 304 and the stored body
+    second, content, stats = run()
+    assert second["cache"] == "revalidated"
+    assert content == BODY + b"/page"
+    assert stats["hit_ratio"] == 1.0
+    assert stats["bytes_saved"] == len(content)
+    if streamed:
+        assert second["body"].sha256 == hashlib.sha256(content).hexdigest()
+        assert second["integrity"] is not None
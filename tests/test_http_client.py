@@ -0,0 +1,83 @@
+# tests/test_http_client.py
+
+import http.server
+import threading
+
+import pytest
+
+from orchestrator.execution_context import FailureClass
+from tools.crawl.fetch_page import fetch_page
+from tools.crawl.robots import RobotsPolicy
+from tools.http.client import TEXT_CONTENT_TYPES, HttpClient
+from tools.http.timeouts import TimeoutConfig
+
+JSON_ERROR = b'{"error": "try later"}'
+PDF = b"%PDF-1.4\n" + b"0 0 obj stream endstream\n" * 40
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/robots.txt":
+            body, content_type, status = b"User-agent: *\nAllow: /\n", "text/plain", 200
+        elif self.path == "/pdf":
+            body, content_type, status = PDF, "application/pdf", 200
+        else:
+            body, content_type, status = JSON_ERROR, "application/json", int(self.path[1:])
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if status in (429, 503):
+            self.send_header("Retry-After", "3")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.mark.parametrize("path, failure_class", [
+    ("/429", FailureClass.RATE_LIMIT),
+    ("/503", FailureClass.SERVER_ERROR),
+])
+@pytest.mark.parametrize("streamed", [False, True])
+def test_error_status_wins_over_content_type(tmp_path, server, path, failure_class, streamed):
+    http = HttpClient(TimeoutConfig(), content_types=TEXT_CONTENT_TYPES)
+    spool_dir = str(tmp_path) if streamed else None
+
+    failure = fetch_page(server + path, http, RobotsPolicy(http), spool_dir=spool_dir)
+
+    assert failure.failure_class == failure_class
+    assert failure.http_status == int(path[1:])
+    assert failure.retry_after_seconds == 3
+
+
+def test_unwanted_content_type_rejected(server):
+    http = HttpClient(TimeoutConfig(), content_types=TEXT_CONTENT_TYPES)
+
+    failure = fetch_page(server + "/pdf", http, RobotsPolicy(http))
+
+    assert failure.failure_class == FailureClass.SEMANTIC
+
+
+@pytest.mark.parametrize("streamed", [False, True])
+def test_any_content_type_accepted_by_default(tmp_path, server, streamed):
+    http = HttpClient(TimeoutConfig())
+    spool_dir = str(tmp_path) if streamed else None
+
+    resp = fetch_page(server + "/pdf", http, RobotsPolicy(http), spool_dir=spool_dir)
+
+    assert isinstance(resp, dict), resp
+    assert resp["status"] == 200
+    body = resp["body"].read() if streamed else resp["body"]
+    assert body == PDF
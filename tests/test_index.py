@@ -0,0 +1,30 @@
+# tests/test_index.py
+
+from retrieval import derived_cache
+from retrieval.index import ChunkIndex
+
+PAGE = (
+    b"<html><body><article><p>"
+    + b"Solid-state batteries replace the liquid electrolyte. " * 20
+    + b"</p></article></body></html>"
+)
+
+
+def test_index_purged_when_derivation_changes(tmp_path, monkeypatch):
+    index = ChunkIndex(str(tmp_path))
+    assert index.created
+    assert index.add_document("e1", "https://example.test/", PAGE) > 0
+    index.conn.close()
+
+    # same versions: kept as is
+    index = ChunkIndex(str(tmp_path))
+    assert not index.created
+    assert index.has_document("e1")
+    index.conn.close()
+
+    # a cleaner bump invalidates every stored chunk
+    monkeypatch.setattr(derived_cache, "CLEANER_VERSION", "test_v2")
+    index = ChunkIndex(str(tmp_path))
+    assert index.created
+    assert not index.has_document("e1")
+    assert index.search("electrolyte", 5) == []
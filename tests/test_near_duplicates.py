@@ -0,0 +1,25 @@
+# tests/test_near_duplicates.py
+
+import pytest
+
+from evidence.spool import BlobSpool
+from retrieval.near_duplicates import fingerprint_html, fingerprint_spooled
+
+ARTICLE = (
+    b"<html><head><script>var x = 1;</script></head><body><nav>Home | About</nav>"
+    b"<article>" + b"<p>Sodium-ion cells trade energy density for cost and safety. </p>" * 40
+    + b"</article><footer>(c) 2025</footer></body></html>"
+)
+SHORT = b"<html><body><p>Only a short note about sodium-ion cells.</p></body></html>"
+
+
+def spooled(tmp_path, body: bytes, chunk: int = 97):
+    spool = BlobSpool(str(tmp_path))
+    for start in range(0, len(body), chunk):
+        spool.write(body[start:start + chunk])
+    return spool.finish()
+
+
+@pytest.mark.parametrize("body", [ARTICLE, SHORT])
+def test_spooled_fingerprint_matches_in_memory(tmp_path, body):
+    assert fingerprint_spooled(spooled(tmp_path, body)) == fingerprint_html(body)
@@ -0,0 +1,37 @@
+# tests/test_packing.py
+
+from llm.packing import baseline_prompt, estimate_tokens, pack_context
+from retrieval.context_block import ContextBlock
+
+TEXT = (
+    "The quick brown fox jumps over the lazy dog while the farmer "
+    "watches from the porch and the cat sleeps in the afternoon sun. "
+)
+
+
+def block(i, text):
+    return ContextBlock(
+        chunk_id=f"chunk-{i}",
+        evidence_id=f"evidence-{i % 2}",
+        source_url=f"https://example.test/{i % 2}",
+        chunk_text=text,
+        integrity_score=1.0,
+    )
+
+
+def test_baseline_counts_the_packed_blocks():
+    blocks = [
+        block(0, TEXT * 3),
+        block(1, TEXT * 3),  # near-duplicate of block 0: dropped
+        block(2, "Completely different words about databases, indexes and query planners. " * 3),
+        block(3, "Yet another topic: compilers, parsers, register allocation and linkers. " * 3),
+    ]
+
+    packed = pack_context("what happened?", blocks, max_blocks=2)
+
+    assert packed.duplicates_dropped == 1
+    assert [b.chunk_id for b in packed.blocks] == ["chunk-0", "chunk-2"]
+    assert packed.baseline_tokens == estimate_tokens(
+        baseline_prompt("what happened?", packed.blocks)
+    )
+    assert packed.stats()["tokens_saved"] > 0
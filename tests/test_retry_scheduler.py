@@ -0,0 +1,53 @@
+# tests/test_retry_scheduler.py
+
+import random
+
+from orchestrator.execution_context import ExecutionContext, FailureClass
+from orchestrator.failure_event import FailureEvent
+from orchestrator.retry_scheduler import BackoffConfig, RetryScheduler
+from orchestrator.task import TaskOrchestrator
+
+
+def scheduler(ctx, clock):
+    return RetryScheduler(
+        TaskOrchestrator(ctx), BackoffConfig(), clock=lambda: clock[0],
+        rng=random.Random(0),
+    )
+
+
+def test_non_retryable_failures_leave_budgets_alone():
+    ctx = ExecutionContext(max_quarantines=2)
+    retries = scheduler(ctx, [0.0])
+
+    for i in range(5):
+        body_too_small = FailureEvent(FailureClass.SEMANTIC, None, "Body too small")
+        assert retries.schedule(f"http://a.test/{i}", body_too_small) is None
+        assert retries.schedule(
+            f"http://b.test/{i}", FailureEvent(FailureClass.CLIENT_ERROR, 404, "x")
+        ) is None
+
+    assert ctx.quarantine_count == 0
+    assert ctx.retry_count_total == 0
+
+    # transient failures are still retried and charged
+    delay = retries.schedule("http://c.test/", FailureEvent(FailureClass.SERVER_ERROR, 503, "x"))
+    assert delay is not None
+    assert ctx.retry_count_by_class[FailureClass.SERVER_ERROR] == 1
+
+
+def test_rate_limited_host_holds_back_only_itself():
+    clock = [0.0]
+    ctx = ExecutionContext()
+    retries = scheduler(ctx, clock)
+
+    assert retries.schedule("http://a.test/1", FailureEvent(FailureClass.RATE_LIMIT, 429, "x", 5)) == 5.0
+    retries.schedule("http://a.test/2", FailureEvent(FailureClass.SERVER_ERROR, 503, "x"))
+    retries.schedule("http://b.test/1", FailureEvent(FailureClass.NETWORK, None, "x"))
+
+    clock[0] = 2.0
+    assert retries.due() == ["http://b.test/1"]
+
+    clock[0] = 5.0
+    assert sorted(retries.due()) == ["http://a.test/1", "http://a.test/2"]
+    assert len(retries) == 0
+    assert ctx.retry_count_total == 3
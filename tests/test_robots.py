@@ -0,0 +1,49 @@
+# tests/test_robots.py
+
+import http.server
+import threading
+
+import pytest
+
+from tools.crawl.robots import RobotsPolicy
+from tools.http.client import HttpClient
+from tools.http.timeouts import TimeoutConfig
+
+ROBOTS = b"User-agent: *\nDisallow: /private\n"
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(ROBOTS)))
+        self.end_headers()
+        self.wfile.write(ROBOTS)
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def test_robots_txt_of_any_content_type_is_parsed(server):
+    robots = RobotsPolicy(HttpClient(TimeoutConfig()))
+
+    assert robots.allowed(f"{server}/public", "*")
+    assert not robots.allowed(f"{server}/private", "*")
+
+
+def test_unreachable_robots_txt_allows():
+    http = HttpClient(TimeoutConfig(connect_timeout=0.5, read_timeout=0.5))
+    robots = RobotsPolicy(http)
+
+    # nothing listens on port 9 (discard) here
+    assert robots.allowed("http://127.0.0.1:9/page", "*")
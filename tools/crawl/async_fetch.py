@@ -0,0 +1,93 @@
+# tools/crawl/async_fetch.py
+
+import asyncio
+from urllib.parse import urlsplit
+
+from tools.http.client import HttpClient
+from tools.http.errors import TransportError
+from tools.crawl.robots import RobotsPolicy
+from tools.crawl.fetch_page import _fetch_streamed, transport_failure
+from validators.transport import validate_transport
+from validators.structure import validate_structure
+from orchestrator.failure_event import FailureEvent
+from orchestrator.execution_context import FailureClass
+
+MAX_CONCURRENCY = 8
+MAX_PER_HOST = 2
+
+class AsyncFetcher:
+    """
+    Concurrent fetch_page for the event loop.
+
+    Blocking HTTP runs on worker threads (asyncio.to_thread), so
+    HttpClient's pooled sessions and timing are shared; robots
+    checks and response validation are scheduled per page on the
+    loop. A global and a per-host semaphore bound concurrency.
+    """
+
+    def __init__(
+        self,
+        http: HttpClient,
+        robots: RobotsPolicy,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_per_host: int = MAX_PER_HOST,
+        spool_dir: str = None,
+    ):
+        self.http = http
+        self.robots = robots
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.spool_dir = spool_dir
+
+    async def fetch_many(self, urls) -> list:
+        """
+        fetch_page for every URL, concurrently.
+        Results (resp dict or FailureEvent) are in input order.
+        """
+
+        # per call: asyncio primitives belong to the running loop
+        limit = asyncio.Semaphore(self.max_concurrency)
+        hosts = {}
+        robots_locks = {}
+
+        async def one(url):
+            host = urlsplit(url).netloc
+            host_limit = hosts.setdefault(host, asyncio.Semaphore(self.max_per_host))
+
+            # host slot first, so a busy host doesn't hold global slots
+            async with host_limit, limit:
+                # one robots.txt fetch per host; later checks hit its cache
+                async with robots_locks.setdefault(host, asyncio.Lock()):
+                    allowed = await asyncio.to_thread(self.robots.allowed, url, "*")
+                if not allowed:
+                    return FailureEvent(FailureClass.CLIENT_ERROR, 403, "Blocked by robots.txt")
+
+                return await self._fetch(url)
+
+        return await asyncio.gather(*(one(url) for url in urls))
+
+    async def _fetch(self, url: str):
+        try:
+            if self.spool_dir is not None:
+                # structure/integrity checks run on chunks as they arrive
+                return await asyncio.to_thread(
+                    _fetch_streamed, url, self.http, self.spool_dir
+                )
+
+            resp = await asyncio.to_thread(self.http.fetch, url)
+
+        except TransportError as e:
+            return transport_failure(e)
+
+        failure = validate_transport(resp) or validate_structure(resp)
+        if failure:
+            return failure
+
+        return resp
+
+
+def fetch_many(urls, http: HttpClient, robots: RobotsPolicy, **kwargs) -> list:
+    """
+    Blocking wrapper: run AsyncFetcher.fetch_many to completion.
+    """
+    return asyncio.run(AsyncFetcher(http, robots, **kwargs).fetch_many(urls))
@@ -1,17 +1,42 @@
 # tools/crawl/fetch_page.py
 
 from tools.http.client import HttpClient
+from tools.http.errors import (
+    TransportError,
+    ProtocolError,
+    DeadlineExceededError,
+)
 from tools.crawl.robots import RobotsPolicy
+from evidence.spool import SpooledBlob
+from validators.integrity import IntegrityAccumulator
 from validators.transport import validate_transport
-from validators.structure import validate_structure
+from validators.structure import validate_structure, StructureScanner
 from orchestrator.failure_event import FailureEvent
 from orchestrator.execution_context import FailureClass
 
-def fetch_page(url, http: HttpClient, robots: RobotsPolicy):
+def transport_failure(error: TransportError) -> FailureEvent:
+    """
+    FailureEvent for an HttpClient error.
+    """
+    if isinstance(error, DeadlineExceededError):
+        return FailureEvent(FailureClass.DEADLINE, None, str(error))
+    if isinstance(error, ProtocolError):
+        # body too large, unwanted Content-Type: the page, not the network
+        return FailureEvent(FailureClass.SEMANTIC, None, str(error))
+    return FailureEvent(FailureClass.NETWORK, None, str(error))
+
+
+def fetch_page(url, http: HttpClient, robots: RobotsPolicy, spool_dir: str = None):
     if not robots.allowed(url, "*"):
         return FailureEvent(FailureClass.CLIENT_ERROR, 403, "Blocked by robots.txt")
 
-    resp = http.fetch(url)
+    if spool_dir is not None:
+        return _fetch_streamed(url, http, spool_dir)
+
+    try:
+        resp = http.fetch(url)
+    except TransportError as e:
+        return transport_failure(e)
 
     failure = validate_transport(resp)
     if failure:
@@ -22,3 +47,29 @@ def fetch_page(url, http: HttpClient, robots: RobotsPolicy):
         return failure
 
     return resp
+
+
+def _fetch_streamed(url, http: HttpClient, spool_dir: str):
+    """
+    Body is spooled to disk; structure and integrity checks run
+    on the chunks as they arrive. On success resp["body"] is a
+    SpooledBlob (stored bytes on an HttpCache hit) and
+    resp["integrity"] the IntegrityResult.
+    """
+    structure = StructureScanner()
+    integrity = IntegrityAccumulator()
+
+    try:
+        resp = http.fetch_stream(url, spool_dir, observers=[structure, integrity])
+    except TransportError as e:
+        return transport_failure(e)
+
+    failure = validate_transport(resp) or structure.result()
+    if failure:
+        # a cache hit returns the stored bytes, not a spooled file
+        if isinstance(resp["body"], SpooledBlob):
+            resp["body"].discard()
+        return failure
+
+    resp["integrity"] = integrity.result()
+    return resp
@@ -35,10 +35,14 @@ class RobotsPolicy:
         parser = robotparser.RobotFileParser()
 
         try:
-            resp = self.http.fetch(robots_url)
+            # robots.txt is often served as octet-stream or similar:
+            # skip the page Content-Type allow-list
+            resp = self.http.fetch(robots_url, content_types=None)
             parser.parse(resp["body"].decode("utf-8", errors="ignore").splitlines())
         except Exception:
-            parser.disallow_all = False  # fail-open, but recorded later
+            # fail-open, but recorded later; an unparsed parser
+            # would otherwise refuse every URL
+            parser.allow_all = True
 
         return RobotsCacheEntry(parser, time.time())
 
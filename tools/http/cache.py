@@ -0,0 +1,250 @@
+# tools/http/cache.py
+
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+
+from evidence.spool import SpooledBlob
+from tools.http.client import HttpClient
+
+# 304 headers that describe the (empty) 304 message, not the stored body
+_NOT_UPDATED = {"content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+def header(headers: dict, name: str):
+    """
+    Case-insensitive header lookup on a plain dict.
+    """
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def cache_control(headers: dict) -> dict:
+    """
+    Cache-Control directives: {"max-age": "60", "no-cache": None, ...}.
+    """
+    directives = {}
+    for part in (header(headers, "Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def http_date(value):
+    """
+    Epoch seconds for an HTTP date, or None.
+    """
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def freshness(headers: dict, now: float) -> float:
+    """
+    Seconds a stored response stays fresh (<= 0: stale), from
+    Cache-Control max-age or Expires, aged from Date + Age.
+    No heuristic freshness: without explicit lifetime, revalidate.
+    """
+    directives = cache_control(headers)
+    if "no-cache" in directives or "no-store" in directives:
+        return 0.0
+
+    date = http_date(header(headers, "Date"))
+    if date is None:
+        return 0.0
+
+    age = max(0.0, now - date)
+    reported_age = header(headers, "Age")
+    if reported_age and reported_age.isdigit():
+        age += int(reported_age)
+
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        lifetime = int(max_age) if max_age.isdigit() else 0
+    else:
+        expires = http_date(header(headers, "Expires"))
+        lifetime = 0 if expires is None else expires - date
+
+    return lifetime - age
+
+
+def merge_headers(stored: dict, update: dict) -> dict:
+    """
+    Stored response headers refreshed by a 304 (RFC 9111 4.3.4).
+    """
+    merged = dict(stored)
+    for key, value in update.items():
+        if key.lower() in _NOT_UPDATED:
+            continue
+        for old in [k for k in merged if k.lower() == key.lower()]:
+            del merged[old]
+        merged[key] = value
+
+    if header(merged, "Date") is None:
+        merged["Date"] = formatdate(time.time(), usegmt=True)
+    return merged
+
+
+class CachedEntry:
+    def __init__(self, evidence_id, status, headers):
+        self.evidence_id = evidence_id
+        self.status = status
+        self.headers = headers
+
+
+class HttpCache:
+    """
+    Conditional-request cache in front of an HttpClient.
+
+    Backed by the evidence store: a URL maps to its latest
+    evidence_id, whose stored headers supply ETag/Last-Modified
+    for If-None-Match/If-Modified-Since. A 304 returns the stored
+    blob; a response still fresh by Cache-Control/Expires is
+    returned without any request.
+
+    Same fetch()/fetch_stream() interface as HttpClient. Returned
+    dicts carry "cache": "fresh" | "revalidated" | "miss".
+    """
+
+    def __init__(self, http: HttpClient, evidence):
+        self.http = http
+        self.evidence = evidence
+
+        # refreshed headers per URL from this run's 304s
+        # (stored metadata is write-once)
+        self._revalidated = {}
+        self._lock = threading.Lock()
+
+        self.fresh = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.bytes_downloaded = 0
+
+    def fetch(self, url: str) -> dict:
+        return self._fetch(url, lambda headers: self.http.fetch(url, headers=headers))
+
+    def fetch_stream(self, url: str, spool_dir: str, observers=()) -> dict:
+        return self._fetch(
+            url,
+            lambda headers: self.http.fetch_stream(
+                url, spool_dir, observers, headers=headers
+            ),
+            spool_dir,
+            observers,
+        )
+
+    def _fetch(self, url: str, send, spool_dir=None, observers=()) -> dict:
+        entry = self._lookup(url)
+
+        if entry is not None and freshness(entry.headers, time.time()) > 0:
+            with self._lock:
+                self.fresh += 1
+            return self._from_store(
+                url, entry, entry.headers, None, "fresh", spool_dir, observers
+            )
+
+        conditionals = {}
+        if entry is not None:
+            etag = header(entry.headers, "ETag")
+            last_modified = header(entry.headers, "Last-Modified")
+            if etag:
+                conditionals["If-None-Match"] = etag
+            if last_modified:
+                conditionals["If-Modified-Since"] = last_modified
+
+        resp = send(conditionals or None)
+
+        if resp["status"] == 304 and conditionals:
+            if isinstance(resp["body"], SpooledBlob):
+                resp["body"].discard()
+
+            headers = merge_headers(entry.headers, resp["headers"])
+            with self._lock:
+                self.revalidated += 1
+                self._revalidated[url] = (entry.evidence_id, headers)
+            return self._from_store(
+                url, entry, headers, resp["timing"], "revalidated", spool_dir, observers
+            )
+
+        with self._lock:
+            self.misses += 1
+            self.bytes_downloaded += len(resp["body"])
+            self._revalidated.pop(url, None)
+
+        resp["cache"] = "miss"
+        return resp
+
+    def _lookup(self, url: str):
+        """
+        The latest stored 200 response for url, or None.
+        """
+        try:
+            ids = self.evidence.ids_for_url(url)
+            if not ids:
+                return None
+
+            meta = self.evidence.read_metadata(ids[0])
+        except (KeyError, OSError):
+            return None
+
+        if meta["status"] != 200:
+            return None
+
+        headers = meta["headers"]
+        with self._lock:
+            refreshed = self._revalidated.get(url)
+        if refreshed is not None and refreshed[0] == ids[0]:
+            headers = refreshed[1]
+
+        if "no-store" in cache_control(headers):
+            return None
+
+        return CachedEntry(ids[0], meta["status"], headers)
+
+    def _from_store(self, url, entry, headers, timing, outcome, spool_dir, observers) -> dict:
+        if spool_dir is not None:
+            # streamed callers get a SpooledBlob, as for a download;
+            # observers validate the replayed chunks as they arrive
+            body = self.evidence.spool_blob(entry.evidence_id, spool_dir, observers)
+        else:
+            # segment-backed blobs come back as memoryviews; callers
+            # (validators, scanners) expect bytes
+            body = bytes(self.evidence.read_blob(entry.evidence_id))
+
+        with self._lock:
+            self.bytes_saved += len(body)
+
+        return {
+            "url": url,
+            "status": entry.status,
+            "headers": headers,
+            "body": body,
+            "timing": timing,
+            "cache": outcome,
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.fresh + self.revalidated + self.misses
+            return {
+                "lookups": lookups,
+                "fresh": self.fresh,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "hit_ratio": (
+                    (self.fresh + self.revalidated) / lookups if lookups else 0.0
+                ),
+                "bytes_saved": self.bytes_saved,
+                "bytes_downloaded": self.bytes_downloaded,
+            }
+
+    def close(self) -> None:
+        self.http.close()
@@ -1,39 +1,289 @@
 # tools/http/client.py
 
-import requests
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urljoin
+from evidence.spool import BlobSpool, BodyTooLarge, SPOOL_CHUNK_BYTES
 from tools.http.timeouts import TimeoutConfig
+from tools.http.pool import PoolConfig
 from tools.http.headers import build_headers
-from tools.http.errors import TransportError, TimeoutError
+from tools.http.errors import (
+    TransportError,
+    TimeoutError,
+    BodyTooLargeError,
+    ContentTypeError,
+    DeadlineExceededError,
+)
+
+MAX_BODY_BYTES = 25 * 1024 * 1024
+
+MAX_REDIRECTS = 10
+
+# opt-in allow-list (content_types=TEXT_CONTENT_TYPES): bodies of any
+# other declared type are never downloaded. The default accepts every
+# type, as PDF/JSON evidence is stored too.
+TEXT_CONTENT_TYPES = (
+    "text/html",
+    "application/xhtml+xml",
+    "text/plain",  # robots.txt
+    "text/xml",
+    "application/xml",
+)
+
+# fetch(content_types=...) default: the client's own allow-list
+_CLIENT_TYPES = object()
 
 class HttpClient:
     """
     Raw HTTP execution only.
     No retries. No judgment.
+
+    With a PoolConfig, connections are kept alive and reused per
+    host (one shared session); without one, every request opens
+    and closes its own connection.
+
+    Every fetch is capped at timeout_cfg.total_deadline of wall
+    clock, across connect, redirects and body download.
+
+    content_types, when given, is the Content-Type allow-list
+    for 2xx bodies; None accepts any type.
     """
 
-    def __init__(self, timeout_cfg: TimeoutConfig):
+    def __init__(
+        self,
+        timeout_cfg: TimeoutConfig,
+        max_body_bytes: int = MAX_BODY_BYTES,
+        pool: PoolConfig = None,
+        content_types=None,
+    ):
         self.timeout_cfg = timeout_cfg
+        self.max_body_bytes = max_body_bytes
+        self.pool = pool
+        self.content_types = content_types
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def fetch(
+        self, url: str, headers: dict = None, content_types=_CLIENT_TYPES
+    ) -> dict:
+        """
+        content_types overrides the client's Content-Type allow-list
+        for this request; None accepts any type.
+        """
+        import requests  # deferred: slow to import, unused by offline tools
+
+        deadline = time.monotonic() + self.timeout_cfg.total_deadline
 
-    def fetch(self, url: str) -> dict:
         try:
-            resp = requests.get(
-                url,
-                headers=build_headers(),
-                timeout=(
-                    self.timeout_cfg.connect_timeout,
-                    self.timeout_cfg.read_timeout,
-                ),
-                allow_redirects=True,
-            )
-            return {
-                "url": url,
-                "status": resp.status_code,
-                "headers": dict(resp.headers),
-                "body": resp.content,
-            }
+            with self._get(url, deadline, headers, content_types) as (resp, timer):
+                body = bytearray()
+                for chunk in self._iter_body(resp, deadline):
+                    body += chunk
+                    if len(body) > self.max_body_bytes:
+                        raise BodyTooLargeError(
+                            f"Body exceeds {self.max_body_bytes} bytes"
+                        )
+
+                return {
+                    "url": url,
+                    "status": resp.status_code,
+                    "headers": dict(resp.headers),
+                    "body": bytes(body),
+                    "timing": timer.finish(),
+                }
 
         except requests.exceptions.Timeout as e:
-            raise TimeoutError(str(e))
+            raise self._timeout(e, deadline)
 
         except requests.exceptions.RequestException as e:
             raise TransportError(str(e))
+
+    def fetch_stream(
+        self, url: str, spool_dir: str, observers=(), headers: dict = None
+    ) -> dict:
+        """
+        Like fetch(), but the body is streamed to a temp file in
+        spool_dir and returned as a lazy SpooledBlob handle.
+        Observers see each chunk as it arrives.
+        """
+        import requests
+
+        deadline = time.monotonic() + self.timeout_cfg.total_deadline
+
+        try:
+            with self._get(url, deadline, headers) as (resp, timer):
+                spool = BlobSpool(spool_dir, self.max_body_bytes, observers)
+                try:
+                    for chunk in self._iter_body(resp, deadline):
+                        spool.write(chunk)
+                except BodyTooLarge as e:
+                    raise BodyTooLargeError(str(e))
+                except BaseException:
+                    spool.abort()
+                    raise
+
+                return {
+                    "url": url,
+                    "status": resp.status_code,
+                    "headers": dict(resp.headers),
+                    "body": spool.finish(),
+                    "timing": timer.finish(),
+                }
+
+        except requests.exceptions.Timeout as e:
+            raise self._timeout(e, deadline)
+
+        except requests.exceptions.RequestException as e:
+            raise TransportError(str(e))
+
+    @contextmanager
+    def _get(
+        self,
+        url: str,
+        deadline: float,
+        headers: dict = None,
+        content_types=_CLIENT_TYPES,
+    ):
+        """
+        (response, RequestTimer) with headers received and checked;
+        the body is left for the caller to read. Redirects are
+        followed here, each hop on what is left of the deadline.
+        Extra request headers (e.g. conditionals) go on every hop.
+        """
+        from tools.http import transport
+
+        pooled = self.pool is not None
+        request_headers = build_headers(keep_alive=pooled)
+        request_headers.update(headers or {})
+        session = self._shared_session() if pooled else transport.new_session()
+
+        try:
+            timer = transport.RequestTimer()
+
+            for _ in range(MAX_REDIRECTS + 1):
+                remaining = self._remaining(deadline)
+                resp = session.get(
+                    url,
+                    headers=request_headers,
+                    timeout=(
+                        min(self.timeout_cfg.connect_timeout, remaining),
+                        min(self.timeout_cfg.read_timeout, remaining),
+                    ),
+                    allow_redirects=False,
+                    stream=True,
+                )
+
+                target = session.get_redirect_target(resp)
+                if target is None:
+                    break
+
+                # redirect bodies are never read
+                resp.close()
+                url = urljoin(resp.url, target)
+
+                if not pooled:
+                    # "Connection: close": the server is dropping this
+                    # connection, so the next hop must not pick it up
+                    session.close()
+                    session = transport.new_session()
+            else:
+                raise TransportError(f"More than {MAX_REDIRECTS} redirects")
+
+            with resp:
+                timer.headers_received()
+                # error responses are classified by status (and keep
+                # headers like Retry-After), whatever their body type
+                if 200 <= resp.status_code < 300:
+                    self._check_headers(resp, content_types)
+                yield resp, timer
+        finally:
+            if not pooled:
+                session.close()
+
+    def _check_headers(self, resp, content_types=_CLIENT_TYPES) -> None:
+        """
+        Reject a 2xx body by its headers, before any of it is read.
+        """
+
+        declared = resp.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > self.max_body_bytes:
+            raise BodyTooLargeError(
+                f"Content-Length {declared} exceeds {self.max_body_bytes} bytes"
+            )
+
+        if content_types is _CLIENT_TYPES:
+            content_types = self.content_types
+
+        content_type = resp.headers.get("Content-Type")
+        if content_type and content_types:
+            media_type = content_type.split(";", 1)[0].strip().lower()
+            if media_type not in content_types:
+                raise ContentTypeError(f"Unsupported Content-Type {media_type}")
+
+    def _iter_body(self, resp, deadline: float):
+        """
+        Body chunks as they arrive; a transfer still running at the
+        deadline is aborted. Each socket read waits at most until
+        the deadline, so a trickling server can't stretch it.
+        """
+        from urllib3.exceptions import HTTPError, ReadTimeoutError
+
+        raw = resp.raw
+        if not hasattr(raw, "read1"):
+            # urllib3 < 2: no single-read API; check between chunks only
+            for chunk in resp.iter_content(SPOOL_CHUNK_BYTES):
+                self._remaining(deadline)
+                yield chunk
+            return
+
+        sock = getattr(getattr(raw, "connection", None), "sock", None)
+
+        try:
+            while True:
+                remaining = self._remaining(deadline)
+                if sock is not None:
+                    sock.settimeout(min(self.timeout_cfg.read_timeout, remaining))
+
+                chunk = raw.read1(SPOOL_CHUNK_BYTES, decode_content=True)
+                if not chunk:
+                    return
+
+                yield chunk
+
+        except ReadTimeoutError as e:
+            raise self._timeout(e, deadline)
+
+        except HTTPError as e:
+            raise TransportError(str(e))
+
+    def _remaining(self, deadline: float) -> float:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(
+                f"Total deadline of {self.timeout_cfg.total_deadline}s exceeded"
+            )
+        return remaining
+
+    def _timeout(self, error: Exception, deadline: float) -> TimeoutError:
+        # a timeout shortened to fit the deadline is a deadline hit
+        if deadline - time.monotonic() <= 0.05:
+            return DeadlineExceededError(
+                f"Total deadline of {self.timeout_cfg.total_deadline}s exceeded"
+            )
+        return TimeoutError(str(error))
+
+    def _shared_session(self):
+        with self._session_lock:
+            if self._session is None:
+                from tools.http import transport
+
+                self._session = transport.new_session(self.pool)
+            return self._session
+
+    def close(self) -> None:
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
@@ -8,3 +8,12 @@ class TimeoutError(TransportError):
 
 class ProtocolError(TransportError):
     pass
+
+class BodyTooLargeError(ProtocolError):
+    pass
+
+class DeadlineExceededError(TimeoutError):
+    pass
+
+class ContentTypeError(ProtocolError):
+    pass
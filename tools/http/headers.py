@@ -7,7 +7,7 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 Safari/605.1.15",
 ]
 
-def build_headers() -> dict:
+def build_headers(keep_alive: bool = False) -> dict:
     """
     Stable, realistic headers.
     No evasion tricks.
@@ -16,5 +16,5 @@ def build_headers() -> dict:
         "User-Agent": random.choice(USER_AGENTS),
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
-        "Connection": "close",
+        "Connection": "keep-alive" if keep_alive else "close",
     }
@@ -0,0 +1,12 @@
+# tools/http/pool.py
+
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Keep-alive connection pooling.
+    Connections (and their TLS sessions) are reused per host.
+    """
+    pool_connections: int = 16  # hosts whose pool is kept
+    pool_maxsize: int = 4       # idle connections kept per host
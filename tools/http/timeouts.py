@@ -10,4 +10,4 @@ class TimeoutConfig:
     """
     connect_timeout: float = 5.0
     read_timeout: float = 10.0
-    total_deadline: float = 20.0
+    total_deadline: float = 20.0  # wall clock: connect + redirects + body
@@ -0,0 +1,125 @@
+# tools/http/transport.py
+#
+# requests/urllib3 plumbing for HttpClient: sessions with per-host
+# connection pools, and per-request phase timing. Imported lazily.
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from tools.http.pool import PoolConfig
+
+# connections are opened on the requesting thread, so phase
+# timings are handed back to the RequestTimer through this
+_phases = threading.local()
+
+
+def _add_phase(name: str, seconds: float) -> None:
+    setattr(_phases, name, getattr(_phases, name, 0.0) + seconds)
+
+
+class TimedHTTPConnection(HTTPConnection):
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()  # DNS + TCP
+        finally:
+            _add_phase("connect", time.perf_counter() - start)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _add_phase("connect", time.perf_counter() - start)
+
+    def connect(self):
+        before = getattr(_phases, "connect", 0.0)
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            tcp = getattr(_phases, "connect", 0.0) - before
+            _add_phase("tls", time.perf_counter() - start - tcp)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose per-host pools hand out timed connections.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+def new_session(pool: PoolConfig = None) -> requests.Session:
+    """
+    A session with timed connections; pooled per host when `pool`
+    is given, otherwise sized for a single one-shot request.
+    """
+
+    pool = pool or PoolConfig(pool_connections=1, pool_maxsize=1)
+
+    adapter = TimedAdapter(
+        pool_connections=pool.pool_connections,
+        pool_maxsize=pool.pool_maxsize,
+        max_retries=0,  # no retries at this layer
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class RequestTimer:
+    """
+    Phases of one request (redirect hops included), in seconds:
+    connect (DNS + TCP), tls, ttfb (request sent to headers,
+    after connecting) and download. A request served entirely
+    by kept-alive connections has connect == tls == 0.
+    """
+
+    def __init__(self):
+        _phases.connect = 0.0
+        _phases.tls = 0.0
+        self.start = time.perf_counter()
+        self.headers_at = None
+
+    def headers_received(self) -> None:
+        self.headers_at = time.perf_counter()
+
+    def finish(self) -> dict:
+        end = time.perf_counter()
+        headers_at = self.headers_at or end
+
+        connect = _phases.connect
+        tls = _phases.tls
+
+        return {
+            "connect": round(connect, 6),
+            "tls": round(tls, 6),
+            "ttfb": round(max(0.0, headers_at - self.start - connect - tls), 6),
+            "download": round(end - headers_at, 6),
+            "reused": connect == 0.0,
+        }
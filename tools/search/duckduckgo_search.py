@@ -1,12 +1,13 @@
 # tools/search/duckduckgo_search.py
 
-from duckduckgo_search import DDGS
 from itertools import islice
 
 def search_duckduckgo(query: str, max_results: int = 5):
     """
     Search using the duckduckgo-search library for robust results.
     """
+    from duckduckgo_search import DDGS  # deferred to the first search
+
     results = []
     
     try:
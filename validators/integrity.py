@@ -1,6 +1,19 @@
 import math
 from collections import Counter
-from typing import Dict, List
+from typing import Dict, List, Mapping
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python histogram fallback
+    np = None
+
+
+# Bump whenever thresholds or scoring change; evidence judged by an
+# older version is picked up by `python -m orchestrator.reevaluate`.
+VALIDATOR_VERSION = "integrity_v1"
+
+# first-occurrence scan window, see ByteHistogram
+ORDER_SCAN_BYTES = 64 * 1024
 
 
 class IntegrityResult:
@@ -15,7 +28,7 @@ class IntegrityResult:
         usable_for_reasoning: bool,
         flags: List[str],
         metrics: Dict[str, float],
-        validator_version: str = "integrity_v1",
+        validator_version: str = VALIDATOR_VERSION,
     ):
         self.integrity_score = integrity_score
         self.usable_for_reasoning = usable_for_reasoning
@@ -47,16 +60,32 @@ class IntegrityEvaluator:
 
     @staticmethod
     def evaluate(raw: bytes) -> IntegrityResult:
+        """
+        One histogram pass over the bytes; entropy, repetition
+        and uniqueness are all derived from it.
+        """
+        histogram = ByteHistogram()
+        histogram.update(raw)
+        return IntegrityEvaluator.evaluate_counts(
+            histogram.ordered_counts(), histogram.length
+        )
+
+    @staticmethod
+    def evaluate_counts(counts: Mapping[int, int], length: int) -> IntegrityResult:
+        """
+        Same judgment as evaluate(), from a byte histogram.
+        `counts` must iterate in first-occurrence order (as Counter does),
+        which keeps the entropy sum bit-identical to integrity_v1.
+        """
         flags = []
         metrics = {}
 
-        length = len(raw)
         metrics["byte_length"] = length
 
         if length == 0:
             return IntegrityEvaluator._fail("empty_content", metrics)
 
-        entropy = IntegrityEvaluator._shannon_entropy(raw)
+        entropy = IntegrityEvaluator._shannon_entropy(counts, length)
         metrics["entropy"] = entropy
 
         if entropy < IntegrityEvaluator.ENTROPY_RANGE[0]:
@@ -65,13 +94,13 @@ class IntegrityEvaluator:
         if entropy > IntegrityEvaluator.ENTROPY_RANGE[1]:
             flags.append("high_entropy_noise_like")
 
-        repetition_ratio = IntegrityEvaluator._repetition_ratio(raw)
+        repetition_ratio = IntegrityEvaluator._repetition_ratio(counts, length)
         metrics["repetition_ratio"] = repetition_ratio
 
         if repetition_ratio > IntegrityEvaluator.MAX_REPETITION_RATIO:
             flags.append("excessive_repetition")
 
-        unique_ratio = IntegrityEvaluator._unique_byte_ratio(raw)
+        unique_ratio = IntegrityEvaluator._unique_byte_ratio(counts, length)
         metrics["unique_byte_ratio"] = unique_ratio
 
         if unique_ratio < IntegrityEvaluator.MIN_UNIQUE_RATIO:
@@ -107,10 +136,7 @@ class IntegrityEvaluator:
         )
 
     @staticmethod
-    def _shannon_entropy(data: bytes) -> float:
-        counts = Counter(data)
-        total = len(data)
-
+    def _shannon_entropy(counts: Mapping[int, int], total: int) -> float:
         entropy = 0.0
         for count in counts.values():
             p = count / total
@@ -119,14 +145,13 @@ class IntegrityEvaluator:
         return entropy
 
     @staticmethod
-    def _repetition_ratio(data: bytes) -> float:
-        counts = Counter(data)
-        most_common = counts.most_common(1)[0][1]
-        return most_common / len(data)
+    def _repetition_ratio(counts: Mapping[int, int], total: int) -> float:
+        most_common = max(counts.values())
+        return most_common / total
 
     @staticmethod
-    def _unique_byte_ratio(data: bytes) -> float:
-        return len(set(data)) / len(data)
+    def _unique_byte_ratio(counts: Mapping[int, int], total: int) -> float:
+        return len(counts) / total
 
     @staticmethod
     def _compose_score(
@@ -167,3 +192,73 @@ class IntegrityEvaluator:
         )
 
         return round(max(0.0, min(1.0, score)), 4)
+
+
+class ByteHistogram:
+    """
+    Byte counts plus first-occurrence order, built in one pass.
+
+    - numpy: bincount over a zero-copy frombuffer view
+    - fallback: a single C-level Counter pass
+    Order is tracked because integrity_v1 summed entropy in
+    Counter (first-occurrence) order.
+    """
+
+    def __init__(self):
+        self.length = 0
+        self.order: Dict[int, None] = {}
+        self._counts = np.zeros(256, dtype=np.int64) if np is not None else [0] * 256
+
+    def update(self, chunk) -> None:
+        if not len(chunk):
+            return
+
+        self.length += len(chunk)
+
+        if np is None:
+            for value, count in Counter(chunk).items():
+                self._counts[value] += count
+                if value not in self.order:
+                    self.order[value] = None
+            return
+
+        values = np.frombuffer(chunk, dtype=np.uint8)
+        chunk_counts = np.bincount(values, minlength=256)
+        self._counts += chunk_counts
+
+        # the first window usually places every byte value present
+        for value in dict.fromkeys(memoryview(chunk).cast("B")[:ORDER_SCAN_BYTES]):
+            if value not in self.order:
+                self.order[value] = None
+
+        # stragglers: locate their first index with a vectorized scan
+        late = [
+            value for value in np.flatnonzero(chunk_counts).tolist()
+            if value not in self.order
+        ]
+        for _, value in sorted(
+            (int(np.argmax(values == value)), value) for value in late
+        ):
+            self.order[value] = None
+
+    def ordered_counts(self) -> Dict[int, int]:
+        counts = self._counts.tolist() if np is not None else self._counts
+        return {value: counts[value] for value in self.order}
+
+
+class IntegrityAccumulator:
+    """
+    Incremental IntegrityEvaluator over a streamed body.
+    Feed chunks with update(); result() equals evaluate(whole_body).
+    """
+
+    def __init__(self):
+        self.histogram = ByteHistogram()
+
+    def update(self, chunk: bytes) -> None:
+        self.histogram.update(chunk)
+
+    def result(self) -> IntegrityResult:
+        return IntegrityEvaluator.evaluate_counts(
+            self.histogram.ordered_counts(), self.histogram.length
+        )
@@ -22,3 +22,42 @@ def validate_structure(resp: dict) -> FailureEvent | None:
             return FailureEvent(FailureClass.SEMANTIC, None, "JS-only placeholder")
 
     return None
+
+
+class StructureScanner:
+    """
+    Incremental validate_structure over a streamed body.
+    Feed chunks with update(); result() matches validate_structure.
+    """
+
+    _OVERLAP = max(len(m) for m in JS_ONLY_MARKERS) - 1
+
+    def __init__(self):
+        self.size = 0
+        self.found_marker = False
+        self._tail = b""
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+
+        if self.found_marker:
+            return
+
+        # keep a short tail so markers split across chunks still match
+        window = self._tail + chunk.lower()
+
+        for marker in JS_ONLY_MARKERS:
+            if marker in window:
+                self.found_marker = True
+                return
+
+        self._tail = window[-self._OVERLAP:]
+
+    def result(self) -> FailureEvent | None:
+        if self.size < MIN_BODY_BYTES:
+            return FailureEvent(FailureClass.SEMANTIC, None, "Body too small")
+
+        if self.found_marker:
+            return FailureEvent(FailureClass.SEMANTIC, None, "JS-only placeholder")
+
+        return None
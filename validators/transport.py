@@ -1,16 +1,44 @@
 # validators/transport.py
 
+import math
+import time
+from email.utils import parsedate_to_datetime
+
 from orchestrator.failure_event import FailureEvent
 from orchestrator.execution_context import FailureClass
 
+def retry_after_seconds(headers: dict) -> int | None:
+    """
+    Retry-After (delay-seconds or HTTP-date) as whole seconds from now.
+    """
+    value = next(
+        (v for k, v in headers.items() if k.lower() == "retry-after"), None
+    )
+    if value is None:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+    return max(0, math.ceil(when - time.time()))
+
+
 def validate_transport(resp: dict) -> FailureEvent | None:
     status = resp["status"]
 
     if status >= 500:
-        return FailureEvent(FailureClass.SERVER_ERROR, status, "Server error")
+        return FailureEvent(
+            FailureClass.SERVER_ERROR, status, "Server error",
+            retry_after_seconds(resp["headers"]),
+        )
 
     if status == 429:
-        retry_after = resp["headers"].get("Retry-After")
+        retry_after = retry_after_seconds(resp["headers"])
         return FailureEvent(FailureClass.RATE_LIMIT, status, "Rate limited", retry_after)
 
     if status in (401, 403, 404):